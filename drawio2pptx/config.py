@@ -42,6 +42,15 @@ class ConversionConfig:
     # If enabled, conversion results are stored as PNG files.
     image_cache_enabled: bool = True
     image_cache_dir: str = str(Path.home() / ".cache" / "drawio2pptx" / "images")
+
+    # Downloaded icons/stencils older than this (by file mtime) are fetched again when
+    # online, since their URLs (e.g. aws-icons@latest) can change upstream.
+    # A failed refresh falls back to the stale copy. None keeps downloads forever.
+    image_download_max_age_hours: Optional[float] = 24.0
+
+    # Offline mode: never fetch URL images/stencils over the network.
+    # Only local files and previously cached downloads (of any age) are used.
+    offline: bool = False
     
     # Font replacement map
     font_replacements: Dict[str, str] = None
@@ -4,9 +4,12 @@ draw.io file loading and parsing module
 Provides loading of .drawio/.xml/.mxfile files, page selection, layer extraction,
 parsing of mxGraphModel → mxCell (vertex/edge), and style string parsing
 """
+import functools
 import re
+import sys
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from types import MappingProxyType
+from typing import IO, List, Mapping, Optional, Dict, Any, Union
 from lxml import etree as ET
 from lxml import html as lxml_html
 from pptx.dml.color import RGBColor  # type: ignore[import]
@@ -18,6 +21,18 @@ from ..model.intermediate import (
 from ..logger import ConversionLogger
 from ..fonts import DRAWIO_DEFAULT_FONT_FAMILY
 from ..config import PARALLELOGRAM_SKEW, ConversionConfig, default_config
+from ..stencil.aws_icons import get_aws_icon_image_data, resolve_aws_group_metadata
+
+# Shared parser options for .drawio files and inline diagram XML: skip the ID table and
+# entity expansion, drop whitespace-only text between elements, and lift libxml2's
+# depth/text-size limits so large embedded diagrams parse.
+_PARSER_OPTIONS: Dict[str, bool] = {
+    "collect_ids": False,
+    "remove_blank_text": True,
+    "resolve_entities": False,
+    "huge_tree": True,
+}
+_PARSER = ET.XMLParser(**_PARSER_OPTIONS)
 
 # Built-in images for special shapes (keys should be lowercase to match extract_shape_type output)
 BUILTIN_IMAGES: Dict[str, str] = {
@@ -25,6 +40,19 @@ BUILTIN_IMAGES: Dict[str, str] = {
 }
 
 
+@functools.lru_cache(maxsize=256)
+def _boundary_kind(shape_type: Optional[str]) -> str:
+    """Classify a shape type by the outline used for connector boundary points."""
+    shape_type = (shape_type or "").lower()
+    if "parallelogram" in shape_type or "data" in shape_type:
+        return "parallelogram"
+    if "rhombus" in shape_type:
+        return "rhombus"
+    if "ellipse" in shape_type or "circle" in shape_type:
+        return "ellipse"
+    return "rect"
+
+
 def normalize_image_path(image_path: str) -> str:
     """
     Normalize image path: convert relative paths to full URLs
@@ -59,11 +87,19 @@ def normalize_image_path(image_path: str) -> str:
 class ColorParser:
     """Convert draw.io color strings to RGBColor"""
     
+    _LIGHT_DARK_RE = re.compile(r'^light-dark\s*\((.*)\)$')
+    _HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+    _RGB_RE = re.compile(r'^rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)$')
+    
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def parse(color_str: Optional[str]) -> Optional[RGBColor]:
         """
         Convert draw.io color string to RGBColor
         
+        Results are memoized (RGBColor is immutable, so instances can be shared);
+        a diagram reuses a handful of color strings across styles and HTML labels.
+        
         Args:
             color_str: Color string (#RRGGBB, #RGB, rgb(r,g,b), light-dark(...), etc.)
         
@@ -75,8 +111,19 @@ class ColorParser:
         
         color_str = color_str.strip()
         
+        # Hexadecimal format (#RRGGBB or #RGB), the common case: decode without regex
+        if color_str[:1] == '#':
+            hex_val = color_str[1:]
+            if len(hex_val) not in (3, 6) or not ColorParser._HEX_DIGITS.issuperset(hex_val):
+                return None
+            value = int(hex_val, 16)
+            if len(hex_val) == 3:
+                # Expand short form (#RGB): each nibble n becomes n * 0x11
+                return RGBColor(((value >> 8) & 0xF) * 0x11, ((value >> 4) & 0xF) * 0x11, (value & 0xF) * 0x11)
+            return RGBColor((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
+        
         # Process light-dark(color1,color2) format (use light mode color)
-        light_dark_match = re.match(r'^light-dark\s*\((.*)\)$', color_str)
+        light_dark_match = ColorParser._LIGHT_DARK_RE.match(color_str)
         if light_dark_match:
             inner = light_dark_match.group(1)
             # Split by comma (ignore commas inside parentheses)
@@ -102,23 +149,8 @@ class ColorParser:
         if color_str.lower() == "none":
             return None
         
-        # Hexadecimal format (#RRGGBB or #RGB)
-        hex_match = re.match(r'^#([0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})$', color_str)
-        if hex_match:
-            hex_val = hex_match.group(1)
-            if len(hex_val) == 3:
-                # Expand short form (#RGB)
-                r = int(hex_val[0] * 2, 16)
-                g = int(hex_val[1] * 2, 16)
-                b = int(hex_val[2] * 2, 16)
-            else:
-                r = int(hex_val[0:2], 16)
-                g = int(hex_val[2:4], 16)
-                b = int(hex_val[4:6], 16)
-            return RGBColor(r, g, b)
-        
         # rgb(r, g, b) format
-        rgb_match = re.match(r'^rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)$', color_str)
+        rgb_match = ColorParser._RGB_RE.match(color_str)
         if rgb_match:
             r = int(rgb_match.group(1))
             g = int(rgb_match.group(2))
@@ -132,7 +164,7 @@ class StyleExtractor:
     """Extract style properties from mxCell elements"""
     
     # Mapping dictionary: draw.io shape type -> normalized shape type
-    _SHAPE_TYPE_MAP: dict[str, str] = {
+    _SHAPE_TYPE_MAP: Mapping[str, str] = MappingProxyType({
         # Basic shapes
         'rect': 'rectangle',
         'rectangle': 'rectangle',
@@ -168,7 +200,15 @@ class StyleExtractor:
         'mxgraph.arrows2.stylisedarrow': 'notched_right_arrow',
         # mxgraph.infographic: 3D shaded cube -> PowerPoint 3D box (cuboid)
         'mxgraph.infographic.shadedcube': 'cube',
-    }
+    })
+    # First style token (no explicit shape=...): the map above plus the generic names kept as-is
+    # (process is not a _SHAPE_TYPE_MAP key; its value there is mxgraph.flowchart.process).
+    _FIRST_TOKEN_SHAPE_TYPE_MAP: Mapping[str, str] = MappingProxyType({
+        **_SHAPE_TYPE_MAP,
+        'swimlane': 'swimlane',
+        'rhombus': 'rhombus',
+        'process': 'process',
+    })
     
     # Font style bit flags: bit position -> attribute name
     _FONT_STYLE_BITS: dict[int, str] = {
@@ -185,39 +225,58 @@ class StyleExtractor:
         """
         self.color_parser = color_parser or ColorParser()
         self.logger = logger
+        # Parsed key/value dicts keyed by raw style string (styles repeat heavily across cells)
+        self._style_cache: Dict[str, Dict[str, str]] = {}
     
+    def _parse_style_string(self, style_str: str) -> Dict[str, str]:
+        """Split a style string into a key -> value dict once; the first occurrence of a key wins."""
+        parsed = self._style_cache.get(style_str)
+        if parsed is None:
+            parsed = {}
+            for part in style_str.split(";"):
+                k, sep, v = part.partition("=")
+                if sep:
+                    # Interned keys are shared across cached dicts and match the literal lookup keys by identity.
+                    parsed.setdefault(sys.intern(k.strip()), v.strip())
+            self._style_cache[sys.intern(style_str)] = parsed
+        return parsed
+
+    def _parse_style(self, cell: ET.Element) -> Dict[str, str]:
+        """Parsed style dict of a cell, shared by every extractor called on that cell."""
+        return self._parse_style_string(cell.attrib.get("style") or "")
+
     def extract_style_value(self, style_str: str, key: str) -> Optional[str]:
         """Extract value for specified key from style string"""
         if not style_str:
             return None
-        for part in style_str.split(";"):
-            if "=" in part:
-                k, v = part.split("=", 1)
-                if k.strip() == key:
-                    return v.strip()
-        return None
+        return self._parse_style_string(style_str).get(key)
 
     def is_text_style(self, style_str: str) -> bool:
         """Return True when the cell is a draw.io text shape."""
         if not style_str:
             return False
-        parts = [p.strip().lower() for p in style_str.split(";") if p.strip()]
-        if parts and parts[0] == "text":
-            return True
-        shape_type = self.extract_style_value(style_str, "shape")
+        # Only the first non-empty token matters; stop scanning once it is found.
+        for part in style_str.split(";"):
+            part = part.strip()
+            if part:
+                if part.lower() == "text":
+                    return True
+                break
+        shape_type = self._parse_style_string(style_str).get("shape")
         return bool(shape_type and shape_type.strip().lower() == "text")
     
     def extract_style_float(self, style_str: str, key: str, default: Optional[float] = None) -> Optional[float]:
         """Extract float value from style string"""
-        value_str = self.extract_style_value(style_str, key)
-        if value_str:
-            try:
-                return float(value_str)
-            except ValueError:
-                pass
-        return default
+        if not style_str:
+            return default
+        try:
+            return float(self._parse_style_string(style_str)[key])
+        except (KeyError, ValueError):
+            return default
     
-    def _parse_font_style(self, font_style_str: Optional[str]) -> dict[str, bool]:
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _parse_font_style(font_style_str: Optional[str]) -> Mapping[str, bool]:
         """
         Parse font style bit flags
         
@@ -225,26 +284,25 @@ class StyleExtractor:
             font_style_str: Font style string (integer as string)
         
         Returns:
-            Dictionary with 'bold', 'italic', 'underline' keys
+            Read-only mapping with 'bold', 'italic', 'underline' keys (cached per input)
         """
         result = {'bold': False, 'italic': False, 'underline': False}
         if font_style_str:
             try:
                 font_style_int = int(font_style_str) if font_style_str.isdigit() else 0
-                for bit_pos, attr_name in self._FONT_STYLE_BITS.items():
+                for bit_pos, attr_name in StyleExtractor._FONT_STYLE_BITS.items():
                     if (font_style_int & (1 << bit_pos)) != 0:
                         result[attr_name] = True
             except (ValueError, TypeError):
                 pass
-        return result
+        return MappingProxyType(result)
 
     def _get_attr_or_style_value(self, cell: ET.Element, key: str) -> Optional[str]:
         """Get key from cell attribute or from style string. Returns None if missing."""
         val = cell.attrib.get(key)
         if val is not None:
             return val
-        style = cell.attrib.get("style", "")
-        return self.extract_style_value(style, key)
+        return self._parse_style(cell).get(key)
 
     def _parse_color_value(self, value: Optional[str], allow_default: bool = True) -> Optional[Any]:
         """
@@ -290,15 +348,12 @@ class StyleExtractor:
 
     def extract_gradient_direction(self, cell: ET.Element) -> Optional[str]:
         """Extract gradientDirection (e.g., north/south/east/west)"""
-        style = cell.attrib.get("style", "")
-        if not style:
-            return None
-        value = self.extract_style_value(style, "gradientDirection")
+        value = self._parse_style(cell).get("gradientDirection")
         return value.strip() if value else None
 
     def extract_swimlane_fill_color(self, cell: ET.Element) -> Optional[Any]:
         """Extract swimlaneFillColor (body area fill). Returns RGBColor, "default", or None."""
-        raw = self.extract_style_value(cell.attrib.get("style", ""), "swimlaneFillColor")
+        raw = self._parse_style(cell).get("swimlaneFillColor")
         return self._parse_color_value(raw) if raw else None
 
     def extract_stroke_color(self, cell: ET.Element) -> Optional[RGBColor]:
@@ -307,7 +362,13 @@ class StyleExtractor:
 
     def extract_no_stroke(self, cell: ET.Element) -> bool:
         """Detect strokeColor=none explicitly set on the cell."""
-        raw = self._get_attr_or_style_value(cell, "strokeColor")
+        raw = cell.attrib.get("strokeColor")
+        if raw is None:
+            style = cell.attrib.get("style") or ""
+            # Most cells never mention strokeColor; skip the style lookup for them.
+            if "strokeColor" not in style:
+                return False
+            raw = self._parse_style_string(style).get("strokeColor")
         return raw is not None and raw.strip().lower() == "none"
 
     def extract_font_color(self, cell: ET.Element) -> Optional[RGBColor]:
@@ -358,25 +419,24 @@ class StyleExtractor:
     def extract_shape_type(self, cell: ET.Element) -> str:
         """Extract and normalize shape type"""
         style = cell.attrib.get("style", "")
+        parsed = self._parse_style(cell)
 
         # Prefer explicit "shape=..." when present.
         # draw.io sometimes emits e.g. "ellipse;shape=cloud;..." where the first token is generic.
-        shape_type = self.extract_style_value(style, "shape")
+        shape_type = parsed.get("shape")
         if shape_type:
             shape_type = shape_type.lower()
-            if shape_type == "swimlane":
-                return "swimlane"
             # draw.io flowchart: "Predefined process" is often represented as shape=process with backgroundOutline=1.
             # Map it to a dedicated pseudo-type so we can use PowerPoint's predefined-process shape.
             if shape_type == "process":
                 try:
-                    bg_outline = self.extract_style_value(style, "backgroundOutline")
+                    bg_outline = parsed.get("backgroundOutline")
                     if (bg_outline or "").strip() == "1":
                         return "predefinedprocess"
                     # Some diagrams.net exports omit backgroundOutline for predefined process,
                     # but keep a non-zero "size" parameter. Treat it as predefined process
                     # to better match the expected appearance in PowerPoint.
-                    size_value = self.extract_style_value(style, "size")
+                    size_value = parsed.get("size")
                     if size_value is not None:
                         try:
                             if float(size_value) > 0:
@@ -386,27 +446,13 @@ class StyleExtractor:
                 except Exception as e:
                     if self.logger:
                         self.logger.debug(f"Failed to check backgroundOutline: {e}")
-            # Use dictionary mapping
-            normalized = self._SHAPE_TYPE_MAP.get(shape_type)
-            if normalized:
-                return normalized
-            # Keep rhombus/parallelogram/cloud/trapezoid/etc. as-is.
-            return shape_type
+            # Use dictionary mapping; keep swimlane/rhombus/parallelogram/cloud/trapezoid/etc. as-is.
+            # Interned so later shape-type table lookups compare by identity.
+            return sys.intern(self._SHAPE_TYPE_MAP.get(shape_type, shape_type))
 
         if style:
-            parts = style.split(";")
-            first_part = (parts[0].strip().lower() if parts else "")
-            if first_part == "swimlane":
-                return "swimlane"
-            # Use dictionary mapping
-            normalized = self._SHAPE_TYPE_MAP.get(first_part)
-            if normalized:
-                return normalized
-            # Keep rhombus/process as-is (process not in _SHAPE_TYPE_MAP key; value is mxgraph.flowchart.process)
-            if first_part == "rhombus":
-                return "rhombus"
-            if first_part == "process":
-                return "process"
+            first_part = style.partition(";")[0].strip().lower()
+            return self._FIRST_TOKEN_SHAPE_TYPE_MAP.get(first_part, "rectangle")
 
         return "rectangle"
 
@@ -414,6 +460,11 @@ class StyleExtractor:
 class DrawIOLoader:
     """draw.io file loading and parsing"""
     
+    # Compiled once and run by libxml2 directly. Cells are searched on the descendant axis because
+    # draw.io wraps cells that carry custom properties in <UserObject>/<object> elements.
+    _XP_MXCELLS = ET.XPath("descendant::mxCell")
+    _XP_CHILD_CELLS = ET.XPath("descendant::mxCell[@parent = $parent_id]")
+    
     def __init__(self, logger: Optional[ConversionLogger] = None, config: Optional[ConversionConfig] = None):
         """
         Args:
@@ -424,23 +475,29 @@ class DrawIOLoader:
         self.logger = logger
         self.color_parser = ColorParser()
         self.style_extractor = StyleExtractor(self.color_parser, logger)
+        # Accumulated ancestor offsets by parent id, valid for the mxGraphModel they were computed from
+        self._parent_coords: tuple[Optional[ET.Element], Dict[str, tuple[float, float]]] = (None, {})
+        # Cell index of the mxGraphModel being extracted (see _find_cell)
+        self._cells_by_id: tuple[Optional[ET.Element], Dict[str, ET.Element]] = (None, {})
     
-    def load_file(self, path: Path) -> List[ET.Element]:
+    def load_file(self, path: Union[Path, str, IO[bytes]]) -> List[ET.Element]:
         """
         Load draw.io file and return list of diagrams
         
         Args:
-            path: File path
+            path: File path, or a binary file object holding the draw.io XML
         
         Returns:
             List of mxGraphModel elements (corresponding to each diagram)
         """
-        tree = ET.parse(path)
-        root = tree.getroot()
-        
-        diagrams = []
-        # Process <diagram> elements
-        for d in root.findall(".//diagram"):
+        # Stream <diagram> elements instead of building the tree up front, so each
+        # decoded payload can be released as soon as it has been parsed.
+        context = ET.iterparse(path, events=("end",), tag="diagram", **_PARSER_OPTIONS)
+
+        # None marks a diagram whose payload could not be parsed; it is resolved
+        # against the document root once parsing has finished.
+        diagrams: List[Optional[ET.Element]] = []
+        for _, d in context:
             inner = (d.text or "").strip()
             if not inner:
                 mgm = d.find(".//mxGraphModel")
@@ -462,7 +519,9 @@ class DrawIOLoader:
             # Parse as XML fragment
             if "<mxGraphModel" in inner or "<root" in inner or "<mxCell" in inner:
                 try:
-                    parsed = ET.fromstring(inner)
+                    parsed = ET.fromstring(inner, _PARSER)
+                    # The payload now lives in its own tree; drop the source text.
+                    d.clear(keep_tail=True)
                     mgm = None
                     if parsed.tag.endswith("mxGraphModel") or parsed.tag == "mxGraphModel":
                         mgm = parsed
@@ -478,20 +537,15 @@ class DrawIOLoader:
                 except ET.ParseError:
                     pass
             
-            # Fallback
-            mgm_global = root.find(".//mxGraphModel")
-            if mgm_global is not None:
-                diagrams.append(mgm_global)
-            else:
-                diagrams.append(root)
+            diagrams.append(None)
         
-        # If <diagram> tag is not present
-        if not diagrams:
+        root = context.root
+        
+        # Fallback / if <diagram> tag is not present
+        if not diagrams or None in diagrams:
             mgm_global = root.find(".//mxGraphModel")
-            if mgm_global is not None:
-                diagrams.append(mgm_global)
-            else:
-                diagrams.append(root)
+            fallback = mgm_global if mgm_global is not None else root
+            diagrams = [fallback if mgm is None else mgm for mgm in diagrams] or [fallback]
         
         return diagrams
     
@@ -534,7 +588,7 @@ class DrawIOLoader:
         Build cell index, parent->children map, container set, and z-order from mxGraphModel.
         Returns (cells, cell_by_id, document_order, children_by_parent, container_vertex_ids, cell_order).
         """
-        cells = list(mgm_root.findall(".//mxCell"))
+        cells = self._XP_MXCELLS(mgm_root)
         cell_by_id: Dict[str, ET.Element] = {}
         document_order: Dict[str, int] = {}
         children_by_parent: Dict[str, List[str]] = {}
@@ -607,12 +661,18 @@ class DrawIOLoader:
         Preserves draw.io stacking order via z_index; shapes are extracted first for connector routing.
         """
         elements: List[BaseElement] = []
+        self._parent_coords = (mgm_root, {})
         cells, cell_by_id, _document_order, _children_by_parent, container_vertex_ids, cell_order = self._build_cell_index_and_draw_order(mgm_root)
+        self._cells_by_id = (mgm_root, cell_by_id)
 
-        # First extract shapes
+        # First extract shapes, setting edge cells aside for the second pass
         shapes_dict = {}
+        edge_cells: List[ET.Element] = []
         for cell in cells:
-            if cell.attrib.get("vertex") == "1":
+            attrib = cell.attrib
+            if attrib.get("edge") == "1":
+                edge_cells.append(cell)
+            if attrib.get("vertex") == "1":
                 shape = self._extract_shape(cell, mgm_root)
                 if shape:
                     try:
@@ -629,22 +689,21 @@ class DrawIOLoader:
                         shapes_dict[shape.id] = shape
         
         # Then extract edges
-        for cell in cells:
-            if cell.attrib.get("edge") == "1":
-                connector, labels = self._extract_connector(cell, mgm_root, shapes_dict)
-                if connector:
-                    try:
-                        if connector.id is not None:
-                            connector.z_index = cell_order.get(connector.id, 0)
-                    except Exception as e:
-                        if self.logger:
-                            self.logger.debug(f"Failed to set z_index for connector {connector.id}: {e}")
-                    elements.append(connector)
-                    if labels:
-                        for label in labels:
-                            # Keep label above the connector line.
-                            label.z_index = connector.z_index
-                            elements.append(label)
+        for cell in edge_cells:
+            connector, labels = self._extract_connector(cell, mgm_root, shapes_dict)
+            if connector:
+                try:
+                    if connector.id is not None:
+                        connector.z_index = cell_order.get(connector.id, 0)
+                except Exception as e:
+                    if self.logger:
+                        self.logger.debug(f"Failed to set z_index for connector {connector.id}: {e}")
+                elements.append(connector)
+                if labels:
+                    for label in labels:
+                        # Keep label above the connector line.
+                        label.z_index = connector.z_index
+                        elements.append(label)
         
         # If the entire diagram is off the page, normalize to the page origin.
         self._maybe_normalize_page_offset(elements, mgm_root)
@@ -730,6 +789,16 @@ class DrawIOLoader:
             if isinstance(element, (ConnectorElement, PolygonElement)) and element.points:
                 element.points = [(x + dx, y + dy) for x, y in element.points]
     
+    def _find_cell(self, cell_id: str, mgm_root: ET.Element) -> Optional[ET.Element]:
+        """Return the first mxCell with the given id, using the index built by extract_elements when it applies."""
+        index_root, cell_by_id = self._cells_by_id
+        if index_root is mgm_root:
+            return cell_by_id.get(cell_id)
+        for cell in self._XP_MXCELLS(mgm_root):
+            if cell.attrib.get("id") == cell_id:
+                return cell
+        return None
+
     def _get_parent_coordinates(self, parent_id: str, mgm_root: ET.Element) -> tuple[float, float]:
         """
         Get parent element's coordinates recursively
@@ -745,13 +814,18 @@ class DrawIOLoader:
             # Root elements (0 or 1) have no coordinates
             return (0.0, 0.0)
         
-        # Find parent cell
-        parent_cell = None
-        for cell in mgm_root.findall(".//mxCell"):
-            if cell.attrib.get("id") == parent_id:
-                parent_cell = cell
-                break
-        
+        # Siblings share their ancestor chain, so parse it once per diagram
+        cache_root, cache = self._parent_coords
+        if cache_root is not mgm_root:
+            return self._compute_parent_coordinates(parent_id, mgm_root)
+        coords = cache.get(parent_id)
+        if coords is None:
+            coords = cache[parent_id] = self._compute_parent_coordinates(parent_id, mgm_root)
+        return coords
+
+    def _compute_parent_coordinates(self, parent_id: str, mgm_root: ET.Element) -> tuple[float, float]:
+        """Resolve _get_parent_coordinates for a non-root parent without consulting the cache."""
+        parent_cell = self._find_cell(parent_id, mgm_root)
         if parent_cell is None:
             return (0.0, 0.0)
         
@@ -780,11 +854,12 @@ class DrawIOLoader:
         geo = cell.find(".//mxGeometry")
         if geo is None:
             return None
+        attrib = geo.attrib
         try:
-            x = float(geo.attrib.get("x", "0") or 0)
-            y = float(geo.attrib.get("y", "0") or 0)
-            w = float(geo.attrib.get("width", "0") or 0)
-            h = float(geo.attrib.get("height", "0") or 0)
+            x = float(attrib.get("x", "0") or 0)
+            y = float(attrib.get("y", "0") or 0)
+            w = float(attrib.get("width", "0") or 0)
+            h = float(attrib.get("height", "0") or 0)
             return (x, y, w, h)
         except ValueError:
             return None
@@ -796,11 +871,7 @@ class DrawIOLoader:
         if not parent_id or parent_id in ("0", "1"):
             return (x, y)
         try:
-            parent_cell = None
-            for pcell in mgm_root.findall(".//mxCell"):
-                if pcell.attrib.get("id") == parent_id:
-                    parent_cell = pcell
-                    break
+            parent_cell = self._find_cell(parent_id, mgm_root)
             if parent_cell is not None:
                 parent_style = parent_cell.attrib.get("style", "") or ""
                 if parent_style and "swimlane" in parent_style:
@@ -1023,7 +1094,6 @@ class DrawIOLoader:
         # Resolve group-like padding/overlay metadata (table-driven in stencil/aws_icons.py).
         if shape_type:
             try:
-                from ..stencil.aws_icons import resolve_aws_group_metadata
                 group_meta = resolve_aws_group_metadata(shape_type, style_str, text_raw)
                 style.aws_group_text_padding = bool(group_meta.get("apply_text_padding", False))
                 style.aws_group_icon_key = group_meta.get("group_icon_key")
@@ -1038,12 +1108,8 @@ class DrawIOLoader:
         # Resolve mxgraph.aws* shapes via icon mapping dictionary (MKAbuMattar/aws-icons or weibeld SVG URLs)
         if not image_data and shape_type:
             try:
-                from ..stencil.aws_icons import (
-                    get_aws_icon_image_data,
-                    is_aws_shape_type,
-                )
-                if is_aws_shape_type(shape_type):
-                    image_data = get_aws_icon_image_data(shape_type, style_str)
+                # Returns None for non-AWS shapes (prefix check is done inside).
+                image_data = get_aws_icon_image_data(shape_type, style_str)
                 if image_data and self.logger:
                     self.logger.debug(f"Using AWS icon for shape type {shape_type}")
             except Exception as e:
@@ -1126,39 +1192,30 @@ class DrawIOLoader:
         if geo is None:
             return (points_raw, source_point, target_point, points_for_ports)
         
-        # First, parse sourcePoint and targetPoint (these can exist alongside Array[@as="points"])
-        for point_elem in geo.findall("./mxPoint"):
-            role = (point_elem.attrib.get("as") or "").strip()
-            if role == "sourcePoint":
-                px = float(point_elem.attrib.get("x", "0") or 0)
-                py = float(point_elem.attrib.get("y", "0") or 0)
-                source_point = (px, py)
-                continue
-            if role == "targetPoint":
-                px = float(point_elem.attrib.get("x", "0") or 0)
-                py = float(point_elem.attrib.get("y", "0") or 0)
-                target_point = (px, py)
-                continue
-        
-        # Then parse waypoints (Array[@as="points"] or individual mxPoint elements)
-        array_elem = geo.find('./Array[@as="points"]')
-        if array_elem is not None:
-            for point_elem in array_elem.findall("./mxPoint"):
-                px = float(point_elem.attrib.get("x", "0") or 0)
-                py = float(point_elem.attrib.get("y", "0") or 0)
-                points_raw.append((px, py))
-                points_for_ports.append((px, py))
-                points_raw_offset_flags.append(False)
-        else:
-            for point_elem in geo.findall("./mxPoint"):
-                role = (point_elem.attrib.get("as") or "").strip()
-                if role in ("sourcePoint", "targetPoint", "offset"):
-                    continue
-                px = float(point_elem.attrib.get("x", "0") or 0)
-                py = float(point_elem.attrib.get("y", "0") or 0)
-                points_raw.append((px, py))
-                points_raw_offset_flags.append(False)
-                points_for_ports.append((px, py))
+        # One pass over the geometry's children: sourcePoint/targetPoint (these can exist alongside
+        # Array[@as="points"]), the first points Array, and loose waypoint mxPoints.
+        array_elem = None
+        loose_points: List[ET.Element] = []
+        for child in geo:
+            if child.tag == "mxPoint":
+                role = (child.attrib.get("as") or "").strip()
+                if role == "sourcePoint":
+                    source_point = (float(child.attrib.get("x", "0") or 0), float(child.attrib.get("y", "0") or 0))
+                elif role == "targetPoint":
+                    target_point = (float(child.attrib.get("x", "0") or 0), float(child.attrib.get("y", "0") or 0))
+                elif role != "offset":
+                    loose_points.append(child)
+            elif child.tag == "Array" and array_elem is None and child.attrib.get("as") == "points":
+                array_elem = child
+        
+        # Waypoints come from Array[@as="points"] when present, otherwise from the loose mxPoints
+        waypoint_elems = array_elem.iterchildren("mxPoint") if array_elem is not None else loose_points
+        for point_elem in waypoint_elems:
+            px = float(point_elem.attrib.get("x", "0") or 0)
+            py = float(point_elem.attrib.get("y", "0") or 0)
+            points_raw.append((px, py))
+        points_for_ports = list(points_raw)
+        points_raw_offset_flags = [False] * len(points_raw)
         parent_id = cell.attrib.get("parent")
         if parent_id and parent_id not in ("0", "1") and (points_raw or source_point or target_point):
             parent_x, parent_y = self._get_parent_coordinates(parent_id, mgm_root)
@@ -1191,7 +1248,8 @@ class DrawIOLoader:
             return "right" if rel_x >= 0.5 else "left"
         return "bottom" if rel_y >= 0.5 else "top"
 
-    def _snap_to_grid(self, val: float, grid_size: Optional[float]) -> float:
+    @staticmethod
+    def _snap_to_grid(val: float, grid_size: Optional[float]) -> float:
         """Snap a coordinate to draw.io grid."""
         if not grid_size:
             return val
@@ -1202,7 +1260,8 @@ class DrawIOLoader:
         except Exception:
             return val
 
-    def _clamp01(self, val: Optional[float]) -> Optional[float]:
+    @staticmethod
+    def _clamp01(val: Optional[float]) -> Optional[float]:
         """Clamp value to [0, 1] or return None."""
         if val is None:
             return None
@@ -1463,20 +1522,21 @@ class DrawIOLoader:
                 entry_y = entry_y_val if entry_y_val is not None else auto_entry_y
 
                 if edge_style == "orthogonal" and points_for_ports and not used_elbow_ports:
-                    declared_exit = self._infer_port_side(exit_x, exit_y)
+                    # Each side is inferred once: a declared port that disagrees with the
+                    # implied (auto) one is replaced by it, and the kept side drives the snap below.
+                    exit_side = self._infer_port_side(exit_x, exit_y)
                     implied_exit = self._infer_port_side(auto_exit_x, auto_exit_y)
-                    if implied_exit and declared_exit != implied_exit:
+                    if implied_exit and exit_side != implied_exit:
                         exit_x, exit_y = auto_exit_x, auto_exit_y
-                    declared_entry = self._infer_port_side(entry_x, entry_y)
+                        exit_side = implied_exit
+                    entry_side = self._infer_port_side(entry_x, entry_y)
                     implied_entry = self._infer_port_side(auto_entry_x, auto_entry_y)
-                    if implied_entry and declared_entry != implied_entry:
+                    if implied_entry and entry_side != implied_entry:
                         entry_x, entry_y = auto_entry_x, auto_entry_y
+                        entry_side = implied_entry
 
-                if edge_style == "orthogonal" and points_for_ports and not used_elbow_ports:
                     first_pt = points_for_ports[0]
                     last_pt = points_for_ports[-1]
-                    exit_side = self._infer_port_side(exit_x, exit_y)
-                    entry_side = self._infer_port_side(entry_x, entry_y)
                     if exit_side and source_shape.w and source_shape.h:
                         if exit_side == "bottom":
                             exit_x, exit_y = self._clamp01((first_pt[0] - source_shape.x) / source_shape.w), 1.0
@@ -1646,11 +1706,7 @@ class DrawIOLoader:
 
             # Edge labels can also be stored as child mxCell nodes (edgeLabel style).
             if connector_id and mgm_root is not None:
-                try:
-                    child_cells = mgm_root.findall(f".//mxCell[@parent='{connector_id}']")
-                except Exception:
-                    child_cells = []
-                for label_cell in child_cells:
+                for label_cell in self._XP_CHILD_CELLS(mgm_root, parent_id=connector_id):
                     if label_cell.attrib.get("vertex") != "1":
                         continue
                     style_val = label_cell.attrib.get("style", "") or ""
@@ -1701,11 +1757,7 @@ class DrawIOLoader:
 
         # Edge labels can also be stored as child mxCell nodes (edgeLabel style).
         if connector_id and mgm_root is not None:
-            try:
-                child_cells = mgm_root.findall(f".//mxCell[@parent='{connector_id}']")
-            except Exception:
-                child_cells = []
-            for label_cell in child_cells:
+            for label_cell in self._XP_CHILD_CELLS(mgm_root, parent_id=connector_id):
                 if label_cell.attrib.get("vertex") != "1":
                     continue
                 style_val = label_cell.attrib.get("style", "") or ""
@@ -1853,22 +1905,25 @@ class DrawIOLoader:
             ),
         )
 
-    def _polyline_segment_lengths(self, points: List[tuple]) -> tuple[float, List[float]]:
+    @staticmethod
+    def _polyline_segment_lengths(points: List[tuple]) -> tuple[float, List[float]]:
         """Return (total_length, list of segment lengths) for a polyline."""
         if not points or len(points) < 2:
             return (0.0, [])
         total = 0.0
         seg_lengths: List[float] = []
-        for i in range(len(points) - 1):
-            dx = points[i + 1][0] - points[i][0]
-            dy = points[i + 1][1] - points[i][1]
+        append = seg_lengths.append
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            dx = x1 - x0
+            dy = y1 - y0
             L = (dx * dx + dy * dy) ** 0.5
-            seg_lengths.append(L)
+            append(L)
             total += L
         return (total, seg_lengths)
 
+    @staticmethod
     def _point_along_polyline(
-        self, points: List[tuple], seg_lengths: List[float], total_len: float, t_rel: float
+        points: List[tuple], seg_lengths: List[float], total_len: float, t_rel: float
     ) -> tuple[float, float, float, float]:
         """Return (base_x, base_y, seg_dx, seg_dy) at position t_rel (0..1) along the polyline."""
         if not points or len(points) < 2 or total_len <= 1e-6:
@@ -1878,15 +1933,12 @@ class DrawIOLoader:
         t_rel = min(max(t_rel, 0.0), 1.0)
         target_len = total_len * t_rel
         acc = 0.0
-        for i in range(len(points) - 1):
-            seg_len = seg_lengths[i]
+        for (x0, y0), (x1, y1), seg_len in zip(points, points[1:], seg_lengths):
             if acc + seg_len >= target_len:
                 t = (target_len - acc) / max(seg_len, 1e-6)
-                base_x = points[i][0] + (points[i + 1][0] - points[i][0]) * t
-                base_y = points[i][1] + (points[i + 1][1] - points[i][1]) * t
-                seg_dx = points[i + 1][0] - points[i][0]
-                seg_dy = points[i + 1][1] - points[i][1]
-                return (base_x, base_y, seg_dx, seg_dy)
+                seg_dx = x1 - x0
+                seg_dy = y1 - y0
+                return (x0 + seg_dx * t, y0 + seg_dy * t, seg_dx, seg_dy)
             acc += seg_len
         base_x, base_y = points[-1][0], points[-1][1]
         seg_dx = points[-1][0] - points[-2][0]
@@ -2158,14 +2210,14 @@ class DrawIOLoader:
         rel_x, rel_y: 0.0 = left/top, 0.5 = center, 1.0 = right/bottom.
         Returns (x, y) absolute coordinates including exitDx/exitDy.
         """
-        shape_type = (shape.shape_type or "").lower()
+        kind = _boundary_kind(shape.shape_type)
         base_x = shape.x + shape.w * rel_x
         base_y = shape.y + shape.h * rel_y
-        if "parallelogram" in shape_type or "data" in shape_type:
+        if kind == "parallelogram":
             x, y = self._boundary_point_parallelogram(shape, rel_x, rel_y, base_x, base_y)
-        elif "rhombus" in shape_type:
+        elif kind == "rhombus":
             x, y = self._boundary_point_rhombus(shape, base_x, base_y)
-        elif "ellipse" in shape_type or "circle" in shape_type:
+        elif kind == "ellipse":
             x, y = self._boundary_point_ellipse(shape, base_x, base_y)
         else:
             x, y = self._boundary_point_rect(shape, rel_x, rel_y, base_x, base_y)
@@ -3,14 +3,19 @@ PowerPoint output module
 
 Generates PowerPoint presentations from intermediate models using python-pptx + lxml
 """
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import functools
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
 from lxml import etree as ET
+import pptx  # type: ignore[import]
 from pptx import Presentation  # type: ignore[import]
 from pptx.util import Emu, Pt  # type: ignore[import]
 from pptx.enum.shapes import MSO_SHAPE, MSO_CONNECTOR  # type: ignore[import]
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR  # type: ignore[import]
 from pptx.dml.color import RGBColor  # type: ignore[import]
 import io
+import os
 
 from ..model.intermediate import BaseElement, ShapeElement, ConnectorElement, TextElement, TextParagraph, TextRun, ImageData
 from ..media.image_utils import get_image_size, pad_image_to_square, prepare_image_for_pptx
@@ -21,6 +26,7 @@ from ..mapping.style_map import map_arrow_type, map_arrow_type_with_size, map_da
 from ..logger import ConversionLogger
 from ..fonts import replace_font, DRAWIO_DEFAULT_FONT_FAMILY
 from ..config import PARALLELOGRAM_SKEW, SWIMLANE_DEFAULT_PADDING_PX, ConversionConfig, default_config
+from ..stencil.aws_icons import is_aws_shape_type
 
 # XML namespaces
 NS_DRAWINGML = 'http://schemas.openxmlformats.org/drawingml/2006/main'
@@ -40,6 +46,57 @@ def _p(tag_name: str) -> str:
     return f'{{{NS_PRESENTATIONML}}}{tag_name}'
 
 
+# Upper bound for concurrent image preparation (URL fetch + SVG rasterization) per slide.
+IMAGE_PREFETCH_MAX_WORKERS = 16
+
+
+def _image_request_key(request: dict) -> tuple:
+    """Hashable key for a prepare_image_for_pptx() keyword set."""
+    return tuple(sorted(request.items()))
+
+
+@functools.lru_cache(maxsize=1)
+def _default_template_bytes() -> bytes:
+    """python-pptx's bundled default.pptx, read once per process."""
+    template_path = os.path.join(os.path.dirname(pptx.__file__), "templates", "default.pptx")
+    with open(template_path, "rb") as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=256)
+def _rgb_to_hex(rgb: RGBColor) -> str:
+    """RRGGBB hex for an srgbClr val; memoized since a diagram reuses a few colors."""
+    return f"{rgb[0]:02X}{rgb[1]:02X}{rgb[2]:02X}"
+
+
+@functools.lru_cache(maxsize=256)
+def _adjustment_kind(shape_type: Optional[str]) -> Optional[str]:
+    """Classify a shape type by the preset adjustments it needs (None when it needs none)."""
+    if "parallelogram" in (shape_type or "").lower():
+        return "parallelogram"
+    if (shape_type or "").strip().lower() == "step":
+        return "step"
+    return None
+
+
+def _parallelogram_adjustments(shape: ShapeElement) -> Tuple[float, ...]:
+    return (float(PARALLELOGRAM_SKEW),)
+
+
+def _step_adjustments(shape: ShapeElement) -> Tuple[float, ...]:
+    step_size = getattr(shape.style, "step_size_px", None)
+    if step_size is None or shape.w <= 0:
+        return ()
+    return (float(max(0.02, min(0.6, (step_size / float(shape.w)) * 1.5))),)
+
+
+# Adjustment kind -> shape -> values for shp.adjustments[0], [1], ...
+_ADJUSTMENT_FORMULAS: Mapping[str, Callable[[ShapeElement], Tuple[float, ...]]] = MappingProxyType({
+    "parallelogram": _parallelogram_adjustments,
+    "step": _step_adjustments,
+})
+
+
 class PPTXWriter:
     """PowerPoint presentation writer"""
     
@@ -52,6 +109,8 @@ class PPTXWriter:
         self.config = config or default_config
         self.logger = logger
         self._svg_backend_logged = False
+        # Prepared images for the slide being written, keyed by _image_request_key().
+        self._prepared_images: Dict[tuple, tuple] = {}
 
     def _set_shape_name(self, shape_obj, name: Optional[str]) -> None:
         """Set debug name on a shape/connector/textbox; log on failure."""
@@ -91,7 +150,8 @@ class PPTXWriter:
         Returns:
             Tuple of (Presentation, blank layout).
         """
-        prs = Presentation()
+        # Same template Presentation() opens, served from memory after the first call.
+        prs = Presentation(io.BytesIO(_default_template_bytes()))
         
         # Get blank layout
         blank_layout_index = 6
@@ -121,16 +181,86 @@ class PPTXWriter:
             elements: List of elements (sorted by Z-order; later elements are on top)
         """
         slide = prs.slides.add_slide(blank_layout)
-        
-        # Add elements in the provided stacking order (later = topmost in PowerPoint).
+        # Every shape below goes through this one Slide object, so python-pptx can hand out
+        # shape ids from a running counter instead of rescanning the spTree per shape.
+        slide.shapes.turbo_add_enabled = True
+
+        # Zero-size shapes/text boxes (common edge artifacts in exports) emit nothing; drop them
+        # before image prefetch and dispatch. Connectors are positioned by points, not w/h.
+        elements = [
+            element for element in elements
+            if isinstance(element, ConnectorElement) or (element.w > 0 and element.h > 0)
+        ]
+
+        # Fetch/rasterize all images of the slide up front so network round-trips and
+        # SVG rendering overlap instead of running serially per shape.
+        self._prepared_images = self._prepare_slide_images(elements)
+        try:
+            # Add elements in the provided stacking order (later = topmost in PowerPoint).
+            for element in elements:
+                if isinstance(element, ShapeElement):
+                    self._add_shape(slide, element)
+                elif isinstance(element, ConnectorElement):
+                    self._add_connector(slide, element)
+                elif isinstance(element, TextElement):
+                    self._add_text(slide, element)
+        finally:
+            self._prepared_images = {}
+
+    def _collect_image_requests(self, elements: List[BaseElement]) -> List[dict]:
+        """Collect unique prepare_image_for_pptx() keyword sets needed by the slide's shapes."""
+        requests: Dict[tuple, dict] = {}
         for element in elements:
-            if isinstance(element, ShapeElement):
-                self._add_shape(slide, element)
-            elif isinstance(element, ConnectorElement):
-                self._add_connector(slide, element)
-            elif isinstance(element, TextElement):
-                self._add_text(slide, element)
-    
+            if not isinstance(element, ShapeElement):
+                continue
+            if element.w <= 0 or element.h <= 0 or self._shape_type_is(element, "line"):
+                continue
+            try:
+                if element.image:
+                    request = self._shape_image_request(element)
+                else:
+                    request = self._aws_group_icon_request(element)
+            except Exception as e:
+                if self.logger:
+                    self.logger.debug(f"Failed to build image request: {e}")
+                continue
+            if request is not None:
+                requests.setdefault(_image_request_key(request), request)
+        return list(requests.values())
+
+    def _prepare_slide_images(self, elements: List[BaseElement]) -> Dict[tuple, tuple]:
+        """
+        Prepare all slide images concurrently.
+
+        Each worker runs the full download -> rasterize -> encode chain for one image, so
+        downloads of some icons overlap with rendering of others. Failed requests are left
+        out and retried inline by _prepare_image() so errors surface at the usual place.
+        """
+        requests = self._collect_image_requests(elements)
+        if len(requests) < 2:
+            return {}
+
+        def _run(request: dict) -> Optional[tuple]:
+            try:
+                return prepare_image_for_pptx(**request, logger=self.logger)
+            except Exception:
+                return None
+
+        max_workers = min(IMAGE_PREFETCH_MAX_WORKERS, len(requests), (os.cpu_count() or 1) * 4)
+        prepared: Dict[tuple, tuple] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for request, result in zip(requests, executor.map(_run, requests)):
+                if result is not None:
+                    prepared[_image_request_key(request)] = result
+        return prepared
+
+    def _prepare_image(self, request: dict) -> tuple:
+        """Return prepare_image_for_pptx(**request), using the slide prefetch result when available."""
+        prepared = self._prepared_images.get(_image_request_key(request))
+        if prepared is not None:
+            return prepared
+        return prepare_image_for_pptx(**request, logger=self.logger)
+
     def _compute_shape_geometry(self, shape: ShapeElement) -> Tuple[int, int, int, int]:
         """Compute (left_emu, top_emu, width_emu, height_emu) for add_shape, including step/arrow adjustments."""
         left = px_to_emu(shape.x)
@@ -273,14 +403,36 @@ class PPTXWriter:
             self._safe_try(lambda: self._add_shape_text_overlay(slide, shape), "add flipped-shape text overlay")
         return shp
 
-    def _add_aws_group_icon_overlay(self, slide, shape: ShapeElement):
-        """Add a small top-left overlay icon for aws4 group/groupCenter containers."""
+    @staticmethod
+    def _aws_group_icon_size_px(shape: ShapeElement) -> float:
+        """AWS group icons are square badges attached to container border."""
+        return max(14.0, min(24.0, min(float(shape.w), float(shape.h)) * 0.18))
+
+    def _aws_group_icon_request(self, shape: ShapeElement) -> Optional[dict]:
+        """Build prepare_image_for_pptx() kwargs for an aws4 group overlay icon (None if absent)."""
         icon_ref = getattr(shape.style, "aws_group_icon_ref", None)
         if not icon_ref:
             return None
+        icon_size_px = self._aws_group_icon_size_px(shape)
+        data_uri = icon_ref if icon_ref.startswith("data:") else None
+        file_path = None if data_uri else icon_ref
+        return dict(
+            data_uri=data_uri,
+            file_path=file_path,
+            shape_type=shape.shape_type,
+            target_width_px=int(icon_size_px),
+            target_height_px=int(icon_size_px),
+            base_dpi=self.config.dpi if hasattr(self.config, "dpi") else 192.0,
+            aws_icon_color_hex=None,
+        )
+
+    def _add_aws_group_icon_overlay(self, slide, shape: ShapeElement):
+        """Add a small top-left overlay icon for aws4 group/groupCenter containers."""
+        request = self._aws_group_icon_request(shape)
+        if request is None:
+            return None
 
-        # AWS group icons are square badges attached to container border.
-        icon_size_px = max(14.0, min(24.0, min(float(shape.w), float(shape.h)) * 0.18))
+        icon_size_px = self._aws_group_icon_size_px(shape)
         icon_key = (getattr(shape.style, "aws_group_icon_key", None) or "").lower()
         if icon_key.endswith("group_auto_scaling_group"):
             # Special case: auto scaling icon sits on top edge, horizontally centered.
@@ -295,18 +447,7 @@ class PPTXWriter:
         width = px_to_emu(icon_size_px)
         height = px_to_emu(icon_size_px)
 
-        data_uri = icon_ref if icon_ref.startswith("data:") else None
-        file_path = None if data_uri else icon_ref
-
-        image_bytes, img_width_px, img_height_px, _ = prepare_image_for_pptx(
-            data_uri=data_uri,
-            file_path=file_path,
-            shape_type=shape.shape_type,
-            target_width_px=int(icon_size_px),
-            target_height_px=int(icon_size_px),
-            base_dpi=self.config.dpi if hasattr(self.config, "dpi") else 192.0,
-            aws_icon_color_hex=None,
-        )
+        image_bytes, img_width_px, img_height_px, _ = self._prepare_image(request)
         if not image_bytes:
             return None
 
@@ -315,7 +456,7 @@ class PPTXWriter:
         stroke = getattr(shape.style, "stroke", None)
         padding_color_mode = (getattr(shape.style, "aws_group_icon_padding_color_mode", None) or "stroke").lower()
         if isinstance(stroke, RGBColor) and padding_color_mode != "icon":
-            padding_color_hex = f"{stroke[0]:02X}{stroke[1]:02X}{stroke[2]:02X}"
+            padding_color_hex = _rgb_to_hex(stroke)
         padding_ratio = getattr(shape.style, "aws_group_icon_padding_ratio", None)
         try:
             padding_ratio = float(padding_ratio) if padding_ratio is not None else 0.18
@@ -446,8 +587,10 @@ class PPTXWriter:
             self._set_default_fill_xml(shp)
         elif fill_color:
             try:
-                shp.fill.solid()
-                shp.fill.fore_color.rgb = fill_color
+                # Same <a:solidFill><a:srgbClr/></a:solidFill> that fill.solid() + fore_color.rgb
+                # produce, without building the FillFormat/ColorFormat proxies per shape.
+                solid_fill = shp._element.spPr.get_or_change_to_solidFill()
+                ET.SubElement(solid_fill, _a("srgbClr")).set("val", _rgb_to_hex(fill_color))
             except Exception as e:
                 if self.logger:
                     self.logger.debug(f"Failed to set fill color: {e}")
@@ -628,21 +771,15 @@ class PPTXWriter:
 
     def _apply_shape_adjustments(self, shp, shape: ShapeElement) -> None:
         """Apply parallelogram skew, step chevron size, and rotation/flip to a shape."""
-        try:
-            if self._shape_type_contains(shape, "parallelogram") and hasattr(shp, "adjustments") and len(shp.adjustments) > 0:
-                shp.adjustments[0] = float(PARALLELOGRAM_SKEW)
-        except Exception as e:
-            if self.logger:
-                self.logger.debug(f"Failed to set parallelogram adjustments: {e}")
-        try:
-            if self._shape_type_is(shape, "step") and hasattr(shp, "adjustments") and len(shp.adjustments) > 0:
-                step_size = getattr(shape.style, "step_size_px", None)
-                if step_size is not None and shape.w > 0:
-                    adj = max(0.02, min(0.6, (step_size / float(shape.w)) * 1.5))
-                    shp.adjustments[0] = float(adj)
-        except Exception as e:
-            if self.logger:
-                self.logger.debug(f"Failed to set step chevron adjustment: {e}")
+        kind = _adjustment_kind(shape.shape_type)
+        if kind is not None:
+            try:
+                if hasattr(shp, "adjustments") and len(shp.adjustments) > 0:
+                    for index, value in enumerate(_ADJUSTMENT_FORMULAS[kind](shape)):
+                        shp.adjustments[index] = value
+            except Exception as e:
+                if self.logger:
+                    self.logger.debug(f"Failed to set {kind} adjustments: {e}")
         try:
             self._apply_shape_transform(shp, shape)
         except Exception as e:
@@ -1723,7 +1860,7 @@ class PPTXWriter:
                     
                     # Add srgbClr element
                     srgb = ET.SubElement(solid_fill, _a('srgbClr'))
-                    val = f"{font_color[0]:02X}{font_color[1]:02X}{font_color[2]:02X}"
+                    val = _rgb_to_hex(font_color)
                     srgb.set('val', val)
             except Exception as e:
                 if self.logger:
@@ -1758,7 +1895,7 @@ class PPTXWriter:
             # otherwise after fill elements when present, otherwise append.
             hi = ET.Element(_a("highlight"))
             srgb = ET.SubElement(hi, _a("srgbClr"))
-            val = f"{highlight_color[0]:02X}{highlight_color[1]:02X}{highlight_color[2]:02X}"
+            val = _rgb_to_hex(highlight_color)
             srgb.set("val", val)
 
             children = list(r_pr)
@@ -1823,9 +1960,6 @@ class PPTXWriter:
         Set swimlane fill: header = fillColor, body = swimlaneFillColor.
         Uses a multi-stop gradient so only the header area is colored; body stays white/transparent.
         """
-        def _rgb_to_hex(rgb: RGBColor) -> str:
-            return f"{rgb[0]:02X}{rgb[1]:02X}{rgb[2]:02X}"
-
         try:
             if not hasattr(shp, "_element"):
                 return
@@ -1917,9 +2051,6 @@ class PPTXWriter:
             - This is best-effort; PowerPoint themes may render slightly differently than draw.io.
         """
 
-        def _rgb_to_hex(rgb: RGBColor) -> str:
-            return f"{rgb[0]:02X}{rgb[1]:02X}{rgb[2]:02X}"
-
         def _darken(rgb: RGBColor, amount: float = 0.25) -> RGBColor:
             # amount in [0, 1]; 0.25 means 25% closer to black
             r = max(0, int(round(rgb[0] * (1.0 - amount))))
@@ -2048,7 +2179,7 @@ class PPTXWriter:
                 solid_fill.remove(color_elem)
             
             srgb = ET.SubElement(solid_fill, _a('srgbClr'))
-            val = f"{stroke_color[0]:02X}{stroke_color[1]:02X}{stroke_color[2]:02X}"
+            val = _rgb_to_hex(stroke_color)
             srgb.set('val', val)
         except Exception as e:
             if self.logger:
@@ -2268,6 +2399,32 @@ class PPTXWriter:
             if self.logger:
                 self.logger.debug(f"Failed to set cube 3D rotation XML: {e}")
 
+    def _shape_image_request(self, shape: ShapeElement) -> dict:
+        """Build prepare_image_for_pptx() kwargs for a shape's image."""
+        image_data = shape.image
+        _, _, width, height = self._compute_shape_geometry(shape)
+        target_width_px = int(width / 9525) if width else None
+        target_height_px = int(height / 9525) if height else None
+        aws_icon_color_hex = None
+        try:
+            if is_aws_shape_type(shape.shape_type):
+                fill = getattr(shape.style, "fill", None)
+                if isinstance(fill, RGBColor):
+                    aws_icon_color_hex = _rgb_to_hex(fill)
+        except Exception:
+            aws_icon_color_hex = None
+
+        return dict(
+            data_uri=image_data.data_uri,
+            file_path=image_data.file_path,
+            shape_type=shape.shape_type,
+            target_width_px=target_width_px,
+            target_height_px=target_height_px,
+            base_dpi=self.config.dpi if hasattr(self.config, "dpi") else 192.0,
+            aws_icon_color_hex=aws_icon_color_hex,
+            cover_scale=getattr(image_data, "cover_scale", None),
+        )
+
     def _add_shape_image(self, slide, shape: ShapeElement):
         """
         Add image as a separate picture shape (not as shape fill)
@@ -2288,28 +2445,8 @@ class PPTXWriter:
             )
 
         left, top, width, height = self._compute_shape_geometry(shape)
-        target_width_px = int(width / 9525) if width else None
-        target_height_px = int(height / 9525) if height else None
-        aws_icon_color_hex = None
-        try:
-            from ..stencil.aws_icons import is_aws_shape_type
-
-            if is_aws_shape_type(shape.shape_type):
-                fill = getattr(shape.style, "fill", None)
-                if isinstance(fill, RGBColor):
-                    aws_icon_color_hex = f"{fill[0]:02X}{fill[1]:02X}{fill[2]:02X}"
-        except Exception:
-            aws_icon_color_hex = None
-
-        image_bytes, img_width_px, img_height_px, is_svg = prepare_image_for_pptx(
-            data_uri=image_data.data_uri,
-            file_path=image_data.file_path,
-            shape_type=shape.shape_type,
-            target_width_px=target_width_px,
-            target_height_px=target_height_px,
-            base_dpi=self.config.dpi if hasattr(self.config, "dpi") else 192.0,
-            aws_icon_color_hex=aws_icon_color_hex,
-            cover_scale=getattr(image_data, "cover_scale", None),
+        image_bytes, img_width_px, img_height_px, is_svg = self._prepare_image(
+            self._shape_image_request(shape)
         )
 
         if not image_bytes:
@@ -101,6 +101,18 @@ class ConversionLogger:
         self.warnings.append(warning)
         self.logger.warning(f"[{element_id}] {message}")
     
+    def warn_offline_image_missing(self, url: str):
+        """Record warning for a URL image that offline mode could not serve from the cache"""
+        message = f"Offline mode: image not in download cache, skipped: {url}"
+        warning = ConversionWarning(
+            element_id=None,
+            warning_type='offline_cache_miss',
+            message=message,
+            details={'url': url}
+        )
+        self.warnings.append(warning)
+        self.logger.warning(message)
+    
     def info(self, message: str):
         """Info log"""
         self.logger.info(message)
@@ -29,6 +29,7 @@ Examples:
   drawio2pptx input.drawio output.pptx
   drawio2pptx input.drawio output.pptx --analyze
   drawio2pptx input.drawio output.pptx --no-cache
+  drawio2pptx input.drawio output.pptx --offline
   drawio2pptx input.drawio output.pptx --clear-cache
   drawio2pptx --clear-cache
   drawio2pptx input.drawio output.pptx -a
@@ -43,7 +44,8 @@ Examples:
         '--cache',
         dest='image_cache',
         action='store_true',
-        help='Enable local image cache for URL image fetch and SVG->PNG results (default: enabled)',
+        help='Enable local image cache for URL image fetch and SVG->PNG results (default: enabled). '
+             'Downloaded icons/stencils are re-fetched once older than 24 hours',
     )
     parser.add_argument(
         '--no-cache',
@@ -58,6 +60,12 @@ Examples:
         default=None,
         help='Directory for local image cache (default: ~/.cache/drawio2pptx/images)',
     )
+    parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Do not download URL images/stencils; use only local files and the image cache '
+             '(cached downloads of any age are used; images missing from the cache are skipped with a warning)',
+    )
     parser.add_argument(
         '--clear-cache',
         dest='clear_image_cache',
@@ -93,8 +101,10 @@ Examples:
         config.image_cache_enabled = bool(args.image_cache)
         if args.image_cache_dir:
             config.image_cache_dir = args.image_cache_dir
+        config.offline = bool(args.offline)
         default_config.image_cache_enabled = config.image_cache_enabled
         default_config.image_cache_dir = config.image_cache_dir
+        default_config.offline = config.offline
         if args.clear_image_cache:
             clear_image_cache(config.image_cache_dir)
             print(f"Cleared image cache: {config.image_cache_dir}")
@@ -3,14 +3,44 @@ Text mapping module
 
 HTML fragments → paragraph splitting, inline formatting → run splitting, bullet list processing
 """
+import dataclasses
+import functools
 import re
-from typing import List, Optional
+import sys
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple
 from lxml import html as lxml_html
 from ..model.intermediate import TextParagraph, TextRun
 from pptx.dml.color import RGBColor
 from ..io.drawio_loader import ColorParser
 from ..logger import get_logger
 
+# Inline CSS declarations ("name: value") read from a run's style attribute
+_CSS_DECL_RE = re.compile(r'([A-Za-z-]+):\s*([^;]+)')
+_CSS_PROPERTIES = ("font-family", "font-size", "color", "font-weight", "font-style", "text-decoration")
+
+# HTML default relative sizes (roughly): h1=2em, h2=1.5em, h3≈1.17em, h4=1em, h5≈0.83em, h6≈0.67em.
+# draw.io uses HTML fragments in labels; matching these ratios makes the PPTX output closer to the editor view.
+_HEADING_SCALE: Mapping[str, float] = MappingProxyType({
+    "h1": 2.00,
+    "h2": 1.50,
+    "h3": 1.17,
+    "h4": 1.00,
+    "h5": 0.83,
+    "h6": 0.67,
+})
+
+# Direct children of the label root that start a new paragraph
+_BLOCK_TAGS = frozenset({"p", "div", "br", "h1", "h2", "h3", "h4", "h5", "h6", "li"})
+
+# <font size="N"> relative size -> pt (1=8pt, 2=10pt, 3=12pt, 4=14pt, 5=18pt, 6=24pt, 7=36pt), indexed by N
+_FONT_TAG_SIZES = (None, 8, 10, 12, 14, 18, 24, 36)
+
+# CSS font-size values with an explicit unit
+_SIZE_PT_RE = re.compile(r'^(\d+(?:\.\d+)?)\s*pt$', re.IGNORECASE)
+_SIZE_PX_RE = re.compile(r'^(\d+(?:\.\d+)?)\s*px$', re.IGNORECASE)
+_SIZE_EM_RE = re.compile(r'^(\d+(?:\.\d+)?)\s*em$', re.IGNORECASE)
+
 
 def html_to_paragraphs(html_text: str, default_font_color: RGBColor = None,
                        default_font_family: Optional[str] = None,
@@ -29,11 +59,52 @@ def html_to_paragraphs(html_text: str, default_font_color: RGBColor = None,
     """
     if not html_text:
         return []
-    
+
+    # Tag- and entity-free labels ("Hello", "Label 1") parse to one plain run on
+    # the root <div>; build it directly. Control/whitespace-only text still goes
+    # through lxml, which normalizes or rejects it.
+    if ("<" not in html_text and "&" not in html_text
+            and html_text.isprintable() and not html_text.isspace()):
+        if not default_font_family:
+            from ..fonts import DRAWIO_DEFAULT_FONT_FAMILY
+            default_font_family = DRAWIO_DEFAULT_FONT_FAMILY
+        run = TextRun(text=html_text, font_family=sys.intern(default_font_family),
+                      font_size=default_font_size, font_color=default_font_color)
+        return [TextParagraph(runs=[run])]
+
+    color_key = tuple(default_font_color) if default_font_color is not None else None
+    cached = _html_to_paragraphs_cached(html_text, color_key, default_font_family, default_font_size)
+    # Callers fill in defaults on the returned runs, so hand out fresh copies.
+    return [
+        dataclasses.replace(para, runs=[dataclasses.replace(run) for run in para.runs])
+        for para in cached
+    ]
+
+
+def clear_cache() -> None:
+    """Drop memoized html_to_paragraphs, CSS and font-size results (mainly for tests)."""
+    _html_to_paragraphs_cached.cache_clear()
+    _parse_css_declarations.cache_clear()
+    _parse_font_size.cache_clear()
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _html_to_paragraphs_cached(html_text: str,
+                               default_font_color: Optional[Tuple[int, int, int]],
+                               default_font_family: Optional[str],
+                               default_font_size: Optional[float]) -> Tuple[TextParagraph, ...]:
+    """Memoized html_to_paragraphs; the color is keyed as an (r, g, b) tuple."""
+    color = RGBColor(*default_font_color) if default_font_color is not None else None
+    return tuple(_parse_html_paragraphs(html_text, color, default_font_family, default_font_size))
+
+
+def _parse_html_paragraphs(html_text: str, default_font_color: Optional[RGBColor],
+                           default_font_family: Optional[str],
+                           default_font_size: Optional[float]) -> List[TextParagraph]:
+    """Parse a non-empty HTML fragment into paragraphs (uncached)"""
     try:
-        # Parse HTML
-        wrapped = f"<div>{html_text}</div>"
-        parsed = lxml_html.fromstring(wrapped)
+        # Parse the fragment under a synthetic <div> root
+        parsed = lxml_html.fragment_fromstring(html_text, create_parent="div")
         
         paragraphs = []
 
@@ -41,24 +112,11 @@ def html_to_paragraphs(html_text: str, default_font_color: RGBColor = None,
         # e.g. "<h1>Heading</h1><p>Paragraph</p>".
         #
         # Previous behavior extracted only <p> tags (all descendants), which dropped headings entirely.
-        # HTML default relative sizes (roughly): h1=2em, h2=1.5em, h3≈1.17em, h4=1em, h5≈0.83em, h6≈0.67em.
-        # draw.io uses HTML fragments in labels; matching these ratios makes the PPTX output closer to the editor view.
-        heading_scale = {
-            "h1": 2.00,
-            "h2": 1.50,
-            "h3": 1.17,
-            "h4": 1.00,
-            "h5": 0.83,
-            "h6": 0.67,
-        }
-
-        block_tags = {"p", "div", "br", "h1", "h2", "h3", "h4", "h5", "h6", "li"}
-
         def _scaled_heading_size(tag: str) -> Optional[float]:
             if default_font_size is None:
                 return None
             try:
-                scale = heading_scale.get(tag, 1.0)
+                scale = _HEADING_SCALE.get(tag, 1.0)
                 return float(default_font_size) * float(scale)
             except Exception:
                 return default_font_size
@@ -81,7 +139,7 @@ def html_to_paragraphs(html_text: str, default_font_color: RGBColor = None,
         # Collect paragraphs from direct children in order when possible.
         for child in parsed:
             tag = (getattr(child, "tag", "") or "").lower()
-            if tag not in block_tags:
+            if tag not in _BLOCK_TAGS:
                 continue
             if tag == "br":
                 # If there is text before (parsed.text) or after (child.tail) this br, let the
@@ -96,7 +154,7 @@ def html_to_paragraphs(html_text: str, default_font_color: RGBColor = None,
                 continue
 
             # Headings: make them bold and (best-effort) larger.
-            if tag in heading_scale:
+            if tag in _HEADING_SCALE:
                 runs = _extract_runs_from_element(
                     child,
                     default_font_color,
@@ -108,7 +166,7 @@ def html_to_paragraphs(html_text: str, default_font_color: RGBColor = None,
                 runs = _extract_runs_from_element(child, default_font_color,
                                                   default_font_family, default_font_size)
             if any((r.text or "").strip() for r in runs):
-                if tag in heading_scale:
+                if tag in _HEADING_SCALE:
                     paragraphs.append(
                         TextParagraph(
                             runs=runs,
@@ -331,9 +389,7 @@ def _create_run_from_element(elem, text: str, default_font_color: RGBColor = Non
         if size_attr:
             try:
                 size_int = int(size_attr)
-                # Convert relative size to pt (1=8pt, 2=10pt, 3=12pt, 4=14pt, 5=18pt, 6=24pt, 7=36pt)
-                size_map = {1: 8, 2: 10, 3: 12, 4: 14, 5: 18, 6: 24, 7: 36}
-                font_size = size_map.get(size_int, 12)
+                font_size = _FONT_TAG_SIZES[size_int] if 1 <= size_int <= 7 else 12
             except ValueError:
                 # Invalid size attribute, keep default
                 pass
@@ -345,44 +401,46 @@ def _create_run_from_element(elem, text: str, default_font_color: RGBColor = Non
     # Extract font information from style attribute
     style_attr = elem.get('style', '')
     if style_attr:
+        css = _parse_css_declarations(style_attr)
+
         # font-family
-        font_family_match = re.search(r'font-family:\s*([^;]+)', style_attr)
-        if font_family_match:
-            extracted_font = font_family_match.group(1).strip().strip('"\'')
+        css_font_family = css.get('font-family')
+        if css_font_family is not None:
+            extracted_font = css_font_family.strip().strip('"\'')
             font_family = extracted_font if extracted_font else None
         
         # font-size
-        font_size_match = re.search(r'font-size:\s*([^;]+)', style_attr)
-        if font_size_match:
-            size_str = font_size_match.group(1).strip()
+        css_font_size = css.get('font-size')
+        if css_font_size is not None:
+            size_str = css_font_size.strip()
             # Base size for relative units (em): prefer current inherited size.
             base = parent_font_size if parent_font_size is not None else default_font_size
             font_size = _parse_font_size(size_str, base_size=base)
         
         # color
-        color_match = re.search(r'color:\s*([^;]+)', style_attr)
-        if color_match:
-            color_value = color_match.group(1).strip()
+        css_color = css.get('color')
+        if css_color is not None:
+            color_value = css_color.strip()
             parsed_color = ColorParser.parse(color_value)
             if parsed_color:
                 font_color = parsed_color
         
         # font-weight (bold)
-        font_weight_match = re.search(r'font-weight:\s*([^;]+)', style_attr)
-        if font_weight_match:
-            weight = font_weight_match.group(1).strip().lower()
+        css_font_weight = css.get('font-weight')
+        if css_font_weight is not None:
+            weight = css_font_weight.strip().lower()
             bold = weight in ['bold', 'bolder', '700', '800', '900']
         
         # font-style (italic)
-        font_style_match = re.search(r'font-style:\s*([^;]+)', style_attr)
-        if font_style_match:
-            style = font_style_match.group(1).strip().lower()
+        css_font_style = css.get('font-style')
+        if css_font_style is not None:
+            style = css_font_style.strip().lower()
             italic = style == 'italic' or style == 'oblique'
         
         # text-decoration (underline)
-        text_decoration_match = re.search(r'text-decoration:\s*([^;]+)', style_attr)
-        if text_decoration_match:
-            decoration = text_decoration_match.group(1).strip().lower()
+        css_text_decoration = css.get('text-decoration')
+        if css_text_decoration is not None:
+            decoration = css_text_decoration.strip().lower()
             underline = 'underline' in decoration
     
     # <b>, <strong> tags
@@ -408,7 +466,8 @@ def _create_run_from_element(elem, text: str, default_font_color: RGBColor = Non
     
     return TextRun(
         text=text,
-        font_family=font_family,
+        # Interned: the same handful of families repeats across every run
+        font_family=sys.intern(font_family),
         font_size=font_size,
         font_color=font_color,
         bold=bold,
@@ -417,6 +476,24 @@ def _create_run_from_element(elem, text: str, default_font_color: RGBColor = Non
     )
 
 
+@functools.lru_cache(maxsize=512)
+def _parse_css_declarations(style_attr: str) -> Mapping[str, str]:
+    """
+    Map the CSS properties in _CSS_PROPERTIES to their raw values in one scan of a style attribute.
+
+    The first declaration whose name ends with a property wins, the same as a plain
+    "color:" substring search (so background-color also counts as color).
+    Cached and returned read-only since span styles repeat across a diagram.
+    """
+    declarations = {}
+    for name, value in _CSS_DECL_RE.findall(style_attr):
+        for prop in _CSS_PROPERTIES:
+            if name.endswith(prop) and prop not in declarations:
+                declarations[prop] = value
+    return MappingProxyType(declarations)
+
+
+@functools.lru_cache(maxsize=512)
 def _parse_font_size(size_str: str, base_size: Optional[float] = None) -> Optional[float]:
     """
     Convert CSS font-size into the converter's internal font-size unit.
@@ -433,19 +510,19 @@ def _parse_font_size(size_str: str, base_size: Optional[float] = None) -> Option
     size_str = size_str.strip()
     
     # pt unit -> convert to draw.io units (assume 96 DPI: 1px = 0.75pt)
-    pt_match = re.match(r'^(\d+(?:\.\d+)?)\s*pt$', size_str, re.IGNORECASE)
+    pt_match = _SIZE_PT_RE.match(size_str)
     if pt_match:
         pt_value = float(pt_match.group(1))
         # pt -> px-equivalent
         return pt_value / 0.75
     
     # px unit
-    px_match = re.match(r'^(\d+(?:\.\d+)?)\s*px$', size_str, re.IGNORECASE)
+    px_match = _SIZE_PX_RE.match(size_str)
     if px_match:
         return float(px_match.group(1))
     
     # em unit (relative to current font size)
-    em_match = re.match(r'^(\d+(?:\.\d+)?)\s*em$', size_str, re.IGNORECASE)
+    em_match = _SIZE_EM_RE.match(size_str)
     if em_match:
         em_value = float(em_match.group(1))
         effective_base = base_size if base_size is not None else 12.0
@@ -7,14 +7,22 @@ CairoSVG is LGPL; used as library only (no modification).
 from typing import Optional, Tuple
 import re
 import io
+import logging
 import os
 import hashlib
 import shutil
+import tempfile
+import threading
+import time
 import urllib.request
 from pathlib import Path
 from ..config import default_config
 
 _IMAGE_CACHE_STATS = {"hits": 0, "misses": 0, "writes": 0}
+# URLs already reported as offline cache misses (warn once per conversion)
+_OFFLINE_MISSES_WARNED = set()
+# Guards the two above; PPTXWriter prepares images on worker threads
+_IMAGE_CACHE_LOCK = threading.Lock()
 
 
 def _svg_to_png_cairosvg(svg_data: str, dpi: float, output_width: Optional[int] = None, output_height: Optional[int] = None) -> Optional[bytes]:
@@ -392,17 +400,22 @@ def _build_cache_key(*parts: object) -> str:
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
 
+def _count_cache_event(name: str) -> None:
+    with _IMAGE_CACHE_LOCK:
+        _IMAGE_CACHE_STATS[name] += 1
+
+
 def _read_cached_png(cache_key: str) -> Optional[bytes]:
     if not _image_cache_enabled():
         return None
     path = _cache_file_path(cache_key)
     try:
         if path.exists() and path.is_file():
-            _IMAGE_CACHE_STATS["hits"] += 1
+            _count_cache_event("hits")
             return path.read_bytes()
     except Exception:
         return None
-    _IMAGE_CACHE_STATS["misses"] += 1
+    _count_cache_event("misses")
     return None
 
 
@@ -415,7 +428,7 @@ def _write_cached_png(cache_key: str, png_bytes: bytes) -> None:
         tmp_path = path.with_suffix(".tmp")
         tmp_path.write_bytes(png_bytes)
         os.replace(tmp_path, path)
-        _IMAGE_CACHE_STATS["writes"] += 1
+        _count_cache_event("writes")
     except Exception:
         # Cache write failures must not affect conversion behavior.
         return
@@ -434,18 +447,116 @@ def clear_image_cache(cache_dir: Optional[str] = None) -> None:
 
 
 def reset_image_cache_stats() -> None:
-    _IMAGE_CACHE_STATS["hits"] = 0
-    _IMAGE_CACHE_STATS["misses"] = 0
-    _IMAGE_CACHE_STATS["writes"] = 0
+    with _IMAGE_CACHE_LOCK:
+        _IMAGE_CACHE_STATS["hits"] = 0
+        _IMAGE_CACHE_STATS["misses"] = 0
+        _IMAGE_CACHE_STATS["writes"] = 0
+        _OFFLINE_MISSES_WARNED.clear()
 
 
 def get_image_cache_stats() -> dict:
-    return dict(_IMAGE_CACHE_STATS)
+    with _IMAGE_CACHE_LOCK:
+        return dict(_IMAGE_CACHE_STATS)
+
+
+def _download_cache_path(url: str) -> Path:
+    return _image_cache_dir() / "downloads" / f"{_build_cache_key('url-bytes', url)}.bin"
+
+
+def _read_cached_download(url: str) -> Tuple[Optional[bytes], bool]:
+    """Return (cached bytes or None, whether the copy is still fresh)."""
+    if not _image_cache_enabled():
+        return None, False
+    path = _download_cache_path(url)
+    try:
+        if not path.is_file():
+            return None, False
+        data = path.read_bytes()
+        max_age_hours = getattr(default_config, "image_download_max_age_hours", None)
+        if max_age_hours is None:
+            return data, True
+        age_seconds = time.time() - path.stat().st_mtime
+        return data, age_seconds <= float(max_age_hours) * 3600.0
+    except Exception:
+        return None, False
+
+
+def _write_cached_download(url: str, data: bytes) -> None:
+    if not _image_cache_enabled():
+        return
+    path = _download_cache_path(url)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp file per writer: prefetch threads may download the same URL at once.
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp:
+            tmp.write(data)
+        try:
+            os.replace(tmp.name, path)
+        except Exception:
+            os.unlink(tmp.name)
+            raise
+    except Exception:
+        # Cache write failures must not affect conversion behavior.
+        return
 
 
-def load_image_bytes(data_uri: Optional[str] = None, file_path: Optional[str] = None) -> Optional[bytes]:
+def _warn_offline_miss(url: str, logger=None) -> None:
+    """
+    Warn once per URL (per conversion) that offline mode dropped an image.
+
+    The warning is recorded on the conversion's ConversionLogger when one is given;
+    otherwise it only goes to the 'drawio2pptx' log.
+    """
+    with _IMAGE_CACHE_LOCK:
+        if url in _OFFLINE_MISSES_WARNED:
+            return
+        _OFFLINE_MISSES_WARNED.add(url)
+    if logger is not None:
+        logger.warn_offline_image_missing(url)
+    else:
+        logging.getLogger("drawio2pptx").warning(
+            f"Offline mode: image not in download cache, skipped: {url}"
+        )
+
+
+def _fetch_url_bytes(url: str, logger=None) -> Optional[bytes]:
+    """
+    Fetch URL bytes through the local download cache.
+
+    Downloaded icons/stencils are stored under <image_cache_dir>/downloads and reused
+    until they are older than config.image_download_max_age_hours; then they are
+    fetched again, falling back to the stale copy if the refresh fails.
+    In offline mode any cached copy is used, and a miss is reported as a conversion
+    warning (the image is skipped) instead of touching the network.
+    """
+    cached, fresh = _read_cached_download(url)
+    if cached is not None and fresh:
+        return cached
+    if getattr(default_config, "offline", False):
+        if cached is None:
+            _warn_offline_miss(url, logger)
+        return cached
+    req = urllib.request.Request(
+        url,
+        headers={"User-Agent": "drawio2pptx/1.0"},
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=10) as response:
+            data = response.read()
+    except Exception:
+        if cached is not None:
+            return cached
+        raise
+    if data:
+        _write_cached_download(url, data)
+    return data
+
+
+def load_image_bytes(data_uri: Optional[str] = None, file_path: Optional[str] = None, logger=None) -> Optional[bytes]:
     """
     Load image bytes from data URI, HTTP(S) URL, or local file path.
+
+    logger: ConversionLogger that receives offline cache-miss warnings (optional).
     """
     if data_uri:
         return extract_data_uri_image(data_uri)
@@ -455,12 +566,7 @@ def load_image_bytes(data_uri: Optional[str] = None, file_path: Optional[str] =
 
     try:
         if file_path.startswith(("http://", "https://")):
-            req = urllib.request.Request(
-                file_path,
-                headers={"User-Agent": "drawio2pptx/1.0"},
-            )
-            with urllib.request.urlopen(req, timeout=10) as response:
-                return response.read()
+            return _fetch_url_bytes(file_path, logger)
 
         with open(file_path, "rb") as f:
             return f.read()
@@ -766,6 +872,7 @@ def prepare_image_for_pptx(
     base_dpi: float = 192.0,
     aws_icon_color_hex: Optional[str] = None,
     cover_scale: Optional[float] = None,
+    logger=None,
 ) -> Tuple[Optional[bytes], Optional[int], Optional[int], bool]:
     """
     End-to-end image preparation for PPTX placement.
@@ -775,6 +882,8 @@ def prepare_image_for_pptx(
       2) Convert SVG -> PNG with high-resolution settings.
       3) Trim transparent outer padding for AWS icons.
       4) Return final bytes and pixel dimensions.
+
+    logger: ConversionLogger that receives offline cache-miss warnings (optional).
     """
     from ..stencil.aws_icons import is_aws_shape_type
 
@@ -803,7 +912,7 @@ def prepare_image_for_pptx(
                 w_cached, h_cached = get_image_size(cached_png)
                 return cached_png, w_cached, h_cached, True
 
-    image_bytes = load_image_bytes(data_uri=data_uri, file_path=file_path)
+    image_bytes = load_image_bytes(data_uri=data_uri, file_path=file_path, logger=logger)
     if not image_bytes:
         return None, None, None, False
 
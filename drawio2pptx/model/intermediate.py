@@ -3,12 +3,16 @@ Intermediate model definitions
 
 Defines normalized intermediate representation extracted from draw.io's mxGraph
 """
+import sys
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, Union, List, Tuple
 from pptx.dml.color import RGBColor
 
+# Models are created per cell/run/paragraph; slots drop the per-instance __dict__ (Python 3.10+).
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class TextRun:
     """Text run (inline formatting unit)"""
     text: str
@@ -22,7 +26,7 @@ class TextRun:
     link: Optional[str] = None  # Hyperlink URL
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TextParagraph:
     """Text paragraph"""
     runs: List[TextRun] = field(default_factory=list)
@@ -40,7 +44,7 @@ class TextParagraph:
     space_after_pt: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Transform:
     """Transformation information (rotation, scale, flip)"""
     rotation: float = 0.0  # degrees
@@ -52,7 +56,7 @@ class Transform:
     translate_y: float = 0.0  # px
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Style:
     """Style information"""
     fill: Optional[Union[RGBColor, str]] = None  # RGBColor, "default", or None
@@ -108,7 +112,7 @@ class Style:
     aws_group_text_padding: bool = False
 
 
-@dataclass
+@dataclass  # no slots: stencil/aws_icons.py shares instances through a WeakValueDictionary
 class ImageData:
     """Image data"""
     data_uri: Optional[str] = None  # data URI
@@ -119,7 +123,7 @@ class ImageData:
     cover_scale: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BaseElement:
     """Base element"""
     id: Optional[str] = None
@@ -134,7 +138,7 @@ class BaseElement:
     style: Style = field(default_factory=Style)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ShapeElement(BaseElement):
     """Shape element"""
     element_type: str = 'shape'  # 'shape', 'rectangle', 'ellipse', 'polygon', etc.
@@ -144,7 +148,7 @@ class ShapeElement(BaseElement):
     parent_id: Optional[str] = None  # Parent shape ID (for container children)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ConnectorElement(BaseElement):
     """Connector element"""
     element_type: str = 'connector'
@@ -154,35 +158,35 @@ class ConnectorElement(BaseElement):
     edge_style: str = 'straight'  # 'straight', 'orthogonal', 'curved'
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TextElement(BaseElement):
     """Text element (standalone text)"""
     element_type: str = 'text'
     text: List[TextParagraph] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ImageElement(BaseElement):
     """Image element"""
     element_type: str = 'image'
     image: ImageData = field(default_factory=ImageData)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class GroupElement(BaseElement):
     """Group element"""
     element_type: str = 'group'
     children: List[BaseElement] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PolygonElement(BaseElement):
     """Polygon element"""
     element_type: str = 'polygon'
     points: List[Tuple[float, float]] = field(default_factory=list)  # Vertex coordinates
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PathElement(BaseElement):
     """Path element (Bezier curves, etc.)"""
     element_type: str = 'path'
@@ -8,17 +8,37 @@ image data) by mapping to external icon sources:
 - weibeld/aws-icons-svg (raw GitHub) — fallback for specific icons.
 """
 import re
+import sys
 import base64
-from typing import Optional, Dict, List, Set, cast
+import functools
+import weakref
+from types import MappingProxyType
+from typing import Callable, Optional, Dict, FrozenSet, Iterator, List, Mapping, NamedTuple, Tuple, Union
+from lxml import etree as ET
 
-_AWS_SHAPE_PREFIX_RE = re.compile(r"^mxgraph\.aws\d*(?:\.|$)")
+# image_utils is referenced as a module so load_image_bytes stays patchable.
+from ..media import image_utils
+from ..model.intermediate import ImageData
+
+# draw.io AWS stencil namespaces, as "mxgraph.awsN." prefixes and bare names.
+_AWS_SHAPE_PREFIXES = ("mxgraph.aws.", "mxgraph.aws2.", "mxgraph.aws3.", "mxgraph.aws4.")
+_AWS_SHAPE_BARE_NAMES = frozenset(p[:-1] for p in _AWS_SHAPE_PREFIXES)
+_AWS_SHAPE_PREFIX_MAX_LEN = max(len(p) for p in _AWS_SHAPE_PREFIXES)
 
 
 def is_aws_shape_type(shape_type: Optional[str]) -> bool:
     """Return True for draw.io AWS stencil prefixes: aws, aws2, aws3, aws4."""
     if not shape_type:
         return False
-    return bool(_AWS_SHAPE_PREFIX_RE.match(shape_type.lower()))
+    if shape_type.startswith(_AWS_SHAPE_PREFIXES):
+        return True
+    # Built-in shapes ("rectangle", "ellipse", ...) fail on the first character.
+    if shape_type[0] not in "mM":
+        return False
+    # Only the leading characters decide; avoid lowercasing the whole string.
+    # Bare names are shorter than the head, so `in` only matches exact bare names.
+    head = shape_type[:_AWS_SHAPE_PREFIX_MAX_LEN].lower()
+    return head.startswith(_AWS_SHAPE_PREFIXES) or head in _AWS_SHAPE_BARE_NAMES
 
 # Fallback: MKAbuMattar/aws-icons via jsDelivr (official AWS icons, npm package)
 # https://github.com/MKAbuMattar/aws-icons — architecture-service/ and resource/
@@ -38,20 +58,110 @@ _AWS4_STENCIL_XML_URL = (
     "https://raw.githubusercontent.com/jgraph/drawio/dev/src/main/webapp/stencils/aws4.xml"
 )
 
-def _url_spec(
-    value: str,
-    *,
-    cover_scale: Optional[float] = None,
-) -> tuple:
+def _normalize_cover_scale(cover_scale: Optional[float]) -> Optional[float]:
+    """Return cover_scale as float when it zooms in (> 1.0), else None."""
     if cover_scale is None:
-        return ("url", value)
+        return None
     try:
         scale = float(cover_scale)
     except Exception:
-        return ("url", value)
-    if scale <= 1.0:
-        return ("url", value)
-    return ("url", value, {"cover_scale": scale})
+        return None
+    return scale if scale > 1.0 else None
+
+
+class _UrlSpec:
+    """
+    Icon loaded from a URL or data URI.
+
+    Table URLs are stored as (base, filename) so the long CDN prefixes are shared
+    module constants; the full ref is only built (and then kept) once an icon is
+    actually resolved.
+    """
+    __slots__ = ("base", "filename", "cover_scale", "_ref")
+
+    def __init__(self, base: str, filename: Optional[str] = None, cover_scale: Optional[float] = None):
+        self.base = base
+        self.filename = filename
+        self.cover_scale = cover_scale
+        self._ref: Optional[str] = None
+
+    @property
+    def ref(self) -> str:
+        """Full URL (or data URI when no filename is set)."""
+        ref = self._ref
+        if ref is None:
+            ref = self.base if self.filename is None else f"{self.base}/{self.filename}"
+            self._ref = ref
+        return ref
+
+    def resolve(self, style: Mapping[str, str], is_resource_icon_shape: bool) -> Optional[ImageData]:
+        """Shared ImageData for the icon; URL icons ignore the cell style."""
+        return _image_data_from_ref(self.ref, cover_scale=self.cover_scale)
+
+
+class _Aws4Spec:
+    """Icon drawn from an aws4.xml stencil shape on a square background canvas."""
+    __slots__ = ("shape_name", "background_hex", "foreground_hex", "canvas_w", "canvas_h", "cover_scale")
+
+    def __init__(
+        self,
+        shape_name: str,
+        background_hex: str,
+        foreground_hex: str,
+        canvas_w: float,
+        canvas_h: float,
+        cover_scale: Optional[float] = None,
+    ):
+        self.shape_name = shape_name
+        self.background_hex = background_hex
+        self.foreground_hex = foreground_hex
+        self.canvas_w = canvas_w
+        self.canvas_h = canvas_h
+        self.cover_scale = cover_scale
+
+    def resolve(self, style: Mapping[str, str], is_resource_icon_shape: bool) -> Optional[ImageData]:
+        """Render the stencil, following the cell's draw.io colors where applicable."""
+        effective_bg_hex = self.background_hex
+        effective_bg_gradient_hex = None
+        effective_gradient_direction = None
+        effective_fg_hex = self.foreground_hex
+        if is_resource_icon_shape:
+            style_fill = style.get("fillColor")
+            if style_fill and style_fill.lower() != "none":
+                effective_bg_hex = style_fill
+            style_gradient = style.get("gradientColor")
+            if style_gradient and style_gradient.lower() != "none":
+                effective_bg_gradient_hex = style_gradient
+                effective_gradient_direction = style.get("gradientDirection") or None
+        # AWS / Illustration should follow draw.io fillColor for foreground tone.
+        if self.shape_name.startswith("illustration "):
+            style_fill = style.get("fillColor")
+            if style_fill and style_fill.lower() != "none":
+                effective_fg_hex = style_fill
+        data_uri = _build_shape_data_uri_from_aws4(
+            shape_name=self.shape_name,
+            background_hex=effective_bg_hex,
+            background_gradient_hex=effective_bg_gradient_hex,
+            gradient_direction=effective_gradient_direction,
+            foreground_hex=effective_fg_hex,
+            canvas_w=self.canvas_w,
+            canvas_h=self.canvas_h,
+        )
+        if not data_uri:
+            return None
+        return _image_data_from_ref(data_uri, cover_scale=self.cover_scale)
+
+
+@functools.lru_cache(maxsize=None)
+def _url_spec(
+    base: str,
+    filename: Optional[str] = None,
+    *,
+    cover_scale: Optional[float] = None,
+) -> _UrlSpec:
+    """Spec for an icon at <base>/<filename> (or at `base` itself when filename is None)."""
+    # Aliased table entries (e.g. sns / amazon_sns) share one spec object.
+    return _UrlSpec(base, filename, _normalize_cover_scale(cover_scale))
 
 
 def _aws4_spec(
@@ -62,57 +172,71 @@ def _aws4_spec(
     canvas_h: float,
     *,
     cover_scale: Optional[float] = None,
-) -> tuple:
-    spec = ("aws4xml", shape_name, background_hex, foreground_hex, canvas_w, canvas_h)
-    if cover_scale is None:
-        return spec
-    try:
-        scale = float(cover_scale)
-    except Exception:
-        return spec
-    if scale <= 1.0:
-        return spec
-    return (*spec, {"cover_scale": scale})
+) -> _Aws4Spec:
+    return _Aws4Spec(
+        shape_name,
+        background_hex,
+        foreground_hex,
+        canvas_w,
+        canvas_h,
+        _normalize_cover_scale(cover_scale),
+    )
+
+
+class _GroupIconEntry(NamedTuple):
+    """aws4 group overlay icon entry (see _group_icon_spec)."""
+    spec: _UrlSpec
+    padding_ratio: float
+    padding_color_mode: str
+    cover_scale: Optional[float] = None
+    match_label: Optional[str] = None
+    match_fill: Optional[str] = None
 
 
 def _group_icon_spec(
-    ref: str,
+    base: str,
+    filename: Optional[str] = None,
     *,
     padding_ratio: float = 0.18,
     padding_color_mode: str = "stroke",
     cover_scale: Optional[float] = None,
     match_label: Optional[str] = None,
     match_fill: Optional[str] = None,
-) -> Dict[str, object]:
+) -> _GroupIconEntry:
     """Spec for an aws4 group overlay icon entry.
 
     match_label / match_fill are optional conditions for variant lists.
     Entries without either condition act as the unconditional default.
+    Values are normalized here so resolve_aws_group_metadata() reads them as-is.
     """
-    entry: Dict[str, object] = {
-        "spec": _url_spec(ref),
-        "padding_ratio": float(padding_ratio),
-        "padding_color_mode": padding_color_mode,
-    }
-    if cover_scale is not None:
-        entry["cover_scale"] = float(cover_scale)
-    if match_label is not None:
-        entry["match_label"] = match_label
-    if match_fill is not None:
-        entry["match_fill"] = match_fill
-    return entry
+    padding_color_mode = padding_color_mode.lower()
+    if padding_color_mode not in ("stroke", "icon"):
+        raise ValueError(f"Unknown group icon padding_color_mode: {padding_color_mode!r}")
+    return _GroupIconEntry(
+        spec=_url_spec(base, filename),
+        padding_ratio=float(padding_ratio),
+        padding_color_mode=padding_color_mode,
+        cover_scale=float(cover_scale) if cover_scale is not None else None,
+        # Matchers compare against lowercased label / fillColor.
+        match_label=match_label.lower() if match_label else None,
+        match_fill=match_fill.lower() if match_fill else None,
+    )
+
+def _compose_key(shape_type: str, res_icon: Optional[str] = None) -> str:
+    """Build a spec table key from a draw.io shape and optional resIcon."""
+    return shape_type if res_icon is None else f"{shape_type}|{res_icon}"
 
 # Legacy alias mapping for known aws4 icon specs.
 # New primary lookup path uses draw.io internal keys:
 #   (shape=mxgraph.aws4.*) or
 #   (shape=mxgraph.aws4.resourceIcon, resIcon=mxgraph.aws4.*)
 # Value format:
-# - ("url", "<url-or-data-uri>"[, {"cover_scale": n}])
-# - ("aws4xml", "<shape_name>", "<bg_hex>", "<fg_hex>", canvas_w, canvas_h[, {"cover_scale": n}])
+# - _UrlSpec("<base-url>", "<filename>"[, cover_scale]) or _UrlSpec("<url-or-data-uri>")
+# - _Aws4Spec("<shape_name>", "<bg_hex>", "<fg_hex>", canvas_w, canvas_h[, cover_scale])
 # Draw.io-native AWS icon mapping.
-# Key format: (shape_type, res_icon)
-#   - direct shape: ("mxgraph.aws4.<shape>", None)
-#   - resourceIcon: ("mxgraph.aws4.resourceicon", "mxgraph.aws4.<resIcon>")
+# Key format: _compose_key(shape_type, res_icon)
+#   - direct shape: "mxgraph.aws4.<shape>"
+#   - resourceIcon: "mxgraph.aws4.resourceicon|mxgraph.aws4.<resIcon>"
 # Value format: _url_spec(...) or _aws4_spec(...)
 #
 # Grouping guide (draw.io palette names)
@@ -122,437 +246,520 @@ def _group_icon_spec(
 # - AWS / Analytics
 # - AWS / Artificial Intelligence
 #
-_AWS4_ICON_SPEC_BY_DRAWIO_KEY: Dict[tuple[str, Optional[str]], tuple] = {
-    # -------------------------------------------------------------------------
-    # AWS / Core services / legacy aliases (cross-category bootstrap mappings)
-    # -------------------------------------------------------------------------
-    ("mxgraph.aws4.lambda", None): _url_spec(f"{_ARCH}/AWSLambda.svg"),
-    ("mxgraph.aws4.lambda_function", None): _url_spec(f"{_RES}/AWSLambdaLambdaFunction.svg"),
-    ("mxgraph.aws4.cloudwatch", None): _url_spec(f"{_ARCH}/AmazonCloudWatch.svg"),
-    ("mxgraph.aws4.amazon_cloudwatch", None): _url_spec(f"{_ARCH}/AmazonCloudWatch.svg"),
-    ("mxgraph.aws4.sns", None): _url_spec(f"{_ARCH}/AmazonSimpleNotificationService.svg"),
-    ("mxgraph.aws4.amazon_sns", None): _url_spec(f"{_ARCH}/AmazonSimpleNotificationService.svg"),
-    ("mxgraph.aws4.dynamodb", None): _url_spec(f"{_ARCH}/AmazonDynamoDB.svg"),
-    ("mxgraph.aws4.amazon_dynamodb", None): _url_spec(f"{_ARCH}/AmazonDynamoDB.svg"),
-    ("mxgraph.aws4.queue", None): _url_spec(f"{_AWS_ICON_SVG_BASE}/Res_Application-Integration/Res_48_Light/Res_Amazon-Simple-Queue-Service_Queue_48_Light.svg"),
-    ("mxgraph.aws4.event_time_based", None): _url_spec(f"{_AWS_ICON_SVG_BASE}/Res_Management-Governance/Res_48_Light/Res_Amazon-CloudWatch_Event-Time-Based_48_Light.svg"),
-    ("mxgraph.aws4.event_event_based", None): _url_spec(f"{_AWS_ICON_SVG_BASE}/Res_Management-Governance/Res_48_Light/Res_Amazon-CloudWatch_Event-Event-Based_48_Light.svg"),
-    ("mxgraph.aws4.bucket_with_objects", None): _url_spec(f"{_AWS_ICON_SVG_BASE}/Res_Storage/Res_48_Light/Res_Amazon-Simple-Storage-Service_Bucket-With-Objects_48_Light.svg"),
-    ("mxgraph.aws4.topic", None): _url_spec(f"{_RES}/AmazonSimpleNotificationServiceTopic.svg"),
-    ("mxgraph.aws4.template", None): _url_spec(f"{_RES}/AWSCloudFormationTemplate.svg"),
-    ("mxgraph.aws4.role", None): _url_spec(f"{_RES}/AWSIdentityAccessManagementRole.svg"),
-    ("mxgraph.aws4.config", None): _url_spec(f"{_ARCH}/AWSConfig.svg"),
-    ("mxgraph.aws4.aws_config", None): _url_spec(f"{_ARCH}/AWSConfig.svg"),
-    ("mxgraph.aws4.guardduty", None): _url_spec(f"{_ARCH}/AmazonGuardDuty.svg"),
-    ("mxgraph.aws4.amazon_guardduty", None): _url_spec(f"{_ARCH}/AmazonGuardDuty.svg"),
-    ("mxgraph.aws4.cloudtrail", None): _url_spec(f"{_ARCH}/AWSCloudTrail.svg"),
-    ("mxgraph.aws4.aws_cloudtrail", None): _url_spec(f"{_ARCH}/AWSCloudTrail.svg"),
-    ("mxgraph.aws4.email", None): _url_spec(f"{_AWS_ICON_SVG_BASE}/Res_Business-Applications/Res_48_Light/Res_Amazon-Simple-Email-Service_Email_48_Light.svg"),
-    ("mxgraph.aws4.email_notification", None): _url_spec(f"{_AWS_ICON_SVG_BASE}/Res_Application-Integration/Res_48_Light/Res_Amazon-Simple-Notification-Service_Email-Notification_48_Light.svg"),
-    ("mxgraph.aws4.rule_2", None): _url_spec(f"{_RES}/AmazonCloudWatchRule.svg"),
-    ("mxgraph.aws4.rule", None): _url_spec(f"{_RES}/AmazonCloudWatchRule.svg"),
-    # -------------------------------------------------------------------------
-    # AWS / General Resources
-    # -------------------------------------------------------------------------
-    ("mxgraph.aws4.resourceicon", 'mxgraph.aws4.marketplace'): _url_spec(f"{_ARCH}/AWSMarketplace.svg"),
-    ("mxgraph.aws4.marketplace", None): _url_spec(f"{_ARCH}/AWSMarketplaceDark.svg"),
-    ("mxgraph.aws4.resourceicon", 'mxgraph.aws4.all_products'): _aws4_spec("all products", "#232F3E", "#FFFFFF", 68.0, 68.0),
-    ("mxgraph.aws4.all_products", None): _aws4_spec("all products", "#FFFFFF", "#232F3D", 68.0, 68.0),
-    ("mxgraph.aws4.resourceicon", 'mxgraph.aws4.general'): _aws4_spec("general", "#232F3E", "#FFFFFF", 64.0, 64.0),
-    ("mxgraph.aws4.general", None): _aws4_spec("general", "#FFFFFF", "#232F3D", 64.0, 64.0),
-    ("mxgraph.aws4.alert", None): _url_spec(f"{_RES}/Alert.svg"),
-    ("mxgraph.aws4.authenticated_user", None): _url_spec(f"{_RES}/AuthenticatedUser.svg"),
-    ("mxgraph.aws4.management_console2", None): _url_spec(f"{_RES}/AWSManagementConsole.svg"),
-    ("mxgraph.aws4.camera2", None): _url_spec(f"{_RES}/Camera.svg"),
-    ("mxgraph.aws4.chat", None): _url_spec(f"{_RES}/Chat.svg"),
-    ("mxgraph.aws4.client", None): _url_spec(f"{_RES}/Client.svg"),
-    ("mxgraph.aws4.cold_storage", None): _url_spec(f"{_RES}/ColdStorage.svg"),
-    ("mxgraph.aws4.credentials", None): _url_spec(f"{_RES}/Credentials.svg"),
-    ("mxgraph.aws4.corporate_data_center", None): _url_spec(f"{_RES}/Officebuilding.svg"),
-    ("mxgraph.aws4.data_stream", None): _url_spec(f"{_RES}/DataStream.svg"),
-    ("mxgraph.aws4.data_table", None): _url_spec(f"{_RES}/DataTable.svg"),
-    ("mxgraph.aws4.disk", None): _url_spec(f"{_RES}/Disk.svg"),
-    ("mxgraph.aws4.document", None): _url_spec(f"{_RES}/Document.svg"),
-    ("mxgraph.aws4.resourceicon", 'mxgraph.aws4.documents'): _aws4_spec("documents", "#232F3E", "#FFFFFF", 64.0, 64.0),
-    ("mxgraph.aws4.documents", None): _aws4_spec("documents", "#FFFFFF", "#232F3D", 64.0, 64.0),
-    ("mxgraph.aws4.resourceicon", 'mxgraph.aws4.documents2'): _aws4_spec("documents2", "#232F3E", "#FFFFFF", 64.0, 64.0),
-    ("mxgraph.aws4.documents2", None): _aws4_spec("documents2", "#FFFFFF", "#232F3D", 64.0, 64.0),
-    ("mxgraph.aws4.resourceicon", 'mxgraph.aws4.documents3'): _url_spec(f"{_RES}/Documents.svg"),
-    ("mxgraph.aws4.documents3", None): _url_spec(f"{_RES}/Documents.svg"),
-    ("mxgraph.aws4.email_2", None): _url_spec(f"{_RES}/Email.svg"),
-    ("mxgraph.aws4.forums", None): _url_spec(f"{_RES}/Forums.svg"),
-    ("mxgraph.aws4.gear", None): _url_spec(f"{_RES}/Gear.svg"),
-    ("mxgraph.aws4.generic_application", None): _url_spec(f"{_RES}/GenericApplication.svg"),
-    ("mxgraph.aws4.generic_database", None): _url_spec(f"{_RES}/Database.svg"),
-    ("mxgraph.aws4.generic_firewall", None): _url_spec(f"{_RES}/Firewall.svg"),
-    ("mxgraph.aws4.git_repository", None): _url_spec(f"{_RES}/GitRepository.svg"),
-    ("mxgraph.aws4.globe", None): _url_spec(f"{_RES}/Globe.svg"),
-    ("mxgraph.aws4.folder", None): _url_spec(f"{_RES}/Folder.svg"),
-    ("mxgraph.aws4.folders", None): _url_spec(f"{_RES}/Folders.svg"),
-    ("mxgraph.aws4.internet", None): _url_spec(f"{_RES}/Internet.svg"),
-    ("mxgraph.aws4.internet_alt1", None): _url_spec(f"{_RES}/Internetalt1.svg"),
-    ("mxgraph.aws4.resourceicon", 'mxgraph.aws4.internet_alt2'): _aws4_spec("internet alt2", "#232F3E", "#FFFFFF", 64.0, 64.0),
-    ("mxgraph.aws4.internet_alt2", None): _aws4_spec("internet alt2", "#FFFFFF", "#232F3D", 64.0, 64.0),
-    ("mxgraph.aws4.internet_alt22", None): _url_spec(f"{_RES}/Internetalt2.svg"),
-    ("mxgraph.aws4.json_script", None): _url_spec(f"{_RES}/JSONScript.svg"),
-    ("mxgraph.aws4.logs", None): _url_spec(f"{_RES}/Logs.svg"),
-    ("mxgraph.aws4.magnifying_glass_2", None): _url_spec(f"{_RES}/MagnifyingGlass.svg"),
-    ("mxgraph.aws4.metrics", None): _url_spec(f"{_RES}/Metrics.svg"),
-    ("mxgraph.aws4.mobile_client", None): _url_spec(f"{_RES}/Mobileclient.svg"),
-    ("mxgraph.aws4.multimedia", None): _url_spec(f"{_RES}/Multimedia.svg"),
-    ("mxgraph.aws4.office_building", None): _url_spec(f"{_RES}/Officebuilding.svg"),
-    ("mxgraph.aws4.programming_language", None): _url_spec(f"{_RES}/ProgrammingLanguage.svg"),
-    ("mxgraph.aws4.question", None): _url_spec(f"{_RES}/Question.svg"),
-    ("mxgraph.aws4.recover", None): _url_spec(f"{_RES}/Recover.svg"),
-    ("mxgraph.aws4.saml_token", None): _url_spec(f"{_RES}/SAMLtoken.svg"),
-    ("mxgraph.aws4.ssl_padlock", None): _url_spec(f"{_RES}/SSLpadlock.svg"),
-    ("mxgraph.aws4.tape_storage", None): _url_spec(f"{_RES}/Tapestorage.svg"),
-    ("mxgraph.aws4.traditional_server", None): _url_spec(f"{_RES}/Server.svg"),
-    ("mxgraph.aws4.user", None): _url_spec(f"{_RES}/User.svg"),
-    ("mxgraph.aws4.users", None): _url_spec(f"{_RES}/Users.svg"),
-    ("mxgraph.aws4.servers", None): _url_spec(f"{_RES}/Servers.svg"),
-    ("mxgraph.aws4.external_toolkit", None): _url_spec(f"{_RES}/Toolkit.svg"),
-    ("mxgraph.aws4.external_sdk", None): _url_spec(f"{_RES}/SDK.svg"),
-    ("mxgraph.aws4.shield2", None): _url_spec(f"{_RES}/Shield.svg"),
-    ("mxgraph.aws4.source_code", None): _url_spec(f"{_RES}/SourceCode.svg"),
-    # -------------------------------------------------------------------------
-    # AWS / Illustration
-    # -------------------------------------------------------------------------
-    ("mxgraph.aws4.illustration_users", None): _aws4_spec("illustration users", "none", "#879196", 100.0, 100.0),
-    ("mxgraph.aws4.illustration_notification", None): _aws4_spec("illustration notification", "none", "#879196", 100.0, 100.0),
-    ("mxgraph.aws4.illustration_devices", None): _aws4_spec("illustration devices", "none", "#879196", 100.0, 100.0),
-    ("mxgraph.aws4.illustration_office_building", None): _aws4_spec("illustration office building", "none", "#879196", 100.0, 100.0),
-    ("mxgraph.aws4.illustration_desktop", None): _aws4_spec("illustration desktop", "none", "#879196", 100.0, 100.0),
-    # -------------------------------------------------------------------------
-    # AWS / AR & VR
-    # -------------------------------------------------------------------------
-    ("mxgraph.aws4.resourceicon", 'mxgraph.aws4.ar_vr'): _aws4_spec("ar vr", "#BC1356", "#FFFFFF", 70.0, 70.0),
-    ("mxgraph.aws4.ar_vr", None): _aws4_spec("ar vr", "#FFFFFF", "#BC1356", 70.0, 70.0),
-    ("mxgraph.aws4.resourceicon", 'mxgraph.aws4.sumerian'): _aws4_spec("sumerian", "#BC1356", "#FFFFFF", 64.0, 64.0),
-    ("mxgraph.aws4.sumerian", None): _aws4_spec("sumerian", "#FFFFFF", "#BC1356", 64.0, 64.0),
-    # -------------------------------------------------------------------------
-    # AWS / Application Integration
-    # -------------------------------------------------------------------------
-    ("mxgraph.aws4.api_gateway", None): _url_spec(f"{_ARCH}/AmazonAPIGateway.svg"),
-    ("mxgraph.aws4.application_integration", None): _url_spec(f"{_CATEGORY}/ApplicationIntegration.svg", cover_scale=1.3),
-    ("mxgraph.aws4.amazon_api_gateway", None): _url_spec(f"{_ARCH}/AmazonAPIGateway.svg"),
-    ("mxgraph.aws4.mq", None): _url_spec(f"{_ARCH}/AmazonMQ.svg"),
-    ("mxgraph.aws4.amazon_mq", None): _url_spec(f"{_ARCH}/AmazonMQ.svg"),
-    ("mxgraph.aws4.sqs", None): _url_spec(f"{_ARCH}/AmazonSimpleQueueService.svg"),
-    ("mxgraph.aws4.amazon_sqs", None): _url_spec(f"{_ARCH}/AmazonSimpleQueueService.svg"),
-    ("mxgraph.aws4.appsync", None): _url_spec(f"{_ARCH}/AWSAppSync.svg"),
-    ("mxgraph.aws4.amazon_appsync", None): _url_spec(f"{_ARCH}/AWSAppSync.svg"),
-    ("mxgraph.aws4.b2b_data_interchange", None): _url_spec(f"{_ARCH}/AWSB2BDataInterchange.svg"),
-    ("mxgraph.aws4.amazon_b2b_data_interchange", None): _url_spec(f"{_ARCH}/AWSB2BDataInterchange.svg"),
-    ("mxgraph.aws4.eventbridge", None): _url_spec(f"{_ARCH}/AmazonEventBridge.svg"),
-    ("mxgraph.aws4.amazon_eventbridge", None): _url_spec(f"{_ARCH}/AmazonEventBridge.svg"),
-    ("mxgraph.aws4.managed_workflows_for_apache_airflow", None): _url_spec(f"{_ARCH}/AmazonManagedWorkflowsforApacheAirflow.svg"),
-    ("mxgraph.aws4.amazon_managed_workflows_for_apache_airflow", None): _url_spec(f"{_ARCH}/AmazonManagedWorkflowsforApacheAirflow.svg"),
-    ("mxgraph.aws4.step_functions", None): _url_spec(f"{_ARCH}/AWSStepFunctions.svg"),
-    ("mxgraph.aws4.amazon_step_functions", None): _url_spec(f"{_ARCH}/AWSStepFunctions.svg"),
-    ("mxgraph.aws4.mobile_application", None): _url_spec(f"{_ARCH}/AWSConsoleMobileApplication.svg"),
-    ("mxgraph.aws4.amazon_mobile_application", None): _url_spec(f"{_ARCH}/AWSConsoleMobileApplication.svg"),
-    ("mxgraph.aws4.express_workflow", None): _url_spec(f"{_ARCH}/AWSExpressWorkflows.svg"),
-    ("mxgraph.aws4.amazon_express_workflow", None): _url_spec(f"{_ARCH}/AWSExpressWorkflows.svg"),
-    ("mxgraph.aws4.appflow", None): _url_spec(f"{_ARCH}/AmazonAppFlow.svg"),
-    ("mxgraph.aws4.amazon_appflow", None): _url_spec(f"{_ARCH}/AmazonAppFlow.svg"),
-    ("mxgraph.aws4.endpoint", None): _url_spec(f"{_RES}/AmazonAPIGatewayEndpoint.svg"),
-    ("mxgraph.aws4.event", None): _url_spec(f"{_RES}/AmazonEventBridgeEvent.svg"),
-    ("mxgraph.aws4.eventbridge_pipes", None): _url_spec(f"{_RES}/AmazonEventBridgePipes.svg"),
-    ("mxgraph.aws4.eventbridge_custom_event_bus_resource", None): _url_spec(f"{_RES}/AmazonEventBridgeCustomEventBus.svg"),
-    ("mxgraph.aws4.eventbridge_default_event_bus_resource", None): _url_spec(f"{_RES}/AmazonEventBridgeDefaultEventBus.svg"),
-    ("mxgraph.aws4.eventbridge_saas_partner_event_bus_resource", None): _url_spec(f"{_RES}/AmazonEventBridgeSaasPartnerEvent.svg"),
-    ("mxgraph.aws4.eventbridge_scheduler", None): _url_spec(f"{_RES}/AmazonEventBridgeScheduler.svg"),
-    ("mxgraph.aws4.eventbridge_schema", None): _url_spec(f"{_RES}/AmazonEventBridgeSchema.svg"),
-    ("mxgraph.aws4.eventbridge_schema_registry", None): _url_spec(f"{_RES}/AmazonEventBridgeSchemaRegistry.svg"),
-    ("mxgraph.aws4.mq_broker", None): _url_spec(f"{_RES}/AmazonMQBroker.svg"),
-    ("mxgraph.aws4.event_resource", None): _url_spec(f"{_RES}/AmazonEventBridgeEvent.svg"),
-    ("mxgraph.aws4.http_notification", None): _url_spec(f"{_RES}/AmazonSimpleNotificationServiceHTTPNotification.svg"),
-    ("mxgraph.aws4.message", None): _url_spec(f"{_RES}/AmazonSimpleQueueServiceMessage.svg"),
-    ("mxgraph.aws4.rule_3", None): _url_spec(f"{_RES}/AmazonEventBridgeRule.svg"),
-    # -------------------------------------------------------------------------
-    # AWS / Analytics
-    # -------------------------------------------------------------------------
-    ("mxgraph.aws4.analytics", None): _url_spec(f"{_CATEGORY}/Analytics.svg", cover_scale=1.3),
-    ("mxgraph.aws4.athena", None): _url_spec(f"{_ARCH}/AmazonAthena.svg"),
-    ("mxgraph.aws4.amazon_athena", None): _url_spec(f"{_ARCH}/AmazonAthena.svg"),
-    ("mxgraph.aws4.datazone", None): _url_spec(f"{_ARCH}/AmazonDataZone.svg"),
-    ("mxgraph.aws4.amazon_datazone", None): _url_spec(f"{_ARCH}/AmazonDataZone.svg"),
-    ("mxgraph.aws4.cloudsearch2", None): _url_spec(f"{_ARCH}/AmazonCloudSearch.svg"),
-    ("mxgraph.aws4.amazon_cloudsearch", None): _url_spec(f"{_ARCH}/AmazonCloudSearch.svg"),
-    ("mxgraph.aws4.elasticsearch_service", None): _url_spec(f"{_ARCH}/AmazonOpenSearchService.svg"),
-    ("mxgraph.aws4.amazon_elasticsearch_service", None): _url_spec(f"{_ARCH}/AmazonOpenSearchService.svg"),
-    ("mxgraph.aws4.opensearch_service", None): _url_spec(f"{_ARCH}/AmazonOpenSearchService.svg"),
-    ("mxgraph.aws4.emr", None): _url_spec(f"{_ARCH}/AmazonEMR.svg"),
-    ("mxgraph.aws4.amazon_emr", None): _url_spec(f"{_ARCH}/AmazonEMR.svg"),
-    ("mxgraph.aws4.finspace", None): _url_spec(f"{_ARCH}/AmazonFinSpace.svg"),
-    ("mxgraph.aws4.amazon_finspace", None): _url_spec(f"{_ARCH}/AmazonFinSpace.svg"),
-    ("mxgraph.aws4.kinesis", None): _url_spec(f"{_ARCH}/AmazonKinesis.svg"),
-    ("mxgraph.aws4.amazon_kinesis", None): _url_spec(f"{_ARCH}/AmazonKinesis.svg"),
-    ("mxgraph.aws4.kinesis_data_analytics", None): _url_spec(f"{_ARCH}/AmazonManagedServiceforApacheFlink.svg"),
-    ("mxgraph.aws4.amazon_kinesis_data_analytics", None): _url_spec(f"{_ARCH}/AmazonManagedServiceforApacheFlink.svg"),
-    ("mxgraph.aws4.kinesis_data_firehose", None): _url_spec(f"{_ARCH}/AmazonDataFirehose.svg"),
-    ("mxgraph.aws4.amazon_kinesis_data_firehose", None): _url_spec(f"{_ARCH}/AmazonDataFirehose.svg"),
-    ("mxgraph.aws4.kinesis_data_streams", None): _url_spec(f"{_ARCH}/AmazonKinesisDataStreams.svg"),
-    ("mxgraph.aws4.amazon_kinesis_data_streams", None): _url_spec(f"{_ARCH}/AmazonKinesisDataStreams.svg"),
-    ("mxgraph.aws4.kinesis_video_streams", None): _url_spec(f"{_ARCH}/AmazonKinesisVideoStreams.svg"),
-    ("mxgraph.aws4.amazon_kinesis_video_streams", None): _url_spec(f"{_ARCH}/AmazonKinesisVideoStreams.svg"),
-    ("mxgraph.aws4.managed_service_for_apache_flink", None): _url_spec(f"{_ARCH}/AmazonManagedServiceforApacheFlink.svg"),
-    ("mxgraph.aws4.amazon_managed_service_for_apache_flink", None): _url_spec(f"{_ARCH}/AmazonManagedServiceforApacheFlink.svg"),
-    ("mxgraph.aws4.quicksight", None): _url_spec(f"{_ARCH}/AmazonQuickSight.svg"),
-    ("mxgraph.aws4.amazon_quicksight", None): _url_spec(f"{_ARCH}/AmazonQuickSight.svg"),
-    ("mxgraph.aws4.clean_rooms", None): _url_spec(f"{_ARCH}/AWSCleanRooms.svg"),
-    ("mxgraph.aws4.amazon_clean_rooms", None): _url_spec(f"{_ARCH}/AWSCleanRooms.svg"),
-    ("mxgraph.aws4.redshift", None): _url_spec(f"{_ARCH}/AmazonRedshift.svg"),
-    ("mxgraph.aws4.amazon_redshift", None): _url_spec(f"{_ARCH}/AmazonRedshift.svg"),
-    ("mxgraph.aws4.data_pipeline", None): _url_spec(f"{_ARCH}/AWSDataPipeline.svg"),
-    ("mxgraph.aws4.aws_data_pipeline", None): _url_spec(f"{_ARCH}/AWSDataPipeline.svg"),
-    ("mxgraph.aws4.entity_resolution", None): _url_spec(f"{_ARCH}/AWSEntityResolution.svg"),
-    ("mxgraph.aws4.aws_entity_resolution", None): _url_spec(f"{_ARCH}/AWSEntityResolution.svg"),
-    ("mxgraph.aws4.managed_streaming_for_kafka", None): _url_spec(f"{_ARCH}/AmazonManagedStreamingforApacheKafka.svg"),
-    ("mxgraph.aws4.amazon_managed_streaming_for_kafka", None): _url_spec(f"{_ARCH}/AmazonManagedStreamingforApacheKafka.svg"),
-    ("mxgraph.aws4.glue", None): _url_spec(f"{_ARCH}/AWSGlue.svg"),
-    ("mxgraph.aws4.aws_glue", None): _url_spec(f"{_ARCH}/AWSGlue.svg"),
-    ("mxgraph.aws4.resourceicon", 'mxgraph.aws4.glue_databrew'): _url_spec(f"{_ARCH}/AWSGlueDataBrew.svg"),
-    ("mxgraph.aws4.glue_databrew", None): _aws4_spec("glue databrew", "#FFFFFF", "#8C4FFF", 56.0, 56.0),
-    ("mxgraph.aws4.aws_glue_databrew", None): _aws4_spec("glue databrew", "#FFFFFF", "#8C4FFF", 56.0, 56.0),
-    ("mxgraph.aws4.glue_elastic_views", None): _url_spec(f"{_ARCH}/AWSGlueElasticViews.svg"),
-    ("mxgraph.aws4.aws_glue_elastic_views", None): _url_spec(f"{_ARCH}/AWSGlueElasticViews.svg"),
-    ("mxgraph.aws4.lake_formation", None): _url_spec(f"{_ARCH}/AWSLakeFormation.svg"),
-    ("mxgraph.aws4.aws_lake_formation", None): _url_spec(f"{_ARCH}/AWSLakeFormation.svg"),
-    ("mxgraph.aws4.data_exchange", None): _url_spec(f"{_ARCH}/AWSDataExchange.svg"),
-    ("mxgraph.aws4.aws_data_exchange", None): _url_spec(f"{_ARCH}/AWSDataExchange.svg"),
-    ("mxgraph.aws4.resourceicon", 'mxgraph.aws4.sql_workbench'): _aws4_spec("sql workbench", "#8C4FFF", "#FFFFFF", 74.0, 74.0),
-    ("mxgraph.aws4.sql_workbench", None): _url_spec(f"{_RES}/AmazonRedshiftQueryEditorv20.svg"),
-    ("mxgraph.aws4.amazon_redshift_query_editor", None): _url_spec(f"{_RES}/AmazonRedshiftQueryEditorv20.svg"),
-    ("mxgraph.aws4.athena_data_source_connectors", None): _url_spec(f"{_RES}/AmazonAthenaDataSourceConnectors.svg"),
-    ("mxgraph.aws4.search_documents", None): _url_spec(f"{_RES}/AmazonCloudSearchSearchDocuments.svg"),
-    ("mxgraph.aws4.datazone_business_data_catalog", None): _url_spec(f"{_RES}/AmazonDataZoneBusinessDataCatalog.svg"),
-    ("mxgraph.aws4.datazone_data_portal", None): _url_spec(f"{_RES}/AmazonDataZoneDataPortal.svg"),
-    ("mxgraph.aws4.datazone_data_projects", None): _url_spec(f"{_RES}/AmazonDataZoneDataProjects.svg"),
-    ("mxgraph.aws4.cluster", None): _url_spec(f"{_RES}/AmazonEMRHDFSCluster.svg"),
-    ("mxgraph.aws4.msk_amazon_msk_connect", None): _url_spec(f"{_RES}/AmazonMSKAmazonMSKConnect.svg"),
-    ("mxgraph.aws4.opensearch_service_cluster_administrator_node", None): _url_spec(f"{_RES}/AmazonOpenSearchServiceClusterAdministratorNode.svg"),
-    ("mxgraph.aws4.opensearch_service_data_node", None): _url_spec(f"{_RES}/AmazonOpenSearchServiceDataNode.svg"),
-    ("mxgraph.aws4.opensearch_service_index", None): _url_spec(f"{_RES}/AmazonOpenSearchServiceIndex.svg"),
-    ("mxgraph.aws4.opensearch_observability", None): _url_spec(f"{_RES}/AmazonOpenSearchServiceObservability.svg"),
-    ("mxgraph.aws4.opensearch_dashboards", None): _url_spec(f"{_RES}/AmazonOpenSearchServiceOpenSearchDashboards.svg"),
-    ("mxgraph.aws4.opensearch_ingestion", None): _url_spec(f"{_RES}/AmazonOpenSearchServiceOpenSearchIngestion.svg"),
-    ("mxgraph.aws4.opensearch_service_traces", None): _url_spec(f"{_RES}/AmazonOpenSearchServiceTraces.svg"),
-    ("mxgraph.aws4.opensearch_service_ultrawarm_node", None): _url_spec(f"{_RES}/AmazonOpenSearchServiceUltraWarmNode.svg"),
-    ("mxgraph.aws4.quicksight_paginated_reports", None): _url_spec(f"{_RES}/AmazonQuicksightPaginatedReports.svg"),
-    ("mxgraph.aws4.redshift_auto_copy", None): _url_spec(f"{_RES}/AmazonRedshiftAutocopy.svg"),
-    ("mxgraph.aws4.redshift_data_sharing_governance", None): _url_spec(f"{_RES}/AmazonRedshiftDataSharingGovernance.svg"),
-    ("mxgraph.aws4.data_lake_resource_icon", None): _url_spec(f"{_RES}/AWSLakeFormationDataLake.svg"),
-    ("mxgraph.aws4.emr_engine", None): _url_spec(f"{_RES}/AmazonEMREMREngine.svg"),
-    ("mxgraph.aws4.emr_engine_mapr_m3", None): _aws4_spec("emr engine mapr m3", "none", "#8C4FFF", 78.109, 59.258),
-    ("mxgraph.aws4.emr_engine_mapr_m5", None): _aws4_spec("emr engine mapr m5", "none", "#8C4FFF", 78.109, 59.258),
-    ("mxgraph.aws4.emr_engine_mapr_m7", None): _aws4_spec("emr engine mapr m7", "none", "#8C4FFF", 78.109, 59.258),
-    ("mxgraph.aws4.hdfs_cluster", None): _url_spec(f"{_RES}/AmazonEMRCluster.svg"),
-    ("mxgraph.aws4.dense_compute_node", None): _url_spec(f"{_RES}/AmazonRedshiftDenseComputeNode.svg"),
-    ("mxgraph.aws4.dense_storage_node", None): _url_spec(f"{_RES}/AmazonRedshiftDenseStorageNode.svg"),
-    ("mxgraph.aws4.redshift_ra3", None): _url_spec(f"{_RES}/AmazonRedshiftRA3.svg"),
-    ("mxgraph.aws4.redshift_streaming_ingestion", None): _url_spec(f"{_RES}/AmazonRedshiftStreamingIngestion.svg"),
-    ("mxgraph.aws4.data_exchange_for_apis", None): _url_spec(f"{_RES}/AWSDataExchangeforAPIs.svg"),
-    ("mxgraph.aws4.aws_glue_for_ray", None): _url_spec(f"{_RES}/AWSGlueAWSGlueforRay.svg"),
-    ("mxgraph.aws4.glue_crawlers", None): _url_spec(f"{_RES}/AWSGlueCrawler.svg"),
-    ("mxgraph.aws4.glue_data_catalog", None): _url_spec(f"{_RES}/AWSGlueDataCatalog.svg"),
-    ("mxgraph.aws4.aws_glue_data_quality", None): _url_spec(f"{_RES}/AWSGlueDataQuality.svg"),
-    ("mxgraph.aws4.redshift_ml", None): _url_spec(f"{_RES}/AmazonRedshiftML.svg"),
-    ("mxgraph.aws4.redshift_query_editor_v20_light", None): _url_spec(f"{_RES}/AmazonRedshiftQueryEditorv20.svg"),
-    # -------------------------------------------------------------------------
-    # AWS / Artificial Intelligence
-    # -------------------------------------------------------------------------
-    ("mxgraph.aws4.augmented_ai", None): _url_spec(f"{_ARCH}/AmazonAugmentedAIA2I.svg", cover_scale=1.1),
-    ("mxgraph.aws4.apache_mxnet_on_aws", None): _url_spec(f"{_ARCH}/ApacheMXNetonAWS.svg"),
-    ("mxgraph.aws4.app_studio", None): _url_spec(f"{_ARCH}/AWSAppStudio.svg"),
-    ("mxgraph.aws4.bedrock", None): _url_spec(f"{_ARCH}/AmazonBedrock.svg", cover_scale=1.1),
-    ("mxgraph.aws4.codeguru_2", None): _url_spec(f"{_ARCH}/AmazonCodeGuru.svg"),
-    ("mxgraph.aws4.codewhisperer", None): _url_spec(f"{_ARCH}/AmazonCodeWhisperer.svg"),
-    ("mxgraph.aws4.comprehend", None): _url_spec(f"{_ARCH}/AmazonComprehend.svg"),
-    ("mxgraph.aws4.comprehend_medical", None): _url_spec(f"{_ARCH}/AmazonComprehendMedical.svg"),
-    ("mxgraph.aws4.deep_learning_amis", None): _url_spec(f"{_ARCH}/AWSDeepLearningAMIs.svg"),
-    ("mxgraph.aws4.deep_learning_containers", None): _url_spec(f"{_ARCH}/AWSDeepLearningContainers.svg"),
-    ("mxgraph.aws4.deepcomposer", None): _url_spec(f"{_ARCH}/AWSDeepComposer.svg"),
-    ("mxgraph.aws4.deeplens", None): _aws4_spec("deeplens", "#01A88D", "#FFFFFF", 70.0, 70.0),
-    ("mxgraph.aws4.deepracer", None): _url_spec(f"{_ARCH}/AWSDeepRacer.svg"),
-    ("mxgraph.aws4.devops_guru", None): _url_spec(f"{_ARCH}/AmazonDevOpsGuru.svg"),
-    ("mxgraph.aws4.elastic_inference_2", None): _url_spec(f"{_ARCH}/AmazonElasticInference.svg"),
-    ("mxgraph.aws4.forecast", None): _url_spec(f"{_ARCH}/AmazonForecast.svg"),
-    ("mxgraph.aws4.fraud_detector", None): _url_spec(f"{_ARCH}/AmazonFraudDetector.svg"),
-    ("mxgraph.aws4.healthimaging", None): _url_spec(f"{_ARCH}/AWSHealthImaging.svg"),
-    ("mxgraph.aws4.healthlake", None): _url_spec(f"{_ARCH}/AWSHealthLake.svg"),
-    ("mxgraph.aws4.healthscribe", None): _url_spec(f"{_ARCH}/AWSHealthScribe.svg"),
-    ("mxgraph.aws4.kendra", None): _url_spec(f"{_ARCH}/AmazonKendra.svg"),
-    ("mxgraph.aws4.lex", None): _url_spec(f"{_ARCH}/AmazonLex.svg"),
-    ("mxgraph.aws4.lookout_for_equipment", None): _url_spec(f"{_ARCH}/AmazonLookoutforEquipment.svg"),
-    ("mxgraph.aws4.lookout_for_metrics", None): _url_spec(f"{_ARCH}/AmazonLookoutforMetrics.svg"),
-    ("mxgraph.aws4.lookout_for_vision", None): _url_spec(f"{_ARCH}/AmazonLookoutforVision.svg"),
-    ("mxgraph.aws4.machine_learning", None): _url_spec(f"{_CATEGORY}/ArtificialIntelligence.svg", cover_scale=1.3),
-    ("mxgraph.aws4.monitron", None): _url_spec(f"{_ARCH}/AmazonMonitron.svg"),
-    ("mxgraph.aws4.neuron_ml_sdk", None): _url_spec(f"{_ARCH}/AWSNeuron.svg"),
-    ("mxgraph.aws4.nova2", None): _url_spec(f"{_ARCH}/AmazonNova.svg"),
-    ("mxgraph.aws4.omics", None): _url_spec(f"{_ARCH}/AWSHealthOmics.svg"),
-    ("mxgraph.aws4.panorama", None): _url_spec(f"{_ARCH}/AWSPanorama.svg"),
-    ("mxgraph.aws4.personalize", None): _url_spec(f"{_ARCH}/AmazonPersonalize.svg"),
-    ("mxgraph.aws4.polly", None): _url_spec(f"{_ARCH}/AmazonPolly.svg"),
-    ("mxgraph.aws4.q", None): _url_spec(f"{_ARCH}/AmazonQ.svg"),
-    ("mxgraph.aws4.rekognition_2", None): _url_spec(f"{_ARCH}/AmazonRekognition.svg"),
-    ("mxgraph.aws4.sagemaker_2", None): _url_spec(f"{_ARCH}/AmazonSageMaker.svg"),
-    ("mxgraph.aws4.sagemaker", None): _url_spec(f"{_ARCH}/AmazonSageMakerAI.svg"),
-    ("mxgraph.aws4.amazon_sagemaker", None): _url_spec(f"{_ARCH}/AmazonSageMaker.svg"),
-    ("mxgraph.aws4.sagemaker_ground_truth", None): _url_spec(f"{_ARCH}/AmazonSageMakerGroundTruth.svg"),
-    ("mxgraph.aws4.sagemaker_studio_lab", None): _url_spec(f"{_ARCH}/AmazonSageMakerStudioLab.svg"),
-    ("mxgraph.aws4.tensorflow_on_aws", None): _url_spec(f"{_ARCH}/TensorFlowonAWS.svg"),
-    ("mxgraph.aws4.textract", None): _url_spec(f"{_ARCH}/AmazonTextract.svg"),
-    ("mxgraph.aws4.torchserve", None): _aws4_spec("torchserve", "#01A88D", "#FFFFFF", 70.0, 70.0),
-    ("mxgraph.aws4.transcribe", None): _url_spec(f"{_ARCH}/AmazonTranscribe.svg"),
-    ("mxgraph.aws4.translate", None): _url_spec(f"{_ARCH}/AmazonTranslate.svg"),
-    ("mxgraph.aws4.rekognition_image", None): _url_spec(f"{_RES}/AmazonRekognitionImage.svg"),
-    ("mxgraph.aws4.rekognition_video", None): _url_spec(f"{_RES}/AmazonRekognitionVideo.svg"),
-    ("mxgraph.aws4.devops_guru_insights", None): _url_spec(f"{_RES}/AmazonDevOpsGuruInsights.svg"),
-    ("mxgraph.aws4.sagemaker_canvas", None): _url_spec(f"{_RES}/AmazonSageMakerAICanvas.svg"),
-    ("mxgraph.aws4.sagemaker_geospatial_ml", None): _url_spec(f"{_RES}/AmazonSageMakerAIGeospatialML.svg"),
-    ("mxgraph.aws4.sagemaker_model", None): _url_spec(f"{_RES}/AmazonSageMakerAIModel.svg"),
-    ("mxgraph.aws4.sagemaker_notebook", None): _url_spec(f"{_RES}/AmazonSageMakerAINotebook.svg"),
-    ("mxgraph.aws4.sagemaker_shadow_testing", None): _url_spec(f"{_RES}/AmazonSageMakerAIShadowTesting.svg"),
-    ("mxgraph.aws4.sagemaker_train", None): _url_spec(f"{_RES}/AmazonSageMakerAITrain.svg"),
-    ("mxgraph.aws4.textract_analyze_lending", None): _url_spec(f"{_RES}/AmazonTextractAnalyzeLending.svg"),
-    # -------------------------------------------------------------------------
-    # AWS / Blockchain
-    # -------------------------------------------------------------------------
-    ("mxgraph.aws4.blockchain", None): _url_spec(f"{_CATEGORY}/Blockchain.svg", cover_scale=1.3),
-    ("mxgraph.aws4.managed_blockchain", None): _url_spec(f"{_ARCH}/AmazonManagedBlockchain.svg"),
-    ("mxgraph.aws4.amazon_managed_blockchain", None): _url_spec(f"{_ARCH}/AmazonManagedBlockchain.svg"),
-    ("mxgraph.aws4.quantum_ledger_database", None): _url_spec(f"{_ARCH}/AmazonQuantumLedgerDatabase.svg"),
-    ("mxgraph.aws4.amazon_quantum_ledger_database", None): _url_spec(f"{_ARCH}/AmazonQuantumLedgerDatabase.svg"),
-    ("mxgraph.aws4.blockchain_resource", None): _url_spec(f"{_RES}/AmazonManagedBlockchainBlockchain.svg"),
-    # -------------------------------------------------------------------------
-    # AWS / Business Applications
-    # -------------------------------------------------------------------------
-    ("mxgraph.aws4.business_application", None): _url_spec(f"{_CATEGORY}/BusinessApplications.svg", cover_scale=1.3),
-    ("mxgraph.aws4.alexa_for_business", None): _url_spec(f"{_ARCH}/AlexaForBusiness.svg"),
-    ("mxgraph.aws4.amazon_alexa_for_business", None): _url_spec(f"{_ARCH}/AlexaForBusiness.svg"),
-    ("mxgraph.aws4.chime", None): _url_spec(f"{_ARCH}/AmazonChime.svg"),
-    ("mxgraph.aws4.amazon_chime", None): _url_spec(f"{_ARCH}/AmazonChime.svg"),
-    ("mxgraph.aws4.chime_sdk", None): _url_spec(f"{_ARCH}/AmazonChimeSDK.svg"),
-    ("mxgraph.aws4.amazon_chime_sdk", None): _url_spec(f"{_ARCH}/AmazonChimeSDK.svg"),
-    ("mxgraph.aws4.connect", None): _url_spec(f"{_ARCH}/AmazonConnect.svg"),
-    ("mxgraph.aws4.amazon_connect", None): _url_spec(f"{_ARCH}/AmazonConnect.svg"),
-    ("mxgraph.aws4.honeycode", None): _aws4_spec("honeycode", "#FFFFFF", "#FFFFFF", 68.0, 68.0),
-    ("mxgraph.aws4.pinpoint", None): _url_spec(f"{_ARCH}/AmazonPinpoint.svg"),
-    ("mxgraph.aws4.amazon_pinpoint", None): _url_spec(f"{_ARCH}/AmazonPinpoint.svg"),
-    ("mxgraph.aws4.simple_email_service", None): _url_spec(f"{_ARCH}/AmazonSimpleEmailService.svg"),
-    ("mxgraph.aws4.amazon_simple_email_service", None): _url_spec(f"{_ARCH}/AmazonSimpleEmailService.svg"),
-    ("mxgraph.aws4.workdocs", None): _url_spec(f"{_ARCH}/AmazonWorkDocs.svg"),
-    ("mxgraph.aws4.amazon_workdocs", None): _url_spec(f"{_ARCH}/AmazonWorkDocs.svg"),
-    ("mxgraph.aws4.workmail", None): _url_spec(f"{_ARCH}/AmazonWorkMail.svg"),
-    ("mxgraph.aws4.amazon_workmail", None): _url_spec(f"{_ARCH}/AmazonWorkMail.svg"),
-    ("mxgraph.aws4.appfabric", None): _url_spec(f"{_ARCH}/AWSAppFabric.svg"),
-    ("mxgraph.aws4.aws_appfabric", None): _url_spec(f"{_ARCH}/AWSAppFabric.svg"),
-    ("mxgraph.aws4.end_user_messaging", None): _url_spec(f"{_ARCH}/AWSEndUserMessaging.svg"),
-    ("mxgraph.aws4.aws_end_user_messaging", None): _url_spec(f"{_ARCH}/AWSEndUserMessaging.svg"),
-    ("mxgraph.aws4.supply_chain", None): _url_spec(f"{_ARCH}/AWSSupplyChain.svg"),
-    ("mxgraph.aws4.aws_supply_chain", None): _url_spec(f"{_ARCH}/AWSSupplyChain.svg"),
-    ("mxgraph.aws4.wickr", None): _url_spec(f"{_ARCH}/AWSWickr.svg"),
-    ("mxgraph.aws4.aws_wickr", None): _url_spec(f"{_ARCH}/AWSWickr.svg"),
-    ("mxgraph.aws4.pinpoint_journey", None): _url_spec(f"{_RES}/AmazonPinpointJourney.svg"),
-    # -------------------------------------------------------------------------
-    # AWS / Cloud Financial Management
-    # -------------------------------------------------------------------------
-    ("mxgraph.aws4.cost_management", None): _url_spec(f"{_CATEGORY}/CloudFinancialManagement.svg", cover_scale=1.3),
-    ("mxgraph.aws4.application_cost_profiler", None): _aws4_spec("application cost profiler", "#FFFFFF", "#FFFFFF", 72.0, 72.0),
-    ("mxgraph.aws4.budgets_2", None): _url_spec(f"{_ARCH}/AWSBudgets.svg"),
-    ("mxgraph.aws4.budgets", None): _url_spec(f"{_ARCH}/AWSBudgets.svg"),
-    ("mxgraph.aws4.cost_and_usage_report", None): _url_spec(f"{_ARCH}/AWSCostandUsageReport.svg"),
-    ("mxgraph.aws4.cost_explorer", None): _url_spec(f"{_ARCH}/AWSCostExplorer.svg"),
-    ("mxgraph.aws4.custom_billing_manager", None): _url_spec(f"{_ARCH}/AWSBillingConductor.svg"),
-    ("mxgraph.aws4.billing_conductor", None): _url_spec(f"{_ARCH}/AWSBillingConductor.svg"),
-    ("mxgraph.aws4.aws_billing_conductor", None): _url_spec(f"{_ARCH}/AWSBillingConductor.svg"),
-    ("mxgraph.aws4.reserved_instance_reporting", None): _url_spec(f"{_ARCH}/ReservedInstanceReporting.svg"),
-    ("mxgraph.aws4.savings_plans", None): _url_spec(f"{_ARCH}/SavingsPlans.svg"),
-}
+def _build_icon_spec_table() -> Dict[str, Union[_UrlSpec, _Aws4Spec]]:
+    """Spec table literal; materialized on first lookup by _icon_spec_tables()."""
+    return {
+        # -------------------------------------------------------------------------
+        # AWS / Core services / legacy aliases (cross-category bootstrap mappings)
+        # -------------------------------------------------------------------------
+        "mxgraph.aws4.lambda": _url_spec(_ARCH, "AWSLambda.svg"),
+        "mxgraph.aws4.lambda_function": _url_spec(_RES, "AWSLambdaLambdaFunction.svg"),
+        "mxgraph.aws4.cloudwatch": _url_spec(_ARCH, "AmazonCloudWatch.svg"),
+        "mxgraph.aws4.amazon_cloudwatch": _url_spec(_ARCH, "AmazonCloudWatch.svg"),
+        "mxgraph.aws4.sns": _url_spec(_ARCH, "AmazonSimpleNotificationService.svg"),
+        "mxgraph.aws4.amazon_sns": _url_spec(_ARCH, "AmazonSimpleNotificationService.svg"),
+        "mxgraph.aws4.dynamodb": _url_spec(_ARCH, "AmazonDynamoDB.svg"),
+        "mxgraph.aws4.amazon_dynamodb": _url_spec(_ARCH, "AmazonDynamoDB.svg"),
+        "mxgraph.aws4.queue": _url_spec(_AWS_ICON_SVG_BASE, "Res_Application-Integration/Res_48_Light/Res_Amazon-Simple-Queue-Service_Queue_48_Light.svg"),
+        "mxgraph.aws4.event_time_based": _url_spec(_AWS_ICON_SVG_BASE, "Res_Management-Governance/Res_48_Light/Res_Amazon-CloudWatch_Event-Time-Based_48_Light.svg"),
+        "mxgraph.aws4.event_event_based": _url_spec(_AWS_ICON_SVG_BASE, "Res_Management-Governance/Res_48_Light/Res_Amazon-CloudWatch_Event-Event-Based_48_Light.svg"),
+        "mxgraph.aws4.bucket_with_objects": _url_spec(_AWS_ICON_SVG_BASE, "Res_Storage/Res_48_Light/Res_Amazon-Simple-Storage-Service_Bucket-With-Objects_48_Light.svg"),
+        "mxgraph.aws4.topic": _url_spec(_RES, "AmazonSimpleNotificationServiceTopic.svg"),
+        "mxgraph.aws4.template": _url_spec(_RES, "AWSCloudFormationTemplate.svg"),
+        "mxgraph.aws4.role": _url_spec(_RES, "AWSIdentityAccessManagementRole.svg"),
+        "mxgraph.aws4.config": _url_spec(_ARCH, "AWSConfig.svg"),
+        "mxgraph.aws4.aws_config": _url_spec(_ARCH, "AWSConfig.svg"),
+        "mxgraph.aws4.guardduty": _url_spec(_ARCH, "AmazonGuardDuty.svg"),
+        "mxgraph.aws4.amazon_guardduty": _url_spec(_ARCH, "AmazonGuardDuty.svg"),
+        "mxgraph.aws4.cloudtrail": _url_spec(_ARCH, "AWSCloudTrail.svg"),
+        "mxgraph.aws4.aws_cloudtrail": _url_spec(_ARCH, "AWSCloudTrail.svg"),
+        "mxgraph.aws4.email": _url_spec(_AWS_ICON_SVG_BASE, "Res_Business-Applications/Res_48_Light/Res_Amazon-Simple-Email-Service_Email_48_Light.svg"),
+        "mxgraph.aws4.email_notification": _url_spec(_AWS_ICON_SVG_BASE, "Res_Application-Integration/Res_48_Light/Res_Amazon-Simple-Notification-Service_Email-Notification_48_Light.svg"),
+        "mxgraph.aws4.rule_2": _url_spec(_RES, "AmazonCloudWatchRule.svg"),
+        "mxgraph.aws4.rule": _url_spec(_RES, "AmazonCloudWatchRule.svg"),
+        # -------------------------------------------------------------------------
+        # AWS / General Resources
+        # -------------------------------------------------------------------------
+        "mxgraph.aws4.resourceicon|mxgraph.aws4.marketplace": _url_spec(_ARCH, "AWSMarketplace.svg"),
+        "mxgraph.aws4.marketplace": _url_spec(_ARCH, "AWSMarketplaceDark.svg"),
+        "mxgraph.aws4.resourceicon|mxgraph.aws4.all_products": _aws4_spec("all products", "#232F3E", "#FFFFFF", 68.0, 68.0),
+        "mxgraph.aws4.all_products": _aws4_spec("all products", "#FFFFFF", "#232F3D", 68.0, 68.0),
+        "mxgraph.aws4.resourceicon|mxgraph.aws4.general": _aws4_spec("general", "#232F3E", "#FFFFFF", 64.0, 64.0),
+        "mxgraph.aws4.general": _aws4_spec("general", "#FFFFFF", "#232F3D", 64.0, 64.0),
+        "mxgraph.aws4.alert": _url_spec(_RES, "Alert.svg"),
+        "mxgraph.aws4.authenticated_user": _url_spec(_RES, "AuthenticatedUser.svg"),
+        "mxgraph.aws4.management_console2": _url_spec(_RES, "AWSManagementConsole.svg"),
+        "mxgraph.aws4.camera2": _url_spec(_RES, "Camera.svg"),
+        "mxgraph.aws4.chat": _url_spec(_RES, "Chat.svg"),
+        "mxgraph.aws4.client": _url_spec(_RES, "Client.svg"),
+        "mxgraph.aws4.cold_storage": _url_spec(_RES, "ColdStorage.svg"),
+        "mxgraph.aws4.credentials": _url_spec(_RES, "Credentials.svg"),
+        "mxgraph.aws4.corporate_data_center": _url_spec(_RES, "Officebuilding.svg"),
+        "mxgraph.aws4.data_stream": _url_spec(_RES, "DataStream.svg"),
+        "mxgraph.aws4.data_table": _url_spec(_RES, "DataTable.svg"),
+        "mxgraph.aws4.disk": _url_spec(_RES, "Disk.svg"),
+        "mxgraph.aws4.document": _url_spec(_RES, "Document.svg"),
+        "mxgraph.aws4.resourceicon|mxgraph.aws4.documents": _aws4_spec("documents", "#232F3E", "#FFFFFF", 64.0, 64.0),
+        "mxgraph.aws4.documents": _aws4_spec("documents", "#FFFFFF", "#232F3D", 64.0, 64.0),
+        "mxgraph.aws4.resourceicon|mxgraph.aws4.documents2": _aws4_spec("documents2", "#232F3E", "#FFFFFF", 64.0, 64.0),
+        "mxgraph.aws4.documents2": _aws4_spec("documents2", "#FFFFFF", "#232F3D", 64.0, 64.0),
+        "mxgraph.aws4.resourceicon|mxgraph.aws4.documents3": _url_spec(_RES, "Documents.svg"),
+        "mxgraph.aws4.documents3": _url_spec(_RES, "Documents.svg"),
+        "mxgraph.aws4.email_2": _url_spec(_RES, "Email.svg"),
+        "mxgraph.aws4.forums": _url_spec(_RES, "Forums.svg"),
+        "mxgraph.aws4.gear": _url_spec(_RES, "Gear.svg"),
+        "mxgraph.aws4.generic_application": _url_spec(_RES, "GenericApplication.svg"),
+        "mxgraph.aws4.generic_database": _url_spec(_RES, "Database.svg"),
+        "mxgraph.aws4.generic_firewall": _url_spec(_RES, "Firewall.svg"),
+        "mxgraph.aws4.git_repository": _url_spec(_RES, "GitRepository.svg"),
+        "mxgraph.aws4.globe": _url_spec(_RES, "Globe.svg"),
+        "mxgraph.aws4.folder": _url_spec(_RES, "Folder.svg"),
+        "mxgraph.aws4.folders": _url_spec(_RES, "Folders.svg"),
+        "mxgraph.aws4.internet": _url_spec(_RES, "Internet.svg"),
+        "mxgraph.aws4.internet_alt1": _url_spec(_RES, "Internetalt1.svg"),
+        "mxgraph.aws4.resourceicon|mxgraph.aws4.internet_alt2": _aws4_spec("internet alt2", "#232F3E", "#FFFFFF", 64.0, 64.0),
+        "mxgraph.aws4.internet_alt2": _aws4_spec("internet alt2", "#FFFFFF", "#232F3D", 64.0, 64.0),
+        "mxgraph.aws4.internet_alt22": _url_spec(_RES, "Internetalt2.svg"),
+        "mxgraph.aws4.json_script": _url_spec(_RES, "JSONScript.svg"),
+        "mxgraph.aws4.logs": _url_spec(_RES, "Logs.svg"),
+        "mxgraph.aws4.magnifying_glass_2": _url_spec(_RES, "MagnifyingGlass.svg"),
+        "mxgraph.aws4.metrics": _url_spec(_RES, "Metrics.svg"),
+        "mxgraph.aws4.mobile_client": _url_spec(_RES, "Mobileclient.svg"),
+        "mxgraph.aws4.multimedia": _url_spec(_RES, "Multimedia.svg"),
+        "mxgraph.aws4.office_building": _url_spec(_RES, "Officebuilding.svg"),
+        "mxgraph.aws4.programming_language": _url_spec(_RES, "ProgrammingLanguage.svg"),
+        "mxgraph.aws4.question": _url_spec(_RES, "Question.svg"),
+        "mxgraph.aws4.recover": _url_spec(_RES, "Recover.svg"),
+        "mxgraph.aws4.saml_token": _url_spec(_RES, "SAMLtoken.svg"),
+        "mxgraph.aws4.ssl_padlock": _url_spec(_RES, "SSLpadlock.svg"),
+        "mxgraph.aws4.tape_storage": _url_spec(_RES, "Tapestorage.svg"),
+        "mxgraph.aws4.traditional_server": _url_spec(_RES, "Server.svg"),
+        "mxgraph.aws4.user": _url_spec(_RES, "User.svg"),
+        "mxgraph.aws4.users": _url_spec(_RES, "Users.svg"),
+        "mxgraph.aws4.servers": _url_spec(_RES, "Servers.svg"),
+        "mxgraph.aws4.external_toolkit": _url_spec(_RES, "Toolkit.svg"),
+        "mxgraph.aws4.external_sdk": _url_spec(_RES, "SDK.svg"),
+        "mxgraph.aws4.shield2": _url_spec(_RES, "Shield.svg"),
+        "mxgraph.aws4.source_code": _url_spec(_RES, "SourceCode.svg"),
+        # -------------------------------------------------------------------------
+        # AWS / Illustration
+        # -------------------------------------------------------------------------
+        "mxgraph.aws4.illustration_users": _aws4_spec("illustration users", "none", "#879196", 100.0, 100.0),
+        "mxgraph.aws4.illustration_notification": _aws4_spec("illustration notification", "none", "#879196", 100.0, 100.0),
+        "mxgraph.aws4.illustration_devices": _aws4_spec("illustration devices", "none", "#879196", 100.0, 100.0),
+        "mxgraph.aws4.illustration_office_building": _aws4_spec("illustration office building", "none", "#879196", 100.0, 100.0),
+        "mxgraph.aws4.illustration_desktop": _aws4_spec("illustration desktop", "none", "#879196", 100.0, 100.0),
+        # -------------------------------------------------------------------------
+        # AWS / AR & VR
+        # -------------------------------------------------------------------------
+        "mxgraph.aws4.resourceicon|mxgraph.aws4.ar_vr": _aws4_spec("ar vr", "#BC1356", "#FFFFFF", 70.0, 70.0),
+        "mxgraph.aws4.ar_vr": _aws4_spec("ar vr", "#FFFFFF", "#BC1356", 70.0, 70.0),
+        "mxgraph.aws4.resourceicon|mxgraph.aws4.sumerian": _aws4_spec("sumerian", "#BC1356", "#FFFFFF", 64.0, 64.0),
+        "mxgraph.aws4.sumerian": _aws4_spec("sumerian", "#FFFFFF", "#BC1356", 64.0, 64.0),
+        # -------------------------------------------------------------------------
+        # AWS / Application Integration
+        # -------------------------------------------------------------------------
+        "mxgraph.aws4.api_gateway": _url_spec(_ARCH, "AmazonAPIGateway.svg"),
+        "mxgraph.aws4.application_integration": _url_spec(_CATEGORY, "ApplicationIntegration.svg", cover_scale=1.3),
+        "mxgraph.aws4.amazon_api_gateway": _url_spec(_ARCH, "AmazonAPIGateway.svg"),
+        "mxgraph.aws4.mq": _url_spec(_ARCH, "AmazonMQ.svg"),
+        "mxgraph.aws4.amazon_mq": _url_spec(_ARCH, "AmazonMQ.svg"),
+        "mxgraph.aws4.sqs": _url_spec(_ARCH, "AmazonSimpleQueueService.svg"),
+        "mxgraph.aws4.amazon_sqs": _url_spec(_ARCH, "AmazonSimpleQueueService.svg"),
+        "mxgraph.aws4.appsync": _url_spec(_ARCH, "AWSAppSync.svg"),
+        "mxgraph.aws4.amazon_appsync": _url_spec(_ARCH, "AWSAppSync.svg"),
+        "mxgraph.aws4.b2b_data_interchange": _url_spec(_ARCH, "AWSB2BDataInterchange.svg"),
+        "mxgraph.aws4.amazon_b2b_data_interchange": _url_spec(_ARCH, "AWSB2BDataInterchange.svg"),
+        "mxgraph.aws4.eventbridge": _url_spec(_ARCH, "AmazonEventBridge.svg"),
+        "mxgraph.aws4.amazon_eventbridge": _url_spec(_ARCH, "AmazonEventBridge.svg"),
+        "mxgraph.aws4.managed_workflows_for_apache_airflow": _url_spec(_ARCH, "AmazonManagedWorkflowsforApacheAirflow.svg"),
+        "mxgraph.aws4.amazon_managed_workflows_for_apache_airflow": _url_spec(_ARCH, "AmazonManagedWorkflowsforApacheAirflow.svg"),
+        "mxgraph.aws4.step_functions": _url_spec(_ARCH, "AWSStepFunctions.svg"),
+        "mxgraph.aws4.amazon_step_functions": _url_spec(_ARCH, "AWSStepFunctions.svg"),
+        "mxgraph.aws4.mobile_application": _url_spec(_ARCH, "AWSConsoleMobileApplication.svg"),
+        "mxgraph.aws4.amazon_mobile_application": _url_spec(_ARCH, "AWSConsoleMobileApplication.svg"),
+        "mxgraph.aws4.express_workflow": _url_spec(_ARCH, "AWSExpressWorkflows.svg"),
+        "mxgraph.aws4.amazon_express_workflow": _url_spec(_ARCH, "AWSExpressWorkflows.svg"),
+        "mxgraph.aws4.appflow": _url_spec(_ARCH, "AmazonAppFlow.svg"),
+        "mxgraph.aws4.amazon_appflow": _url_spec(_ARCH, "AmazonAppFlow.svg"),
+        "mxgraph.aws4.endpoint": _url_spec(_RES, "AmazonAPIGatewayEndpoint.svg"),
+        "mxgraph.aws4.event": _url_spec(_RES, "AmazonEventBridgeEvent.svg"),
+        "mxgraph.aws4.eventbridge_pipes": _url_spec(_RES, "AmazonEventBridgePipes.svg"),
+        "mxgraph.aws4.eventbridge_custom_event_bus_resource": _url_spec(_RES, "AmazonEventBridgeCustomEventBus.svg"),
+        "mxgraph.aws4.eventbridge_default_event_bus_resource": _url_spec(_RES, "AmazonEventBridgeDefaultEventBus.svg"),
+        "mxgraph.aws4.eventbridge_saas_partner_event_bus_resource": _url_spec(_RES, "AmazonEventBridgeSaasPartnerEvent.svg"),
+        "mxgraph.aws4.eventbridge_scheduler": _url_spec(_RES, "AmazonEventBridgeScheduler.svg"),
+        "mxgraph.aws4.eventbridge_schema": _url_spec(_RES, "AmazonEventBridgeSchema.svg"),
+        "mxgraph.aws4.eventbridge_schema_registry": _url_spec(_RES, "AmazonEventBridgeSchemaRegistry.svg"),
+        "mxgraph.aws4.mq_broker": _url_spec(_RES, "AmazonMQBroker.svg"),
+        "mxgraph.aws4.event_resource": _url_spec(_RES, "AmazonEventBridgeEvent.svg"),
+        "mxgraph.aws4.http_notification": _url_spec(_RES, "AmazonSimpleNotificationServiceHTTPNotification.svg"),
+        "mxgraph.aws4.message": _url_spec(_RES, "AmazonSimpleQueueServiceMessage.svg"),
+        "mxgraph.aws4.rule_3": _url_spec(_RES, "AmazonEventBridgeRule.svg"),
+        # -------------------------------------------------------------------------
+        # AWS / Analytics
+        # -------------------------------------------------------------------------
+        "mxgraph.aws4.analytics": _url_spec(_CATEGORY, "Analytics.svg", cover_scale=1.3),
+        "mxgraph.aws4.athena": _url_spec(_ARCH, "AmazonAthena.svg"),
+        "mxgraph.aws4.amazon_athena": _url_spec(_ARCH, "AmazonAthena.svg"),
+        "mxgraph.aws4.datazone": _url_spec(_ARCH, "AmazonDataZone.svg"),
+        "mxgraph.aws4.amazon_datazone": _url_spec(_ARCH, "AmazonDataZone.svg"),
+        "mxgraph.aws4.cloudsearch2": _url_spec(_ARCH, "AmazonCloudSearch.svg"),
+        "mxgraph.aws4.amazon_cloudsearch": _url_spec(_ARCH, "AmazonCloudSearch.svg"),
+        "mxgraph.aws4.elasticsearch_service": _url_spec(_ARCH, "AmazonOpenSearchService.svg"),
+        "mxgraph.aws4.amazon_elasticsearch_service": _url_spec(_ARCH, "AmazonOpenSearchService.svg"),
+        "mxgraph.aws4.opensearch_service": _url_spec(_ARCH, "AmazonOpenSearchService.svg"),
+        "mxgraph.aws4.emr": _url_spec(_ARCH, "AmazonEMR.svg"),
+        "mxgraph.aws4.amazon_emr": _url_spec(_ARCH, "AmazonEMR.svg"),
+        "mxgraph.aws4.finspace": _url_spec(_ARCH, "AmazonFinSpace.svg"),
+        "mxgraph.aws4.amazon_finspace": _url_spec(_ARCH, "AmazonFinSpace.svg"),
+        "mxgraph.aws4.kinesis": _url_spec(_ARCH, "AmazonKinesis.svg"),
+        "mxgraph.aws4.amazon_kinesis": _url_spec(_ARCH, "AmazonKinesis.svg"),
+        "mxgraph.aws4.kinesis_data_analytics": _url_spec(_ARCH, "AmazonManagedServiceforApacheFlink.svg"),
+        "mxgraph.aws4.amazon_kinesis_data_analytics": _url_spec(_ARCH, "AmazonManagedServiceforApacheFlink.svg"),
+        "mxgraph.aws4.kinesis_data_firehose": _url_spec(_ARCH, "AmazonDataFirehose.svg"),
+        "mxgraph.aws4.amazon_kinesis_data_firehose": _url_spec(_ARCH, "AmazonDataFirehose.svg"),
+        "mxgraph.aws4.kinesis_data_streams": _url_spec(_ARCH, "AmazonKinesisDataStreams.svg"),
+        "mxgraph.aws4.amazon_kinesis_data_streams": _url_spec(_ARCH, "AmazonKinesisDataStreams.svg"),
+        "mxgraph.aws4.kinesis_video_streams": _url_spec(_ARCH, "AmazonKinesisVideoStreams.svg"),
+        "mxgraph.aws4.amazon_kinesis_video_streams": _url_spec(_ARCH, "AmazonKinesisVideoStreams.svg"),
+        "mxgraph.aws4.managed_service_for_apache_flink": _url_spec(_ARCH, "AmazonManagedServiceforApacheFlink.svg"),
+        "mxgraph.aws4.amazon_managed_service_for_apache_flink": _url_spec(_ARCH, "AmazonManagedServiceforApacheFlink.svg"),
+        "mxgraph.aws4.quicksight": _url_spec(_ARCH, "AmazonQuickSight.svg"),
+        "mxgraph.aws4.amazon_quicksight": _url_spec(_ARCH, "AmazonQuickSight.svg"),
+        "mxgraph.aws4.clean_rooms": _url_spec(_ARCH, "AWSCleanRooms.svg"),
+        "mxgraph.aws4.amazon_clean_rooms": _url_spec(_ARCH, "AWSCleanRooms.svg"),
+        "mxgraph.aws4.redshift": _url_spec(_ARCH, "AmazonRedshift.svg"),
+        "mxgraph.aws4.amazon_redshift": _url_spec(_ARCH, "AmazonRedshift.svg"),
+        "mxgraph.aws4.data_pipeline": _url_spec(_ARCH, "AWSDataPipeline.svg"),
+        "mxgraph.aws4.aws_data_pipeline": _url_spec(_ARCH, "AWSDataPipeline.svg"),
+        "mxgraph.aws4.entity_resolution": _url_spec(_ARCH, "AWSEntityResolution.svg"),
+        "mxgraph.aws4.aws_entity_resolution": _url_spec(_ARCH, "AWSEntityResolution.svg"),
+        "mxgraph.aws4.managed_streaming_for_kafka": _url_spec(_ARCH, "AmazonManagedStreamingforApacheKafka.svg"),
+        "mxgraph.aws4.amazon_managed_streaming_for_kafka": _url_spec(_ARCH, "AmazonManagedStreamingforApacheKafka.svg"),
+        "mxgraph.aws4.glue": _url_spec(_ARCH, "AWSGlue.svg"),
+        "mxgraph.aws4.aws_glue": _url_spec(_ARCH, "AWSGlue.svg"),
+        "mxgraph.aws4.resourceicon|mxgraph.aws4.glue_databrew": _url_spec(_ARCH, "AWSGlueDataBrew.svg"),
+        "mxgraph.aws4.glue_databrew": _aws4_spec("glue databrew", "#FFFFFF", "#8C4FFF", 56.0, 56.0),
+        "mxgraph.aws4.aws_glue_databrew": _aws4_spec("glue databrew", "#FFFFFF", "#8C4FFF", 56.0, 56.0),
+        "mxgraph.aws4.glue_elastic_views": _url_spec(_ARCH, "AWSGlueElasticViews.svg"),
+        "mxgraph.aws4.aws_glue_elastic_views": _url_spec(_ARCH, "AWSGlueElasticViews.svg"),
+        "mxgraph.aws4.lake_formation": _url_spec(_ARCH, "AWSLakeFormation.svg"),
+        "mxgraph.aws4.aws_lake_formation": _url_spec(_ARCH, "AWSLakeFormation.svg"),
+        "mxgraph.aws4.data_exchange": _url_spec(_ARCH, "AWSDataExchange.svg"),
+        "mxgraph.aws4.aws_data_exchange": _url_spec(_ARCH, "AWSDataExchange.svg"),
+        "mxgraph.aws4.resourceicon|mxgraph.aws4.sql_workbench": _aws4_spec("sql workbench", "#8C4FFF", "#FFFFFF", 74.0, 74.0),
+        "mxgraph.aws4.sql_workbench": _url_spec(_RES, "AmazonRedshiftQueryEditorv20.svg"),
+        "mxgraph.aws4.amazon_redshift_query_editor": _url_spec(_RES, "AmazonRedshiftQueryEditorv20.svg"),
+        "mxgraph.aws4.athena_data_source_connectors": _url_spec(_RES, "AmazonAthenaDataSourceConnectors.svg"),
+        "mxgraph.aws4.search_documents": _url_spec(_RES, "AmazonCloudSearchSearchDocuments.svg"),
+        "mxgraph.aws4.datazone_business_data_catalog": _url_spec(_RES, "AmazonDataZoneBusinessDataCatalog.svg"),
+        "mxgraph.aws4.datazone_data_portal": _url_spec(_RES, "AmazonDataZoneDataPortal.svg"),
+        "mxgraph.aws4.datazone_data_projects": _url_spec(_RES, "AmazonDataZoneDataProjects.svg"),
+        "mxgraph.aws4.cluster": _url_spec(_RES, "AmazonEMRHDFSCluster.svg"),
+        "mxgraph.aws4.msk_amazon_msk_connect": _url_spec(_RES, "AmazonMSKAmazonMSKConnect.svg"),
+        "mxgraph.aws4.opensearch_service_cluster_administrator_node": _url_spec(_RES, "AmazonOpenSearchServiceClusterAdministratorNode.svg"),
+        "mxgraph.aws4.opensearch_service_data_node": _url_spec(_RES, "AmazonOpenSearchServiceDataNode.svg"),
+        "mxgraph.aws4.opensearch_service_index": _url_spec(_RES, "AmazonOpenSearchServiceIndex.svg"),
+        "mxgraph.aws4.opensearch_observability": _url_spec(_RES, "AmazonOpenSearchServiceObservability.svg"),
+        "mxgraph.aws4.opensearch_dashboards": _url_spec(_RES, "AmazonOpenSearchServiceOpenSearchDashboards.svg"),
+        "mxgraph.aws4.opensearch_ingestion": _url_spec(_RES, "AmazonOpenSearchServiceOpenSearchIngestion.svg"),
+        "mxgraph.aws4.opensearch_service_traces": _url_spec(_RES, "AmazonOpenSearchServiceTraces.svg"),
+        "mxgraph.aws4.opensearch_service_ultrawarm_node": _url_spec(_RES, "AmazonOpenSearchServiceUltraWarmNode.svg"),
+        "mxgraph.aws4.quicksight_paginated_reports": _url_spec(_RES, "AmazonQuicksightPaginatedReports.svg"),
+        "mxgraph.aws4.redshift_auto_copy": _url_spec(_RES, "AmazonRedshiftAutocopy.svg"),
+        "mxgraph.aws4.redshift_data_sharing_governance": _url_spec(_RES, "AmazonRedshiftDataSharingGovernance.svg"),
+        "mxgraph.aws4.data_lake_resource_icon": _url_spec(_RES, "AWSLakeFormationDataLake.svg"),
+        "mxgraph.aws4.emr_engine": _url_spec(_RES, "AmazonEMREMREngine.svg"),
+        "mxgraph.aws4.emr_engine_mapr_m3": _aws4_spec("emr engine mapr m3", "none", "#8C4FFF", 78.109, 59.258),
+        "mxgraph.aws4.emr_engine_mapr_m5": _aws4_spec("emr engine mapr m5", "none", "#8C4FFF", 78.109, 59.258),
+        "mxgraph.aws4.emr_engine_mapr_m7": _aws4_spec("emr engine mapr m7", "none", "#8C4FFF", 78.109, 59.258),
+        "mxgraph.aws4.hdfs_cluster": _url_spec(_RES, "AmazonEMRCluster.svg"),
+        "mxgraph.aws4.dense_compute_node": _url_spec(_RES, "AmazonRedshiftDenseComputeNode.svg"),
+        "mxgraph.aws4.dense_storage_node": _url_spec(_RES, "AmazonRedshiftDenseStorageNode.svg"),
+        "mxgraph.aws4.redshift_ra3": _url_spec(_RES, "AmazonRedshiftRA3.svg"),
+        "mxgraph.aws4.redshift_streaming_ingestion": _url_spec(_RES, "AmazonRedshiftStreamingIngestion.svg"),
+        "mxgraph.aws4.data_exchange_for_apis": _url_spec(_RES, "AWSDataExchangeforAPIs.svg"),
+        "mxgraph.aws4.aws_glue_for_ray": _url_spec(_RES, "AWSGlueAWSGlueforRay.svg"),
+        "mxgraph.aws4.glue_crawlers": _url_spec(_RES, "AWSGlueCrawler.svg"),
+        "mxgraph.aws4.glue_data_catalog": _url_spec(_RES, "AWSGlueDataCatalog.svg"),
+        "mxgraph.aws4.aws_glue_data_quality": _url_spec(_RES, "AWSGlueDataQuality.svg"),
+        "mxgraph.aws4.redshift_ml": _url_spec(_RES, "AmazonRedshiftML.svg"),
+        "mxgraph.aws4.redshift_query_editor_v20_light": _url_spec(_RES, "AmazonRedshiftQueryEditorv20.svg"),
+        # -------------------------------------------------------------------------
+        # AWS / Artificial Intelligence
+        # -------------------------------------------------------------------------
+        "mxgraph.aws4.augmented_ai": _url_spec(_ARCH, "AmazonAugmentedAIA2I.svg", cover_scale=1.1),
+        "mxgraph.aws4.apache_mxnet_on_aws": _url_spec(_ARCH, "ApacheMXNetonAWS.svg"),
+        "mxgraph.aws4.app_studio": _url_spec(_ARCH, "AWSAppStudio.svg"),
+        "mxgraph.aws4.bedrock": _url_spec(_ARCH, "AmazonBedrock.svg", cover_scale=1.1),
+        "mxgraph.aws4.codeguru_2": _url_spec(_ARCH, "AmazonCodeGuru.svg"),
+        "mxgraph.aws4.codewhisperer": _url_spec(_ARCH, "AmazonCodeWhisperer.svg"),
+        "mxgraph.aws4.comprehend": _url_spec(_ARCH, "AmazonComprehend.svg"),
+        "mxgraph.aws4.comprehend_medical": _url_spec(_ARCH, "AmazonComprehendMedical.svg"),
+        "mxgraph.aws4.deep_learning_amis": _url_spec(_ARCH, "AWSDeepLearningAMIs.svg"),
+        "mxgraph.aws4.deep_learning_containers": _url_spec(_ARCH, "AWSDeepLearningContainers.svg"),
+        "mxgraph.aws4.deepcomposer": _url_spec(_ARCH, "AWSDeepComposer.svg"),
+        "mxgraph.aws4.deeplens": _aws4_spec("deeplens", "#01A88D", "#FFFFFF", 70.0, 70.0),
+        "mxgraph.aws4.deepracer": _url_spec(_ARCH, "AWSDeepRacer.svg"),
+        "mxgraph.aws4.devops_guru": _url_spec(_ARCH, "AmazonDevOpsGuru.svg"),
+        "mxgraph.aws4.elastic_inference_2": _url_spec(_ARCH, "AmazonElasticInference.svg"),
+        "mxgraph.aws4.forecast": _url_spec(_ARCH, "AmazonForecast.svg"),
+        "mxgraph.aws4.fraud_detector": _url_spec(_ARCH, "AmazonFraudDetector.svg"),
+        "mxgraph.aws4.healthimaging": _url_spec(_ARCH, "AWSHealthImaging.svg"),
+        "mxgraph.aws4.healthlake": _url_spec(_ARCH, "AWSHealthLake.svg"),
+        "mxgraph.aws4.healthscribe": _url_spec(_ARCH, "AWSHealthScribe.svg"),
+        "mxgraph.aws4.kendra": _url_spec(_ARCH, "AmazonKendra.svg"),
+        "mxgraph.aws4.lex": _url_spec(_ARCH, "AmazonLex.svg"),
+        "mxgraph.aws4.lookout_for_equipment": _url_spec(_ARCH, "AmazonLookoutforEquipment.svg"),
+        "mxgraph.aws4.lookout_for_metrics": _url_spec(_ARCH, "AmazonLookoutforMetrics.svg"),
+        "mxgraph.aws4.lookout_for_vision": _url_spec(_ARCH, "AmazonLookoutforVision.svg"),
+        "mxgraph.aws4.machine_learning": _url_spec(_CATEGORY, "ArtificialIntelligence.svg", cover_scale=1.3),
+        "mxgraph.aws4.monitron": _url_spec(_ARCH, "AmazonMonitron.svg"),
+        "mxgraph.aws4.neuron_ml_sdk": _url_spec(_ARCH, "AWSNeuron.svg"),
+        "mxgraph.aws4.nova2": _url_spec(_ARCH, "AmazonNova.svg"),
+        "mxgraph.aws4.omics": _url_spec(_ARCH, "AWSHealthOmics.svg"),
+        "mxgraph.aws4.panorama": _url_spec(_ARCH, "AWSPanorama.svg"),
+        "mxgraph.aws4.personalize": _url_spec(_ARCH, "AmazonPersonalize.svg"),
+        "mxgraph.aws4.polly": _url_spec(_ARCH, "AmazonPolly.svg"),
+        "mxgraph.aws4.q": _url_spec(_ARCH, "AmazonQ.svg"),
+        "mxgraph.aws4.rekognition_2": _url_spec(_ARCH, "AmazonRekognition.svg"),
+        "mxgraph.aws4.sagemaker_2": _url_spec(_ARCH, "AmazonSageMaker.svg"),
+        "mxgraph.aws4.sagemaker": _url_spec(_ARCH, "AmazonSageMakerAI.svg"),
+        "mxgraph.aws4.amazon_sagemaker": _url_spec(_ARCH, "AmazonSageMaker.svg"),
+        "mxgraph.aws4.sagemaker_ground_truth": _url_spec(_ARCH, "AmazonSageMakerGroundTruth.svg"),
+        "mxgraph.aws4.sagemaker_studio_lab": _url_spec(_ARCH, "AmazonSageMakerStudioLab.svg"),
+        "mxgraph.aws4.tensorflow_on_aws": _url_spec(_ARCH, "TensorFlowonAWS.svg"),
+        "mxgraph.aws4.textract": _url_spec(_ARCH, "AmazonTextract.svg"),
+        "mxgraph.aws4.torchserve": _aws4_spec("torchserve", "#01A88D", "#FFFFFF", 70.0, 70.0),
+        "mxgraph.aws4.transcribe": _url_spec(_ARCH, "AmazonTranscribe.svg"),
+        "mxgraph.aws4.translate": _url_spec(_ARCH, "AmazonTranslate.svg"),
+        "mxgraph.aws4.rekognition_image": _url_spec(_RES, "AmazonRekognitionImage.svg"),
+        "mxgraph.aws4.rekognition_video": _url_spec(_RES, "AmazonRekognitionVideo.svg"),
+        "mxgraph.aws4.devops_guru_insights": _url_spec(_RES, "AmazonDevOpsGuruInsights.svg"),
+        "mxgraph.aws4.sagemaker_canvas": _url_spec(_RES, "AmazonSageMakerAICanvas.svg"),
+        "mxgraph.aws4.sagemaker_geospatial_ml": _url_spec(_RES, "AmazonSageMakerAIGeospatialML.svg"),
+        "mxgraph.aws4.sagemaker_model": _url_spec(_RES, "AmazonSageMakerAIModel.svg"),
+        "mxgraph.aws4.sagemaker_notebook": _url_spec(_RES, "AmazonSageMakerAINotebook.svg"),
+        "mxgraph.aws4.sagemaker_shadow_testing": _url_spec(_RES, "AmazonSageMakerAIShadowTesting.svg"),
+        "mxgraph.aws4.sagemaker_train": _url_spec(_RES, "AmazonSageMakerAITrain.svg"),
+        "mxgraph.aws4.textract_analyze_lending": _url_spec(_RES, "AmazonTextractAnalyzeLending.svg"),
+        # -------------------------------------------------------------------------
+        # AWS / Blockchain
+        # -------------------------------------------------------------------------
+        "mxgraph.aws4.blockchain": _url_spec(_CATEGORY, "Blockchain.svg", cover_scale=1.3),
+        "mxgraph.aws4.managed_blockchain": _url_spec(_ARCH, "AmazonManagedBlockchain.svg"),
+        "mxgraph.aws4.amazon_managed_blockchain": _url_spec(_ARCH, "AmazonManagedBlockchain.svg"),
+        "mxgraph.aws4.quantum_ledger_database": _url_spec(_ARCH, "AmazonQuantumLedgerDatabase.svg"),
+        "mxgraph.aws4.amazon_quantum_ledger_database": _url_spec(_ARCH, "AmazonQuantumLedgerDatabase.svg"),
+        "mxgraph.aws4.blockchain_resource": _url_spec(_RES, "AmazonManagedBlockchainBlockchain.svg"),
+        # -------------------------------------------------------------------------
+        # AWS / Business Applications
+        # -------------------------------------------------------------------------
+        "mxgraph.aws4.business_application": _url_spec(_CATEGORY, "BusinessApplications.svg", cover_scale=1.3),
+        "mxgraph.aws4.alexa_for_business": _url_spec(_ARCH, "AlexaForBusiness.svg"),
+        "mxgraph.aws4.amazon_alexa_for_business": _url_spec(_ARCH, "AlexaForBusiness.svg"),
+        "mxgraph.aws4.chime": _url_spec(_ARCH, "AmazonChime.svg"),
+        "mxgraph.aws4.amazon_chime": _url_spec(_ARCH, "AmazonChime.svg"),
+        "mxgraph.aws4.chime_sdk": _url_spec(_ARCH, "AmazonChimeSDK.svg"),
+        "mxgraph.aws4.amazon_chime_sdk": _url_spec(_ARCH, "AmazonChimeSDK.svg"),
+        "mxgraph.aws4.connect": _url_spec(_ARCH, "AmazonConnect.svg"),
+        "mxgraph.aws4.amazon_connect": _url_spec(_ARCH, "AmazonConnect.svg"),
+        "mxgraph.aws4.honeycode": _aws4_spec("honeycode", "#FFFFFF", "#FFFFFF", 68.0, 68.0),
+        "mxgraph.aws4.pinpoint": _url_spec(_ARCH, "AmazonPinpoint.svg"),
+        "mxgraph.aws4.amazon_pinpoint": _url_spec(_ARCH, "AmazonPinpoint.svg"),
+        "mxgraph.aws4.simple_email_service": _url_spec(_ARCH, "AmazonSimpleEmailService.svg"),
+        "mxgraph.aws4.amazon_simple_email_service": _url_spec(_ARCH, "AmazonSimpleEmailService.svg"),
+        "mxgraph.aws4.workdocs": _url_spec(_ARCH, "AmazonWorkDocs.svg"),
+        "mxgraph.aws4.amazon_workdocs": _url_spec(_ARCH, "AmazonWorkDocs.svg"),
+        "mxgraph.aws4.workmail": _url_spec(_ARCH, "AmazonWorkMail.svg"),
+        "mxgraph.aws4.amazon_workmail": _url_spec(_ARCH, "AmazonWorkMail.svg"),
+        "mxgraph.aws4.appfabric": _url_spec(_ARCH, "AWSAppFabric.svg"),
+        "mxgraph.aws4.aws_appfabric": _url_spec(_ARCH, "AWSAppFabric.svg"),
+        "mxgraph.aws4.end_user_messaging": _url_spec(_ARCH, "AWSEndUserMessaging.svg"),
+        "mxgraph.aws4.aws_end_user_messaging": _url_spec(_ARCH, "AWSEndUserMessaging.svg"),
+        "mxgraph.aws4.supply_chain": _url_spec(_ARCH, "AWSSupplyChain.svg"),
+        "mxgraph.aws4.aws_supply_chain": _url_spec(_ARCH, "AWSSupplyChain.svg"),
+        "mxgraph.aws4.wickr": _url_spec(_ARCH, "AWSWickr.svg"),
+        "mxgraph.aws4.aws_wickr": _url_spec(_ARCH, "AWSWickr.svg"),
+        "mxgraph.aws4.pinpoint_journey": _url_spec(_RES, "AmazonPinpointJourney.svg"),
+        # -------------------------------------------------------------------------
+        # AWS / Cloud Financial Management
+        # -------------------------------------------------------------------------
+        "mxgraph.aws4.cost_management": _url_spec(_CATEGORY, "CloudFinancialManagement.svg", cover_scale=1.3),
+        "mxgraph.aws4.application_cost_profiler": _aws4_spec("application cost profiler", "#FFFFFF", "#FFFFFF", 72.0, 72.0),
+        "mxgraph.aws4.budgets_2": _url_spec(_ARCH, "AWSBudgets.svg"),
+        "mxgraph.aws4.budgets": _url_spec(_ARCH, "AWSBudgets.svg"),
+        "mxgraph.aws4.cost_and_usage_report": _url_spec(_ARCH, "AWSCostandUsageReport.svg"),
+        "mxgraph.aws4.cost_explorer": _url_spec(_ARCH, "AWSCostExplorer.svg"),
+        "mxgraph.aws4.custom_billing_manager": _url_spec(_ARCH, "AWSBillingConductor.svg"),
+        "mxgraph.aws4.billing_conductor": _url_spec(_ARCH, "AWSBillingConductor.svg"),
+        "mxgraph.aws4.aws_billing_conductor": _url_spec(_ARCH, "AWSBillingConductor.svg"),
+        "mxgraph.aws4.reserved_instance_reporting": _url_spec(_ARCH, "ReservedInstanceReporting.svg"),
+        "mxgraph.aws4.savings_plans": _url_spec(_ARCH, "SavingsPlans.svg"),
+    }
+
+
+class _IconSpecTables(NamedTuple):
+    """Materialized aws4 icon lookup tables (see _icon_spec_tables)."""
+    # Read-only view of the spec table.
+    specs: Mapping[str, Union[_UrlSpec, _Aws4Spec]]
+    # Hot-path lookup bound to the plain dict (a proxy's .get adds an indirection).
+    get: Callable[[str], Optional[Union[_UrlSpec, _Aws4Spec]]]
+    # Legacy amazon_* fallback: shape/resIcon suffix -> existing "mxgraph.aws4.amazon_<suffix>" key.
+    amazon_alias_key_by_suffix: Dict[str, str]
+    # Shape types that have composed "<shape>|<resIcon>" keys (draw.io's resourceIcon).
+    resource_icon_shape_types: FrozenSet[str]
+
+
+@functools.lru_cache(maxsize=None)
+def _icon_spec_tables() -> _IconSpecTables:
+    """
+    Build the aws4 icon lookup tables on first use.
+
+    Conversions without AWS shapes never pay for the ~330 table entries.
+    """
+    specs = {sys.intern(k): v for k, v in _build_icon_spec_table().items()}
+    amazon_alias_key_by_suffix = {
+        k[len("mxgraph.aws4.amazon_"):]: k
+        for k in specs
+        if k.startswith("mxgraph.aws4.amazon_")
+    }
+    resource_icon_shape_types = frozenset(k.partition("|")[0] for k in specs if "|" in k)
+    return _IconSpecTables(
+        MappingProxyType(specs),
+        specs.get,
+        amazon_alias_key_by_suffix,
+        resource_icon_shape_types,
+    )
+
+
+@functools.lru_cache(maxsize=2048)
+def _normalize_drawio_aws_value_cached(value: str) -> Optional[str]:
+    norm = value.strip().lower()
+    return sys.intern(norm) if norm else None
 
 
 def _normalize_drawio_aws_value(value: Optional[str]) -> Optional[str]:
     if not value:
         return None
-    norm = value.strip().lower()
-    return norm or None
+    return _normalize_drawio_aws_value_cached(value)
+
+# Interned like normalized shape types, so membership tests can hit on identity.
+_AWS4_GROUP_SHAPE_TYPES = frozenset(map(sys.intern, ("mxgraph.aws4.group", "mxgraph.aws4.groupcenter")))
 
-_AWS4_GROUP_CONFIG: Dict[str, object] = {
-    "shape_types": {"mxgraph.aws4.group", "mxgraph.aws4.groupcenter"},
-    "icons": {
+# Values are a fixed entry or, for variant lists, a compiled match(label, fill) matcher.
+_GroupIconMatcher = Callable[[str, str], _GroupIconEntry]
+_AWS4_GROUP_ICONS: Dict[str, Union[_GroupIconEntry, List[_GroupIconEntry], _GroupIconMatcher]] = {
     # AWS group/container icon overlays (draw.io style key: grIcon=mxgraph.aws4.group_*)
     # mxgraph.aws4.group_aws_cloud_alt is the "AWS" text variant in draw.io.
-    "mxgraph.aws4.group_aws_cloud_alt": _group_icon_spec(f"{_GROUP}/AWSCloudlogo.svg"),
-    "mxgraph.aws4.group_aws_cloud": _group_icon_spec(f"{_GROUP}/AWSCloud.svg"),
-    "mxgraph.aws4.group_region": _group_icon_spec(f"{_GROUP}/Region.svg"),
+    "mxgraph.aws4.group_aws_cloud_alt": _group_icon_spec(_GROUP, "AWSCloudlogo.svg"),
+    "mxgraph.aws4.group_aws_cloud": _group_icon_spec(_GROUP, "AWSCloud.svg"),
+    "mxgraph.aws4.group_region": _group_icon_spec(_GROUP, "Region.svg"),
     "mxgraph.aws4.group_auto_scaling_group": _group_icon_spec(
-        f"{_GROUP}/AutoScalinggroup.svg",
+        _GROUP, "AutoScalinggroup.svg",
         padding_color_mode="icon",
     ),
-    "mxgraph.aws4.group_vpc2": _group_icon_spec(f"{_GROUP}/VirtualprivatecloudVPC.svg"),
+    "mxgraph.aws4.group_vpc2": _group_icon_spec(_GROUP, "VirtualprivatecloudVPC.svg"),
     # draw.io uses group_security_group for both public/private subnets.
     # Listed in priority order; last entry is the unconditional default.
     "mxgraph.aws4.group_security_group": [
-        _group_icon_spec(f"{_GROUP}/Publicsubnet.svg", match_label="public", match_fill="#f2f6e8"),
-        _group_icon_spec(f"{_GROUP}/Privatesubnet.svg"),  # default
+        _group_icon_spec(_GROUP, "Publicsubnet.svg", match_label="public", match_fill="#f2f6e8"),
+        _group_icon_spec(_GROUP, "Privatesubnet.svg"),  # default
     ],
-    "mxgraph.aws4.group_on_premise": _group_icon_spec(f"{_GROUP}/Servercontents.svg"),
-    "mxgraph.aws4.group_corporate_data_center": _group_icon_spec(f"{_GROUP}/Corporatedatacenter.svg"),
+    "mxgraph.aws4.group_on_premise": _group_icon_spec(_GROUP, "Servercontents.svg"),
+    "mxgraph.aws4.group_corporate_data_center": _group_icon_spec(_GROUP, "Corporatedatacenter.svg"),
     "mxgraph.aws4.group_elastic_beanstalk": _group_icon_spec(
-        f"{_ARCH}/AWSElasticBeanstalk.svg",
+        _ARCH, "AWSElasticBeanstalk.svg",
         padding_color_mode="icon",
     ),
     "mxgraph.aws4.group_ec2_instance_contents": _group_icon_spec(
-        f"{_GROUP}/EC2instancecontents.svg",
+        _GROUP, "EC2instancecontents.svg",
         padding_color_mode="icon",
     ),
     "mxgraph.aws4.group_spot_fleet": _group_icon_spec(
-        f"{_GROUP}/SpotFleet.svg",
+        _GROUP, "SpotFleet.svg",
         padding_color_mode="icon",
     ),
     "mxgraph.aws4.group_aws_step_functions_workflow": _group_icon_spec(
-        f"{_ARCH}/AWSStepFunctions.svg",
+        _ARCH, "AWSStepFunctions.svg",
         padding_color_mode="icon",
     ),
     "mxgraph.aws4.group_account": _group_icon_spec(
-        f"{_GROUP}/AWSAccount.svg",
+        _GROUP, "AWSAccount.svg",
         padding_color_mode="icon",
     ),
-    "mxgraph.aws4.group_iot_greengrass_deployment": _group_icon_spec(f"{_GROUP}/AWSIoTGreengrassDeployment.svg"),
-    "mxgraph.aws4.group_iot_greengrass": _group_icon_spec(f"{_ARCH}/AWSIoTGreengrass.svg"),
-    },
+    "mxgraph.aws4.group_iot_greengrass_deployment": _group_icon_spec(_GROUP, "AWSIoTGreengrassDeployment.svg"),
+    "mxgraph.aws4.group_iot_greengrass": _group_icon_spec(_ARCH, "AWSIoTGreengrass.svg"),
 }
+def _compile_variant_list(entries: List[_GroupIconEntry]) -> _GroupIconMatcher:
+    """
+    Compile a priority-ordered variant list into match(label, fill) -> entry.
 
-_AWS4_GROUP_SHAPE_TYPES = cast(Set[str], _AWS4_GROUP_CONFIG["shape_types"])
-_AWS4_GROUP_ICONS = cast(Dict[str, object], _AWS4_GROUP_CONFIG["icons"])
+    label/fill must already be lowercased. Entries without match_label/match_fill
+    match unconditionally; the last entry is the fallback.
+    """
+    # Entries after the first unconditional one can never match, so the loop
+    # only has to test the conditional entries before it.
+    conditional = []
+    default = entries[-1]
+    for e in entries:
+        if not (e.match_label or e.match_fill):
+            default = e
+            break
+        conditional.append((e.match_label, e.match_fill, e))
+    rules = tuple(conditional)
+
+    def match(label: str, fill: str) -> _GroupIconEntry:
+        for match_label, match_fill, entry in rules:
+            if (match_label and match_label in label) or (match_fill and match_fill == fill):
+                return entry
+        return default
+
+    return match
+
+
+# Variant lists are replaced by their compiled matcher.
+_AWS4_GROUP_ICONS.update({
+    k: _compile_variant_list(v)
+    for k, v in _AWS4_GROUP_ICONS.items()
+    if isinstance(v, list)
+})
+# Compatibility: accept short form "group_*" grIcon values as aliases of the full draw.io key.
+_AWS4_GROUP_ICONS.update({
+    k[len("mxgraph.aws4."):]: v
+    for k, v in list(_AWS4_GROUP_ICONS.items())
+    if k.startswith("mxgraph.aws4.group_")
+})
+# grIcon values are looked up after _normalize_drawio_aws_value(), which interns them.
+_AWS4_GROUP_ICONS = {sys.intern(k): v for k, v in _AWS4_GROUP_ICONS.items()}
+
+
+# ImageData shared per (ref, cover_scale) while any shape still references it.
+# Weak values keep batch conversions from pinning every icon ever resolved.
+_IMAGE_DATA_CACHE: "weakref.WeakValueDictionary[Tuple[str, Optional[float]], ImageData]" = (
+    weakref.WeakValueDictionary()
+)
 
 
-def _spec_cover_scale(spec: tuple) -> Optional[float]:
-    if len(spec) < 3:
-        return None
-    meta = spec[-1] if isinstance(spec[-1], dict) else None
-    if not meta:
-        return None
-    value = meta.get("cover_scale")
-    if value is None:
-        return None
-    try:
-        scale = float(value)
-    except Exception:
-        return None
-    return scale if scale > 1.0 else None
-
+def _image_data_from_ref(ref: str, *, cover_scale: Optional[float] = None) -> ImageData:
+    """
+    Build ImageData from URL/data URI.
 
-def _image_data_from_ref(ref: str, *, cover_scale: Optional[float] = None):
-    """Build ImageData from URL/data URI."""
-    from ..model.intermediate import ImageData
+    Instances are shared between shapes resolving the same ref (see _IMAGE_DATA_CACHE);
+    callers must treat them as read-only.
+    """
+    cache_key = (ref, cover_scale)
+    image_data = _IMAGE_DATA_CACHE.get(cache_key)
+    if image_data is not None:
+        return image_data
 
     if ref.startswith("data:image/"):
-        return ImageData(data_uri=ref, cover_scale=cover_scale)
-    return ImageData(file_path=ref, cover_scale=cover_scale)
+        image_data = ImageData(data_uri=ref, cover_scale=cover_scale)
+    else:
+        image_data = ImageData(file_path=ref, cover_scale=cover_scale)
+    _IMAGE_DATA_CACHE[cache_key] = image_data
+    return image_data
 
 
 def resolve_aws_group_metadata(
@@ -571,45 +778,30 @@ def resolve_aws_group_metadata(
       - group_icon_padding_color_mode: Optional[str] ("stroke"|"icon")
     """
     shape_type_lower = (shape_type or "").strip().lower()
-    vertical_align = (_get_style_value(style_str, "verticalAlign") or "").strip().lower()
+    style = _parse_style(style_str) if style_str else _EMPTY_STYLE
+    vertical_align = style.get("verticalAlign", "").lower()
     apply_text_padding = (shape_type_lower in _AWS4_GROUP_SHAPE_TYPES) or (vertical_align == "top")
 
     group_key = None
     icon_cfg = None
     if shape_type_lower in _AWS4_GROUP_SHAPE_TYPES:
-        group_key = _normalize_drawio_aws_value(_get_style_value(style_str, "grIcon"))
+        group_key = _normalize_drawio_aws_value(style.get("grIcon"))
         if group_key:
             entry = _AWS4_GROUP_ICONS.get(group_key)
-            # Compatibility: accept short form "group_*" and expand to full draw.io key.
-            if entry is None and "." not in group_key:
-                entry = _AWS4_GROUP_ICONS.get(f"mxgraph.aws4.{group_key}")
-            if isinstance(entry, list):
+            if callable(entry):
                 label = (label_text or "").lower()
-                fill = (_get_style_value(style_str, "fillColor") or "").lower()
-                icon_cfg = next(
-                    (e for e in entry if
-                        not (e.get("match_label") or e.get("match_fill"))
-                        or (e.get("match_label") and e["match_label"] in label)
-                        or (e.get("match_fill") and e["match_fill"] == fill)
-                    ),
-                    entry[-1],
-                )
+                fill = style.get("fillColor", "").lower()
+                icon_cfg = entry(label, fill)
             else:
                 icon_cfg = entry
 
     icon_data = None
     padding_ratio = None
     padding_color_mode = None
-    if icon_cfg:
-        ref = icon_cfg["spec"][1]
-        cover_scale = icon_cfg.get("cover_scale")
-        icon_data = _image_data_from_ref(
-            ref,
-            cover_scale=float(cover_scale) if cover_scale is not None else None,
-        )
-        pr = icon_cfg.get("padding_ratio")
-        padding_ratio = float(pr) if pr is not None else None
-        padding_color_mode = str(icon_cfg.get("padding_color_mode", "stroke"))
+    if icon_cfg is not None:
+        icon_data = _image_data_from_ref(icon_cfg.spec.ref, cover_scale=icon_cfg.cover_scale)
+        padding_ratio = icon_cfg.padding_ratio
+        padding_color_mode = icon_cfg.padding_color_mode
 
     return {
         "apply_text_padding": bool(apply_text_padding),
@@ -620,64 +812,81 @@ def resolve_aws_group_metadata(
     }
 
 
-def _drawio_lookup_keys(shape_type: str, res_icon: Optional[str]) -> List[tuple[str, Optional[str]]]:
+def _drawio_lookup_keys(shape_type: str, res_icon: Optional[str]) -> Tuple[str, ...]:
     """
-    Build draw.io-native lookup keys ordered by priority.
+    Build draw.io-native lookup keys ordered by priority (duplicates removed).
 
     Primary:
-      - direct shape key: (shape, None)
-      - resourceIcon key: (shape=...resourceIcon, resIcon=...)
+      - direct shape key: "shape"
+      - resourceIcon key: "shape=...resourceIcon|resIcon=..."
     Compatibility fallback:
       - resIcon as direct shape
       - amazon_* alias shapes
     """
     shape_type_norm = _normalize_drawio_aws_value(shape_type)
-    res_icon_norm = _normalize_drawio_aws_value(res_icon)
     if not shape_type_norm or not is_aws_shape_type(shape_type_norm):
-        return []
+        return ()
+    keys = _iter_lookup_keys(
+        shape_type_norm, _normalize_drawio_aws_value(res_icon), _icon_spec_tables()
+    )
+    # dict.fromkeys drops duplicates while keeping priority order.
+    return tuple(dict.fromkeys(keys))
+
 
-    keys: List[tuple[str, Optional[str]]] = []
-    is_resource_icon_shape = "resourceicon" in shape_type_norm
+def _iter_lookup_keys(
+    shape_type_norm: str,
+    res_icon_norm: Optional[str],
+    tables: "_IconSpecTables",
+) -> Iterator[str]:
+    """
+    Lazily yield _drawio_lookup_keys() candidates for already-normalized AWS values.
 
-    if is_resource_icon_shape and res_icon_norm:
-        keys.append((shape_type_norm, res_icon_norm))
+    Fallback keys are only computed when the caller asks for them, so the common
+    direct hit skips the alias lookups. Duplicates may be yielded (a repeated miss
+    is harmless for lookups).
+    """
+    if res_icon_norm and shape_type_norm in tables.resource_icon_shape_types:
+        yield _compose_key(shape_type_norm, res_icon_norm)
     else:
-        keys.append((shape_type_norm, None))
+        yield shape_type_norm
 
-    # Fallback: if resIcon exists, try the resIcon shape directly.
+    alias_get = tables.amazon_alias_key_by_suffix.get
+    # Fallback: try the resIcon shape directly, then its amazon_* alias.
     if res_icon_norm:
-        keys.append((res_icon_norm, None))
-        icon_suffix = res_icon_norm.split(".")[-1] if "." in res_icon_norm else res_icon_norm
-        if icon_suffix:
-            keys.append((f"mxgraph.aws4.amazon_{icon_suffix}", None))
-
+        yield res_icon_norm
+        res_alias = alias_get(res_icon_norm.rpartition(".")[2])
+        if res_alias:
+            yield res_alias
     # Fallback: try amazon_<shape_suffix> for legacy compatibility.
-    shape_suffix = shape_type_norm.split(".")[-1] if "." in shape_type_norm else shape_type_norm
-    if shape_suffix:
-        keys.append((f"mxgraph.aws4.amazon_{shape_suffix}", None))
-
-    # Keep order while removing duplicates.
-    deduped: List[tuple[str, Optional[str]]] = []
-    seen = set()
-    for k in keys:
-        if k in seen:
-            continue
-        seen.add(k)
-        deduped.append(k)
-    return deduped
+    shape_alias = alias_get(shape_type_norm.rpartition(".")[2])
+    if shape_alias:
+        yield shape_alias
+
+
+_EMPTY_STYLE: Mapping[str, str] = MappingProxyType({})
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_style(style_str: str) -> Mapping[str, str]:
+    """
+    Parse a draw.io style string into a read-only {key: stripped value} mapping.
+
+    The first occurrence of a key wins. Results are cached per style string and
+    shared between callers, hence the read-only view.
+    """
+    style: Dict[str, str] = {}
+    for part in style_str.split(";"):
+        k, sep, v = part.partition("=")
+        if sep:
+            style.setdefault(k.strip(), v.strip())
+    return MappingProxyType(style)
 
 
 def _get_style_value(style_str: Optional[str], key: str) -> Optional[str]:
     """Extract a single style value from draw.io style string."""
     if not style_str:
         return None
-    for part in style_str.split(";"):
-        if "=" in part:
-            k, v = part.split("=", 1)
-            if k.strip() == key:
-                value = v.strip()
-                return value or None
-    return None
+    return _parse_style(style_str).get(key) or None
 
 
 def get_aws_icon_data_uri(
@@ -709,88 +918,89 @@ def get_aws_icon_image_data(
 
     Returns:
         ImageData with file_path set if the icon is found, else None.
+        Instances are shared while referenced (see _IMAGE_DATA_CACHE); treat them as read-only.
     """
-    from ..model.intermediate import ImageData
-
     if not is_aws_shape_type(shape_type):
         return None
+    return _resolve_aws_icon_image_data(shape_type, style_str or None)
+
+
+@functools.lru_cache(maxsize=1024)
+def _classify_aws_shape(shape_type: str) -> Tuple[Optional[str], str, Optional[str]]:
+    """
+    Classify an AWS shape type once per distinct string.
+
+    Returns (normalized shape type, kind, illustration stencil name) where kind is
+    "group", "resourceicon", "direct" or "unknown" (blank). The illustration name (e.g. "illustration users")
+    is set for "..._illustration_*" shapes, matched case-sensitively as draw.io writes them.
+    """
+    # Normalized once here; helpers take the lowercased value as-is.
+    shape_type_norm = _normalize_drawio_aws_value(shape_type)
+    if not shape_type_norm:
+        return None, "unknown", None
+    if shape_type_norm in _AWS4_GROUP_SHAPE_TYPES:
+        return shape_type_norm, "group", None
+    if shape_type_norm in _icon_spec_tables().resource_icon_shape_types:
+        kind = "resourceicon"
+    else:
+        kind = "direct"
+    shape_suffix = shape_type.rpartition(".")[2]
+    illustration_name = shape_suffix.replace("_", " ") if shape_suffix.startswith("illustration_") else None
+    return shape_type_norm, kind, illustration_name
+
+
+def _resolve_aws_icon_image_data(shape_type: str, style_str: Optional[str]):
+    """
+    Body of get_aws_icon_image_data().
 
-    shape_type_lower = shape_type.lower()
+    Not memoized itself: the classification, style parse and stencil render below are
+    cached, and the resulting ImageData is owned by the weak _IMAGE_DATA_CACHE so it is
+    released once no shape references it.
+    """
+    shape_type_norm, kind, illustration_name = _classify_aws_shape(shape_type)
     # aws4 group/groupCenter should be rendered as container + small overlay icon.
     # Do not resolve them as full-size shape images here.
-    if shape_type_lower in _AWS4_GROUP_SHAPE_TYPES:
+    if kind in ("group", "unknown"):
         return None
 
-    is_resource_icon_shape = "resourceicon" in shape_type_lower
-    res_icon = _get_style_value(style_str, "resIcon")
-    drawio_keys = _drawio_lookup_keys(shape_type_lower, res_icon)
-    if not drawio_keys:
-        return None
+    tables = _icon_spec_tables()
+    is_resource_icon_shape = kind == "resourceicon"
+    style = _parse_style(style_str) if style_str else _EMPTY_STYLE
+    res_icon_norm = _normalize_drawio_aws_value(style.get("resIcon"))
+    drawio_keys = _iter_lookup_keys(shape_type_norm, res_icon_norm, tables)
 
     # 0) Draw.io-native dictionary lookup (shape or shape+resIcon).
+    # Each spec kind resolves itself; aws4 stencils may fail when aws4.xml is unavailable.
+    spec_get = tables.get
     for k in drawio_keys:
-        spec = _AWS4_ICON_SPEC_BY_DRAWIO_KEY.get(k)
-        if not spec:
-            continue
-        cover_scale = _spec_cover_scale(spec)
-        if spec[0] == "aws4xml":
-            shape_name = spec[1]
-            bg_hex = spec[2]
-            fg_hex = spec[3]
-            canvas_w = spec[4]
-            canvas_h = spec[5]
-            effective_bg_hex = bg_hex
-            effective_bg_gradient_hex = None
-            effective_gradient_direction = None
-            effective_fg_hex = fg_hex
-            if is_resource_icon_shape:
-                style_fill = _get_style_value(style_str, "fillColor")
-                if style_fill and style_fill.lower() != "none":
-                    effective_bg_hex = style_fill
-                style_gradient = _get_style_value(style_str, "gradientColor")
-                if style_gradient and style_gradient.lower() != "none":
-                    effective_bg_gradient_hex = style_gradient
-                    effective_gradient_direction = _get_style_value(style_str, "gradientDirection")
-            # AWS / Illustration should follow draw.io fillColor for foreground tone.
-            if shape_name.startswith("illustration "):
-                style_fill = _get_style_value(style_str, "fillColor")
-                if style_fill and style_fill.lower() != "none":
-                    effective_fg_hex = style_fill
-            data_uri = _build_shape_data_uri_from_aws4(
-                shape_name=shape_name,
-                background_hex=effective_bg_hex,
-                background_gradient_hex=effective_bg_gradient_hex,
-                gradient_direction=effective_gradient_direction,
-                foreground_hex=effective_fg_hex,
-                canvas_w=canvas_w,
-                canvas_h=canvas_h,
-            )
-            if data_uri:
-                return ImageData(data_uri=data_uri, cover_scale=cover_scale)
-            continue
-        ref = spec[1]
-        return _image_data_from_ref(ref, cover_scale=cover_scale)
+        spec = spec_get(k)
+        if spec is not None:
+            image_data = spec.resolve(style, is_resource_icon_shape)
+            if image_data is not None:
+                return image_data
 
     # 2) Dynamic fallback for AWS / Illustration (e.g. mxgraph.aws4.illustration_users).
     # Source sample: sample/AWS_Illustraion.drawio
     # These stencils are present in aws4.xml but not consistently available as static SVG files.
-    shape_suffix = shape_type.split(".")[-1] if "." in shape_type else shape_type
-    if shape_suffix.startswith("illustration_"):
-        shape_name = shape_suffix.replace("_", " ")
-        fg = _get_style_value(style_str, "fillColor") or "#879196"
+    if illustration_name:
+        fg = style.get("fillColor") or "#879196"
         data_uri = _build_shape_data_uri_from_aws4(
-            shape_name=shape_name,
+            shape_name=illustration_name,
             background_hex="none",
             foreground_hex=fg,
             canvas_w=100.0,
             canvas_h=100.0,
         )
         if data_uri:
-            return ImageData(data_uri=data_uri)
+            return _image_data_from_ref(data_uri)
 
     return None
 
 
+_SVG_DATA_URI_PREFIX = b"data:image/svg+xml;base64,"
+
+
+@functools.lru_cache(maxsize=4096)
 def _build_shape_data_uri_from_aws4(
     *,
     shape_name: str,
@@ -803,6 +1013,8 @@ def _build_shape_data_uri_from_aws4(
 ) -> Optional[str]:
     """
     Build a data URI by fetching an aws4.xml shape and drawing it on a canvas.
+
+    Cached per argument set, so a stencil/color/canvas combination is rendered once.
     """
     spec = _fetch_shape_spec_from_aws4(shape_name)
     if not spec:
@@ -841,8 +1053,21 @@ def _build_shape_data_uri_from_aws4(
         f'<path d="{path_d}" transform="translate({offset_x:.3f} {offset_y:.3f})" fill="{foreground_hex}" fill-rule="evenodd"/>'
         "</svg>"
     )
-    encoded = base64.b64encode(svg.encode("utf-8")).decode("ascii")
-    return f"data:image/svg+xml;base64,{encoded}"
+    return _svg_data_uri(svg)
+
+
+def _svg_data_uri(svg: str) -> str:
+    """Base64 data URI for an SVG document."""
+    return (_SVG_DATA_URI_PREFIX + base64.b64encode(svg.encode("utf-8"))).decode("ascii")
+
+
+# draw.io gradientDirection -> SVG linearGradient (x1, y1, x2, y2); south is the default.
+_SVG_GRADIENT_VECTORS: Dict[str, Tuple[float, float, float, float]] = {
+    "north": (0.0, 1.0, 0.0, 0.0),
+    "south": (0.0, 0.0, 0.0, 1.0),
+    "east": (0.0, 0.0, 1.0, 0.0),
+    "west": (1.0, 0.0, 0.0, 0.0),
+}
 
 
 def _svg_gradient_vector_for_drawio_direction(direction: Optional[str]) -> tuple[float, float, float, float]:
@@ -850,97 +1075,141 @@ def _svg_gradient_vector_for_drawio_direction(direction: Optional[str]) -> tuple
     Convert draw.io gradientDirection to SVG linearGradient vector.
     draw.io uses fillColor + gradientColor, where gradientDirection points to the gradientColor side.
     """
-    direction_norm = (direction or "").strip().lower()
-    if direction_norm == "north":
-        return (0.0, 1.0, 0.0, 0.0)
-    if direction_norm == "south":
-        return (0.0, 0.0, 0.0, 1.0)
-    if direction_norm == "east":
-        return (0.0, 0.0, 1.0, 0.0)
-    if direction_norm == "west":
-        return (1.0, 0.0, 0.0, 0.0)
-    return (0.0, 0.0, 0.0, 1.0)
+    return _SVG_GRADIENT_VECTORS.get((direction or "").strip().lower(), _SVG_GRADIENT_VECTORS["south"])
 
 
-def _fetch_shape_spec_from_aws4(shape_name: str) -> Optional[tuple[str, float, float]]:
+# aws4.xml stencil patterns (compiled once; used for every indexed shape / path command).
+# Shape-level patterns run on the raw file bytes so the whole stencil is never decoded.
+_RE_SHAPE = re.compile(rb"<shape\b([^>]*)>(.*?)</shape>", re.IGNORECASE | re.DOTALL)
+_RE_NAME = re.compile(rb'\bname="([^"]+)"')
+_RE_W = re.compile(rb'\bw="([^"]+)"')
+_RE_H = re.compile(rb'\bh="([^"]+)"')
+_RE_PATH = re.compile(rb"<path>(.*?)</path>", re.IGNORECASE | re.DOTALL)
+_RE_PATH_CMD = re.compile(r"<(move|line|curve|arc|close)\b([^>]*)/?>", re.IGNORECASE)
+_RE_ATTR = re.compile(r'(\w[\w-]*)="([^"]+)"')
+
+
+@functools.lru_cache(maxsize=1)
+def _get_aws4_xml_bytes() -> Optional[bytes]:
     """
-    Fetch and parse shape path data from draw.io official aws4.xml.
+    Load draw.io official aws4.xml once per process.
+
+    A failed load is cached too (as None), so an unreachable stencil URL is tried
+    once instead of once per shape. Use _reset_aws4_cache() to retry.
     """
-    from ..media.image_utils import load_image_bytes
+    return image_utils.load_image_bytes(file_path=_AWS4_STENCIL_XML_URL) or None
+
+
+def _reset_aws4_cache() -> None:
+    """Drop the loaded aws4.xml and everything derived from it (mainly for tests)."""
+    _get_aws4_xml_bytes.cache_clear()
+    _aws4_shape_index.cache_clear()
+    _fetch_shape_spec_from_aws4.cache_clear()
+    _build_shape_data_uri_from_aws4.cache_clear()
 
-    xml_bytes = load_image_bytes(file_path=_AWS4_STENCIL_XML_URL)
+
+@functools.lru_cache(maxsize=1)
+def _aws4_shape_index() -> Dict[bytes, Tuple[bytes, float, float]]:
+    """
+    Index every aws4.xml stencil shape as {lowercased raw name: (raw <path> body, w, h)}.
+
+    Built in a single pass over the stencil file; shapes without a usable w/h or
+    <path> are skipped and the first shape wins when names collide (case-insensitively).
+    Nothing is decoded here; path bodies are parsed when a shape is fetched.
+    """
+    xml_bytes = _get_aws4_xml_bytes()
     if not xml_bytes:
-        return None
-    xml_text = xml_bytes.decode("utf-8", errors="ignore")
+        return {}
+
+    index: Dict[bytes, Tuple[bytes, float, float]] = {}
+    for shape_match in _RE_SHAPE.finditer(xml_bytes):
+        shape_tag = shape_match.group(1)
+        name_match = _RE_NAME.search(shape_tag)
+        w_match = _RE_W.search(shape_tag)
+        h_match = _RE_H.search(shape_tag)
+        if not name_match or not w_match or not h_match:
+            continue
+        try:
+            shape_w = float(w_match.group(1))
+            shape_h = float(h_match.group(1))
+        except ValueError:
+            continue
+        path_body = _aws4_path_body(xml_bytes, shape_match.start(2), shape_match.end(2))
+        if path_body is None:
+            continue
+        index.setdefault(name_match.group(1).lower(), (path_body, shape_w, shape_h))
+    return index
 
-    shape_match = re.search(
-        rf'(<shape[^>]*name="{re.escape(shape_name)}"[^>]*>)(.*?)</shape>',
-        xml_text,
-        re.IGNORECASE | re.DOTALL,
-    )
-    if not shape_match:
-        return None
 
-    shape_tag = shape_match.group(1)
-    shape_body = shape_match.group(2)
-    w_match = re.search(r'\bw="([^"]+)"', shape_tag)
-    h_match = re.search(r'\bh="([^"]+)"', shape_tag)
-    if not w_match or not h_match:
-        return None
-    try:
-        shape_w = float(w_match.group(1))
-        shape_h = float(h_match.group(1))
-    except ValueError:
+def _aws4_path_body(xml_bytes: bytes, start: int, end: int) -> Optional[bytes]:
+    """Return the <path> body inside xml_bytes[start:end] without copying the shape body."""
+    # aws4.xml writes <path> in lowercase; literal finds avoid the regex engine, which
+    # is kept only for differently-cased markup.
+    path_start = xml_bytes.find(b"<path>", start, end)
+    path_end = xml_bytes.find(b"</path>", path_start, end) if path_start != -1 else -1
+    if path_end != -1:
+        return xml_bytes[path_start + len(b"<path>"):path_end]
+    path_match = _RE_PATH.search(xml_bytes, start, end)
+    return path_match.group(1) if path_match else None
+
+
+@functools.lru_cache(maxsize=None)
+def _fetch_shape_spec_from_aws4(shape_name: str) -> Optional[tuple[str, float, float]]:
+    """
+    Fetch and parse shape path data from draw.io official aws4.xml.
+
+    Results are cached per shape name as plain (path_d, w, h) tuples.
+    """
+    indexed = _aws4_shape_index().get(shape_name.lower().encode("utf-8"))
+    if indexed is None:
         return None
+    path_body, shape_w, shape_h = indexed
 
-    path_match = re.search(
-        r"<path>(.*?)</path>", shape_body, re.IGNORECASE | re.DOTALL
-    )
-    if not path_match:
+    tokens = _aws4_path_tokens(path_body.decode("utf-8", errors="ignore"))
+    if not tokens:
         return None
+    return " ".join(tokens), shape_w, shape_h
 
-    commands: List[str] = []
-    for tag, attrs in re.findall(
-        r"<(move|line|curve|arc|close)\b([^>]*)/?>", path_match.group(1), re.IGNORECASE
-    ):
+
+def _aws4_path_tokens(path_body: str) -> List[str]:
+    """
+    Convert the children of an aws4.xml <path> element into flat SVG path tokens.
+
+    e.g. ["M", "0", "0", "L", "5", "5", "Z"]; callers join them with single spaces.
+    """
+    tokens: List[str] = []
+    try:
+        root = ET.fromstring(f"<path>{path_body}</path>")
+    except ET.XMLSyntaxError:
+        root = None
+    if root is not None:
+        # Filtering to elements in lxml skips comments/PIs without a per-child type check.
+        for el in root.iterchildren(ET.Element):
+            _append_aws4_path_tokens(tokens, el.tag.lower(), el.attrib)
+        return tokens
+
+    # Malformed stencil markup: fall back to tolerant regex scanning.
+    for tag, attrs in _RE_PATH_CMD.findall(path_body):
         tag = tag.lower()
-        kv = dict(re.findall(r'(x1|y1|x2|y2|x3|y3|x|y)="([^"]+)"', attrs))
-        if tag == "move" and "x" in kv and "y" in kv:
-            commands.append(f'M {kv["x"]} {kv["y"]}')
-        elif tag == "line" and "x" in kv and "y" in kv:
-            commands.append(f'L {kv["x"]} {kv["y"]}')
-        elif tag == "curve" and all(
-            k in kv for k in ("x1", "y1", "x2", "y2", "x3", "y3")
-        ):
-            commands.append(
-                f'C {kv["x1"]} {kv["y1"]} {kv["x2"]} {kv["y2"]} {kv["x3"]} {kv["y3"]}'
-            )
-        elif tag == "arc":
-            arc_kv = dict(
-                re.findall(
-                    r'(rx|ry|x-axis-rotation|large-arc-flag|sweep-flag|x|y)="([^"]+)"',
-                    attrs,
-                )
-            )
-            if all(
-                k in arc_kv
-                for k in (
-                    "rx",
-                    "ry",
-                    "x-axis-rotation",
-                    "large-arc-flag",
-                    "sweep-flag",
-                    "x",
-                    "y",
-                )
-            ):
-                commands.append(
-                    f'A {arc_kv["rx"]} {arc_kv["ry"]} {arc_kv["x-axis-rotation"]} '
-                    f'{arc_kv["large-arc-flag"]} {arc_kv["sweep-flag"]} {arc_kv["x"]} {arc_kv["y"]}'
-                )
-        elif tag == "close":
-            commands.append("Z")
-
-    if not commands:
-        return None
-    return " ".join(commands), shape_w, shape_h
+        _append_aws4_path_tokens(tokens, tag, dict(_RE_ATTR.findall(attrs)))
+    return tokens
+
+
+# aws4.xml path command -> (SVG command letter, required attributes in SVG argument order).
+_AWS4_PATH_COMMANDS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "move": ("M", ("x", "y")),
+    "line": ("L", ("x", "y")),
+    "curve": ("C", ("x1", "y1", "x2", "y2", "x3", "y3")),
+    "arc": ("A", ("rx", "ry", "x-axis-rotation", "large-arc-flag", "sweep-flag", "x", "y")),
+    "close": ("Z", ()),
+}
+
+
+def _append_aws4_path_tokens(tokens: List[str], tag: str, kv: Mapping[str, str]) -> None:
+    command = _AWS4_PATH_COMMANDS.get(tag)
+    if command is None:
+        return
+    letter, attr_names = command
+    if all(k in kv for k in attr_names):
+        tokens.append(letter)
+        tokens.extend(kv[k] for k in attr_names)
@@ -0,0 +1,19 @@
+"""Analysis fixtures: presentations parsed once and shared read-only."""
+
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from pptx import Presentation
+
+
+@pytest.fixture(scope="class")
+def loaded_prs(sample_pptx_path: Path) -> Presentation:
+    """sample_pptx_path parsed once per test class; tests must not modify it."""
+    return Presentation(str(sample_pptx_path))
+
+
+@pytest.fixture(scope="class")
+def text_shapes(loaded_prs: Presentation) -> List[Any]:
+    """Shapes on the first slide of loaded_prs that have a text frame."""
+    return [s for s in loaded_prs.slides[0].shapes if getattr(s, "has_text_frame", False)]
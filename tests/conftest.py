@@ -1,14 +1,26 @@
-"""Shared fixtures: project root and sample paths."""
+"""Shared fixtures: project root, sample paths and converted samples."""
 
+import zipfile
 from pathlib import Path
+from typing import Any, List, Optional, Tuple
 
 import pytest
+from pptx import Presentation
+
+from drawio2pptx.io.drawio_loader import DrawIOLoader
+from drawio2pptx.io.pptx_writer import PPTXWriter
 
 # Repository root (drawio2pptx/)
 ROOT_DIR = Path(__file__).resolve().parent.parent
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def _warmup_pptx() -> None:
+    """Load python-pptx's default template once so the first test does not pay for it."""
+    Presentation()
+
+
+@pytest.fixture(scope="session")
 def sample_dir() -> Path:
     """Path to the sample/ directory."""
     return ROOT_DIR / "sample"
@@ -41,11 +53,85 @@ def timeline3_drawio_path(sample_dir: Path) -> Path:
     return path
 
 
-@pytest.fixture
+def _find_sample_pptx(sample_dir: Path) -> Optional[Path]:
+    candidates = (
+        sample_dir / "sample.pptx",
+        sample_dir / "flowchart.pptx",
+        ROOT_DIR / "test_output.pptx",
+        ROOT_DIR / "output.pptx",
+    )
+    return next((path for path in candidates if path.is_file()), None)
+
+
+@pytest.fixture(scope="session")
 def sample_pptx_path(sample_dir: Path) -> Path:
     """Path to a sample PPTX: sample/sample.pptx, flowchart.pptx, or ROOT test_output/output.pptx."""
-    for name in ("sample.pptx", "flowchart.pptx", "test_output.pptx", "output.pptx"):
-        path = sample_dir / name if name in ("sample.pptx", "flowchart.pptx") else ROOT_DIR / name
-        if path.exists():
-            return path
-    pytest.skip("No sample PPTX file found")
+    path = _find_sample_pptx(sample_dir)
+    if path is None:
+        pytest.skip("No sample PPTX file found")
+    return path
+
+
+@pytest.fixture(scope="session")
+def sample_elements(sample_dir: Path) -> Tuple[List[Any], Any, List[Any]]:
+    """sample/sample.drawio loaded once per session: (diagrams, page_size, elements).
+
+    Shared across tests, so callers must treat the elements as read-only.
+    """
+    path = sample_dir / "sample.drawio"
+    if not path.exists():
+        pytest.skip(f"Sample file not found: {path}")
+    loader = DrawIOLoader()
+    diagrams = loader.load_file(path)
+    page_size = loader.extract_page_size(diagrams[0])
+    elements = loader.extract_elements(diagrams[0])
+    return diagrams, page_size, elements
+
+
+def _convert_first_page(drawio_path: Path, out_path: Path) -> Path:
+    """Convert the first diagram of drawio_path into out_path."""
+    loader = DrawIOLoader()
+    diagrams = loader.load_file(drawio_path)
+    page_size = loader.extract_page_size(diagrams[0])
+    writer = PPTXWriter()
+    prs, blank_layout = writer.create_presentation(page_size)
+    elements = loader.extract_elements(diagrams[0])
+    writer.add_slide(prs, blank_layout, elements)
+    prs.save(out_path)
+    return out_path
+
+
+def _read_slide_xml(pptx_path: Path) -> str:
+    """Read ppt/slides/slide1.xml from pptx_path as text."""
+    with zipfile.ZipFile(pptx_path) as z:
+        return z.read("ppt/slides/slide1.xml").decode("utf-8", errors="ignore")
+
+
+@pytest.fixture(scope="session")
+def sample_converted_pptx(sample_dir: Path, tmp_path_factory) -> Path:
+    """sample/sample.drawio converted once per session into a session tmp dir."""
+    path = sample_dir / "sample.drawio"
+    if not path.exists():
+        pytest.skip(f"Sample file not found: {path}")
+    return _convert_first_page(path, tmp_path_factory.mktemp("conv") / "sample.pptx")
+
+
+@pytest.fixture(scope="session")
+def sample_slide_xml(sample_converted_pptx: Path) -> Tuple[Path, str]:
+    """(pptx path, slide1.xml) of the session-converted sample.drawio."""
+    return sample_converted_pptx, _read_slide_xml(sample_converted_pptx)
+
+
+@pytest.fixture(scope="session")
+def timeline3_converted_pptx(sample_dir: Path, tmp_path_factory) -> Path:
+    """sample/timeline3.drawio converted once per session into a session tmp dir."""
+    path = sample_dir / "timeline3.drawio"
+    if not path.exists():
+        pytest.skip(f"Sample file not found: {path}")
+    return _convert_first_page(path, tmp_path_factory.mktemp("conv") / "timeline3.pptx")
+
+
+@pytest.fixture(scope="session")
+def timeline3_slide_xml(timeline3_converted_pptx: Path) -> Tuple[Path, str]:
+    """(pptx path, slide1.xml) of the session-converted timeline3.drawio."""
+    return timeline3_converted_pptx, _read_slide_xml(timeline3_converted_pptx)
@@ -0,0 +1,39 @@
+"""Helpers for reading generated slide XML: namespaces and shape lookup by cNvPr name."""
+
+import zipfile
+from pathlib import Path
+from typing import Optional
+
+from lxml import etree
+
+NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+}
+_SP_TAG = f"{{{NS['p']}}}sp"
+
+
+def get_shape_xml(zf: zipfile.ZipFile, name: str) -> Optional[etree._Element]:
+    """Return the first <p:sp> in slide1.xml whose cNvPr name is `name`, or None."""
+    with zf.open("ppt/slides/slide1.xml") as stream:
+        for _, sp in etree.iterparse(stream, events=("end",), tag=_SP_TAG):
+            c_nv_pr = sp.find("p:nvSpPr/p:cNvPr", NS)
+            if c_nv_pr is not None and c_nv_pr.get("name") == name:
+                return sp
+            # Drop shapes already scanned so memory stays at O(depth).
+            sp.clear()
+            while sp.getprevious() is not None:
+                del sp.getparent()[0]
+    return None
+
+
+def parse_slide_xml(zf: zipfile.ZipFile) -> etree._ElementTree:
+    """Parse slide1.xml straight from an open pptx ZipFile."""
+    with zf.open("ppt/slides/slide1.xml") as stream:
+        return etree.parse(stream)
+
+
+def open_slide_xml(pptx_path: Path) -> etree._ElementTree:
+    """Parse slide1.xml of pptx_path straight from the zip member stream."""
+    with zipfile.ZipFile(pptx_path) as zf:
+        return parse_slide_xml(zf)
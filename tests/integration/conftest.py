@@ -0,0 +1,33 @@
+"""Integration fixtures: the converted sample opened once, and shape lookup by cNvPr name."""
+
+import zipfile
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+import pytest
+from lxml import etree
+
+from tests.integration._slide_xml import get_shape_xml, parse_slide_xml
+
+
+@pytest.fixture(scope="session")
+def sample_zip(sample_converted_pptx: Path) -> Iterator[zipfile.ZipFile]:
+    """The session-converted sample.drawio, opened once as a ZipFile."""
+    with zipfile.ZipFile(sample_converted_pptx) as zf:
+        yield zf
+
+
+@pytest.fixture(scope="session")
+def sample_slide_tree(sample_zip: zipfile.ZipFile) -> etree._ElementTree:
+    """Parsed slide1.xml of the session-converted sample.drawio."""
+    return parse_slide_xml(sample_zip)
+
+
+@pytest.fixture
+def sample_shape(sample_zip: zipfile.ZipFile) -> Callable[[str], Optional[etree._Element]]:
+    """Look up a <p:sp> by name in the converted sample.drawio slide."""
+
+    def _find(name: str) -> Optional[etree._Element]:
+        return get_shape_xml(sample_zip, name)
+
+    return _find
@@ -9,9 +9,25 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
+from pptx.presentation import Presentation
+
+from drawio2pptx.config import default_config
 from drawio2pptx.main import main
 
 
+@pytest.fixture(autouse=True)
+def _restore_default_config(monkeypatch):
+    """main() writes CLI cache/offline flags into default_config; undo that after each test."""
+    for name in ("image_cache_enabled", "image_cache_dir", "offline"):
+        monkeypatch.setattr(default_config, name, getattr(default_config, name))
+
+
+@pytest.fixture
+def stub_save(monkeypatch):
+    """Replace Presentation.save with a stub that only creates the output file."""
+    monkeypatch.setattr(Presentation, "save", lambda self, file: Path(file).write_bytes(b"PK"))
+
+
 def test_main_success_creates_pptx(sample_drawio_path: Path, tmp_path: Path) -> None:
     """Running main with valid input creates the output pptx file."""
     out_pptx = tmp_path / "out.pptx"
@@ -38,19 +54,27 @@ def test_main_missing_input_exits_with_error(tmp_path: Path) -> None:
 
 
 def test_main_with_analyze_flag(sample_drawio_path: Path, tmp_path: Path) -> None:
-    """Main runs and creates pptx when --analyze is passed; compare_conversion is invoked."""
+    """Main passes input/output paths to compare_conversion when --analyze is passed."""
     out_pptx = tmp_path / "out.pptx"
     argv = ["drawio2pptx", str(sample_drawio_path), str(out_pptx), "--analyze"]
 
+    mock_prs = MagicMock()
     with patch("sys.argv", argv):
-        with patch("drawio2pptx.main.compare_conversion", MagicMock()) as mock_compare:
-            main()
+        with patch("drawio2pptx.main.DrawIOLoader") as mock_loader_cls:
+            mock_loader = MagicMock()
+            mock_loader.load_file.return_value = [MagicMock()]
+            mock_loader.extract_elements.return_value = []
+            mock_loader_cls.return_value = mock_loader
+            with patch("drawio2pptx.main.PPTXWriter") as mock_writer_cls:
+                mock_writer_cls.return_value.create_presentation.return_value = (mock_prs, MagicMock())
+                with patch("drawio2pptx.main.compare_conversion", MagicMock()) as mock_compare:
+                    main()
 
-    assert out_pptx.exists()
+    mock_prs.save.assert_called_once_with(out_pptx)
     mock_compare.assert_called_once_with(sample_drawio_path, out_pptx)
 
 
-def test_main_short_analyze_flag(sample_drawio_path: Path, tmp_path: Path) -> None:
+def test_main_short_analyze_flag(sample_drawio_path: Path, tmp_path: Path, stub_save) -> None:
     """Main runs with -a (short analyze flag)."""
     out_pptx = tmp_path / "out.pptx"
     argv = ["drawio2pptx", str(sample_drawio_path), str(out_pptx), "-a"]
@@ -80,7 +104,9 @@ def test_main_no_diagrams_exits_with_error(sample_drawio_path: Path, tmp_path: P
     assert not out_pptx.exists()
 
 
-def test_main_prints_warnings_when_present(sample_drawio_path: Path, tmp_path: Path, capsys) -> None:
+def test_main_prints_warnings_when_present(
+    sample_drawio_path: Path, tmp_path: Path, capsys, stub_save
+) -> None:
     """Main prints warnings when the logger reports any."""
     from drawio2pptx.logger import ConversionLogger
 
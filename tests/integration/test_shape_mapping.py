@@ -3,107 +3,53 @@ Integration tests: shape mapping (cylinder/document, tape/dataStorage, offPageCo
 """
 from __future__ import annotations
 
-import re
-import zipfile
 from pathlib import Path
+from typing import Callable, Optional
 
-import pytest
+from lxml import etree
 
-from drawio2pptx.io.drawio_loader import DrawIOLoader
-from drawio2pptx.io.pptx_writer import PPTXWriter
+from tests.integration._slide_xml import NS, open_slide_xml
 
 
 def test_cylinder_and_document_are_emitted_as_preset_shapes(
-    sample_dir: Path, tmp_path: Path
+    sample_shape: Callable[[str], Optional[etree._Element]]
 ) -> None:
     """cylinder3 and document in sample.drawio are emitted as PPTX preset geometries."""
-    sample_path = sample_dir / "sample.drawio"
-    out_path = tmp_path / "sample_cylinder_document.pptx"
-
-    loader = DrawIOLoader()
-    diagrams = loader.load_file(sample_path)
-    page_size = loader.extract_page_size(diagrams[0])
-    writer = PPTXWriter()
-    prs, blank_layout = writer.create_presentation(page_size)
-    elements = loader.extract_elements(diagrams[0])
-    writer.add_slide(prs, blank_layout, elements)
-    prs.save(out_path)
-
-    with zipfile.ZipFile(out_path) as z:
-        slide_xml = z.read("ppt/slides/slide1.xml").decode("utf-8", errors="ignore")
-
-    cylinder_name = 'name="drawio2pptx:shape:fYnb-Lad83hC8_SQXFiI-1"'
-    assert cylinder_name in slide_xml
-    assert re.search(cylinder_name + r"[\s\S]*?prst=\"can\"", slide_xml)
-
-    assert re.search(
-        cylinder_name + r'[\s\S]*?<a:highlight>[\s\S]*?val="FF0000"',
-        slide_xml,
-    )
-
-    document_name = 'name="drawio2pptx:shape:fYnb-Lad83hC8_SQXFiI-2"'
-    assert document_name in slide_xml
-    assert re.search(
-        document_name + r"[\s\S]*?prst=\"flowChartDocument\"",
-        slide_xml,
-    )
+    cylinder = sample_shape("drawio2pptx:shape:fYnb-Lad83hC8_SQXFiI-1")
+    assert cylinder is not None
+    assert cylinder.find(".//a:prstGeom", NS).get("prst") == "can"
+
+    highlight = cylinder.find(".//a:highlight/a:srgbClr", NS)
+    assert highlight is not None
+    assert highlight.get("val") == "FF0000"
+
+    document = sample_shape("drawio2pptx:shape:fYnb-Lad83hC8_SQXFiI-2")
+    assert document is not None
+    assert document.find(".//a:prstGeom", NS).get("prst") == "flowChartDocument"
 
 
 def test_tape_and_datastorage_are_emitted_as_preset_shapes(
-    sample_dir: Path, tmp_path: Path
+    sample_shape: Callable[[str], Optional[etree._Element]]
 ) -> None:
     """tape and dataStorage in sample.drawio are emitted as PPTX preset geometries."""
-    sample_path = sample_dir / "sample.drawio"
-    out_path = tmp_path / "sample_tape_datastorage.pptx"
-
-    loader = DrawIOLoader()
-    diagrams = loader.load_file(sample_path)
-    page_size = loader.extract_page_size(diagrams[0])
-    writer = PPTXWriter()
-    prs, blank_layout = writer.create_presentation(page_size)
-    elements = loader.extract_elements(diagrams[0])
-    writer.add_slide(prs, blank_layout, elements)
-    prs.save(out_path)
-
-    with zipfile.ZipFile(out_path) as z:
-        slide_xml = z.read("ppt/slides/slide1.xml").decode("utf-8", errors="ignore")
-
-    tape_name = 'name="drawio2pptx:shape:fYnb-Lad83hC8_SQXFiI-5"'
-    assert tape_name in slide_xml
-    assert re.search(
-        tape_name + r"[\s\S]*?prst=\"flowChartPunchedTape\"",
-        slide_xml,
-    )
-
-    ds_name = 'name="drawio2pptx:shape:fYnb-Lad83hC8_SQXFiI-6"'
-    assert ds_name in slide_xml
-    assert re.search(
-        ds_name + r"[\s\S]*?prst=\"flowChartOnlineStorage\"",
-        slide_xml,
-    )
+    tape = sample_shape("drawio2pptx:shape:fYnb-Lad83hC8_SQXFiI-5")
+    assert tape is not None
+    assert tape.find(".//a:prstGeom", NS).get("prst") == "flowChartPunchedTape"
+
+    data_storage = sample_shape("drawio2pptx:shape:fYnb-Lad83hC8_SQXFiI-6")
+    assert data_storage is not None
+    assert data_storage.find(".//a:prstGeom", NS).get("prst") == "flowChartOnlineStorage"
 
 
 def test_offpage_connector_is_emitted_as_preset_shape_and_flipV_is_applied(
-    sample_dir: Path, tmp_path: Path
+    timeline3_converted_pptx: Path,
 ) -> None:
     """offPageConnector in timeline3.drawio maps to flowChartOffpageConnector with flipV applied."""
-    sample_path = sample_dir / "timeline3.drawio"
-    if not sample_path.exists():
-        pytest.skip(f"Sample file not found: {sample_path}")
-
-    out_path = tmp_path / "timeline3_offpage_connector.pptx"
-
-    loader = DrawIOLoader()
-    diagrams = loader.load_file(sample_path)
-    page_size = loader.extract_page_size(diagrams[0])
-    writer = PPTXWriter()
-    prs, blank_layout = writer.create_presentation(page_size)
-    elements = loader.extract_elements(diagrams[0])
-    writer.add_slide(prs, blank_layout, elements)
-    prs.save(out_path)
-
-    with zipfile.ZipFile(out_path) as z:
-        slide_xml = z.read("ppt/slides/slide1.xml").decode("utf-8", errors="ignore")
+    tree = open_slide_xml(timeline3_converted_pptx)
+    shapes = {
+        sp.find("p:nvSpPr/p:cNvPr", NS).get("name"): sp
+        for sp in tree.iterfind(".//p:sp", NS)
+    }
 
     stage_ids = [
         "4ec97bd9e5d20128-5",
@@ -113,32 +59,27 @@ def test_offpage_connector_is_emitted_as_preset_shape_and_flipV_is_applied(
     ]
 
     for sid in stage_ids:
-        shape_name = f'name="drawio2pptx:shape:{sid}"'
-        assert shape_name in slide_xml
-        assert re.search(
-            shape_name + r"[\s\S]*?prst=\"flowChartOffpageConnector\"",
-            slide_xml,
-        ), f"Expected {sid} to map to prstGeom flowChartOffpageConnector"
+        sp = shapes.get(f"drawio2pptx:shape:{sid}")
+        assert sp is not None
+        assert sp.find(".//a:prstGeom", NS).get("prst") == "flowChartOffpageConnector", (
+            f"Expected {sid} to map to prstGeom flowChartOffpageConnector"
+        )
 
     for sid in ["4ec97bd9e5d20128-7", "4ec97bd9e5d20128-8"]:
-        shape_name = f'name="drawio2pptx:shape:{sid}"'
-        assert re.search(
-            shape_name + r'[\s\S]*?<a:xfrm[^>]*flipV="1"',
-            slide_xml,
-        ), f"Expected flipV=1 to be applied for {sid}"
+        xfrm = shapes[f"drawio2pptx:shape:{sid}"].find(".//a:xfrm", NS)
+        assert xfrm.get("flipV") == "1", f"Expected flipV=1 to be applied for {sid}"
 
     overlay_map = {
         "4ec97bd9e5d20128-7": "Stage 2",
         "4ec97bd9e5d20128-8": "Stage 4",
     }
     for sid, expected_text in overlay_map.items():
-        overlay_name = f'name="drawio2pptx:shape-text-overlay:{sid}"'
-        assert overlay_name in slide_xml
-        assert re.search(
-            overlay_name + r'[\s\S]*?<a:t>' + re.escape(expected_text) + r"</a:t>",
-            slide_xml,
-        ), f"Expected overlay for {sid} to contain text '{expected_text}'"
-        assert re.search(
-            overlay_name + r'[\s\S]*?<a:xfrm(?![^>]*flipH)(?![^>]*flipV)[^>]*>',
-            slide_xml,
-        ), f"Expected overlay for {sid} to be unflipped"
+        overlay = shapes.get(f"drawio2pptx:shape-text-overlay:{sid}")
+        assert overlay is not None
+        assert expected_text in [t.text for t in overlay.iterfind(".//a:t", NS)], (
+            f"Expected overlay for {sid} to contain text '{expected_text}'"
+        )
+        xfrm = overlay.find(".//a:xfrm", NS)
+        assert xfrm.get("flipH") is None and xfrm.get("flipV") is None, (
+            f"Expected overlay for {sid} to be unflipped"
+        )
@@ -4,34 +4,15 @@ Integration tests: rich text and headings (<h1>Heading</h1><p>...</p> preservati
 from __future__ import annotations
 
 import re
-import zipfile
 from pathlib import Path
+from typing import Tuple
 
-import pytest
 
-from drawio2pptx.io.drawio_loader import DrawIOLoader
-from drawio2pptx.io.pptx_writer import PPTXWriter
-
-
-def test_timeline3_richtext_heading_is_preserved(sample_dir: Path, tmp_path: Path) -> None:
+def test_timeline3_richtext_heading_is_preserved(
+    timeline3_slide_xml: Tuple[Path, str]
+) -> None:
     """<h1>Heading</h1><p>... in timeline3.drawio is preserved as 'Heading' after conversion."""
-    sample_path = sample_dir / "timeline3.drawio"
-    if not sample_path.exists():
-        pytest.skip(f"Sample file not found: {sample_path}")
-
-    out_path = tmp_path / "timeline3_richtext_heading.pptx"
-
-    loader = DrawIOLoader()
-    diagrams = loader.load_file(sample_path)
-    page_size = loader.extract_page_size(diagrams[0])
-    writer = PPTXWriter()
-    prs, blank_layout = writer.create_presentation(page_size)
-    elements = loader.extract_elements(diagrams[0])
-    writer.add_slide(prs, blank_layout, elements)
-    prs.save(out_path)
-
-    with zipfile.ZipFile(out_path) as z:
-        slide_xml = z.read("ppt/slides/slide1.xml").decode("utf-8", errors="ignore")
+    _, slide_xml = timeline3_slide_xml
 
     assert re.search(r"<a:t>Heading</a:t>", slide_xml), (
         "Expected rich-text <h1>Heading</h1> to be preserved"
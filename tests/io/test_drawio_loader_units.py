@@ -3,83 +3,126 @@ Unit tests for drawio_loader: ColorParser, StyleExtractor, DrawIOLoader (load_fi
 """
 from __future__ import annotations
 
+import io
+import re
+import sys
 from pathlib import Path
 
 import pytest
 from lxml import etree as ET
 from pptx.dml.color import RGBColor
 
-from drawio2pptx.io.drawio_loader import ColorParser, StyleExtractor, DrawIOLoader
+from drawio2pptx.io.drawio_loader import ColorParser, StyleExtractor, DrawIOLoader, _boundary_kind
 from drawio2pptx.logger import ConversionLogger
 from drawio2pptx.model.intermediate import ShapeElement
 
 
 # ---- ColorParser ----
-def test_color_parser_none_empty() -> None:
-    assert ColorParser.parse(None) is None
-    assert ColorParser.parse("") is None
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (None, None),
+        ("", None),
+        ("none", None),
+        ("None", None),
+        # light-dark(light_color, dark_color) uses first (light) color.
+        ("light-dark(#ff0000, #00ff00)", (255, 0, 0)),
+        ("#FF00FF", (255, 0, 255)),
+        ("#f0f", (255, 0, 255)),
+        ("rgb(10, 20, 30)", (10, 20, 30)),
+        ("notacolor", None),
+        ("#gggggg", None),
+        ("#12345", None),
+        ("#+12", None),
+        ("  #0a0B0c ", (10, 11, 12)),
+        ("rgb(1,2)", None),
+    ],
+)
+def test_color_parser(value, expected) -> None:
+    assert ColorParser.parse(value) == expected
+
+
+def test_color_parser_memoizes_results() -> None:
+    """Repeated color strings share one (immutable) RGBColor instance."""
+    first = ColorParser.parse("#1a2b3c")
+    assert ColorParser.parse("#1a2b3c") is first
+    assert first == (0x1A, 0x2B, 0x3C)
+
+
+def test_color_parser_regexes_precompiled() -> None:
+    """Color patterns are compiled once at import, not per parse() call."""
+    for pattern in (ColorParser._LIGHT_DARK_RE, ColorParser._RGB_RE):
+        assert isinstance(pattern, re.Pattern)
 
 
-def test_color_parser_none_keyword() -> None:
-    assert ColorParser.parse("none") is None
-    assert ColorParser.parse("None") is None
-
-
-def test_color_parser_light_dark() -> None:
-    """light-dark(light_color, dark_color) uses first (light) color."""
-    rgb = ColorParser.parse("light-dark(#ff0000, #00ff00)")
-    assert rgb is not None
-    assert rgb[0] == 255 and rgb[1] == 0 and rgb[2] == 0
-
-
-def test_color_parser_hex_6() -> None:
-    rgb = ColorParser.parse("#FF00FF")
-    assert rgb is not None
-    assert rgb[0] == 255 and rgb[1] == 0 and rgb[2] == 255
-
-
-def test_color_parser_hex_3() -> None:
-    rgb = ColorParser.parse("#f0f")
-    assert rgb is not None
-    assert rgb[0] == 255 and rgb[1] == 0 and rgb[2] == 255
-
-
-def test_color_parser_rgb() -> None:
-    rgb = ColorParser.parse("rgb(10, 20, 30)")
-    assert rgb is not None
-    assert rgb[0] == 10 and rgb[1] == 20 and rgb[2] == 30
+# ---- StyleExtractor ----
+@pytest.fixture(scope="module")
+def ext() -> StyleExtractor:
+    """StyleExtractor shared by the module; it holds no per-call state."""
+    return StyleExtractor()
 
 
-def test_color_parser_invalid_returns_none() -> None:
-    assert ColorParser.parse("notacolor") is None
-    assert ColorParser.parse("#gggggg") is None
-    assert ColorParser.parse("rgb(1,2)") is None
+# Test cells hang off one shared parent so lxml does not create a new document per cell.
+_CELL_PARENT = ET.Element("root")
 
 
-# ---- StyleExtractor ----
 def _cell(attrib: dict, tag: str = "mxCell") -> ET.Element:
-    el = ET.Element(tag)
-    for k, v in attrib.items():
-        el.set(k, str(v))
-    return el
+    return ET.SubElement(_CELL_PARENT, tag, {k: str(v) for k, v in attrib.items()})
+
+
+@pytest.mark.parametrize(
+    "method,args,kwargs,expected",
+    [
+        ("extract_style_value", ("fillColor=#ff0000;strokeColor=#00ff00", "fillColor"), {}, "#ff0000"),
+        ("extract_style_value", ("fillColor=#ff0000", "strokeColor"), {}, None),
+        ("extract_style_value", ("", "fillColor"), {}, None),
+        ("extract_style_value", ("rounded=1;rounded=0", "rounded"), {}, "1"),
+        ("extract_style_value", ("ellipse; fillColor = #fff ;", "fillColor"), {}, "#fff"),
+        ("extract_style_float", ("fontSize=12;width=100", "fontSize"), {}, 12.0),
+        ("extract_style_float", ("fontSize=12", "fontSize"), {"default": 10.0}, 12.0),
+        ("extract_style_float", ("x=abc", "x"), {"default": 5.0}, 5.0),
+        ("extract_style_float", ("fontSize=12", "width"), {"default": 5.0}, 5.0),
+        ("is_text_style", ("text;html=1",), {}, True),
+        ("is_text_style", ("shape=text;fillColor=#fff",), {}, True),
+        ("is_text_style", ("ellipse;fillColor=#fff",), {}, False),
+        ("is_text_style", (" ;Text;html=1",), {}, True),
+        ("is_text_style", ("textbox;html=1",), {}, False),
+    ],
+)
+def test_style_extractor_style_string_helpers(
+    ext: StyleExtractor, method: str, args: tuple, kwargs: dict, expected
+) -> None:
+    assert getattr(ext, method)(*args, **kwargs) == expected
+
+
+def test_style_extractor_caches_parsed_style_strings() -> None:
+    ext = StyleExtractor()
+    style = "fillColor=#ff0000;strokeWidth=2"
+    assert ext.extract_style_value(style, "fillColor") == "#ff0000"
+    parsed = ext._style_cache[style]
+    assert ext.extract_style_float(style, "strokeWidth") == 2.0
+    assert ext._style_cache == {style: parsed}
 
 
-def test_style_extractor_extract_style_value() -> None:
+def test_style_extractor_interns_style_keys_and_shape_types() -> None:
     ext = StyleExtractor()
-    assert ext.extract_style_value("fillColor=#ff0000;strokeColor=#00ff00", "fillColor") == "#ff0000"
-    assert ext.extract_style_value("fillColor=#ff0000", "strokeColor") is None
-    assert ext.extract_style_value("", "fillColor") is None
+    first = ext._parse_style_string("fillColor=#fff;strokeWidth=2")
+    second = ext._parse_style_string("strokeWidth=3;fillColor=#000")
+    assert [k for k in first if k == "fillColor"][0] is [k for k in second if k == "fillColor"][0]
+    shape_type = ext.extract_shape_type(_cell({"style": "shape=Cloud"}))
+    assert shape_type is sys.intern("cloud")
 
 
-def test_style_extractor_extract_style_float() -> None:
+def test_style_extractor_cell_extractors_share_parsed_style() -> None:
     ext = StyleExtractor()
-    assert ext.extract_style_float("fontSize=12;width=100", "fontSize") == 12.0
-    assert ext.extract_style_float("fontSize=12", "fontSize", default=10.0) == 12.0
-    assert ext.extract_style_float("x=abc", "x", default=5.0) == 5.0
+    cell = _cell({"style": "shape=cloud;gradientDirection=north;strokeColor=none"})
+    assert ext.extract_shape_type(cell) == "cloud"
+    assert ext.extract_gradient_direction(cell) == "north"
+    assert ext.extract_no_stroke(cell) is True
+    assert list(ext._style_cache) == [cell.get("style")]
 
 
-def test_style_extractor_parse_font_style() -> None:
-    ext = StyleExtractor()
+def test_style_extractor_parse_font_style(ext: StyleExtractor) -> None:
     r = ext._parse_font_style("1")  # bold
     assert r["bold"] is True and r["italic"] is False
     r = ext._parse_font_style("2")  # italic
@@ -88,99 +131,45 @@ def test_style_extractor_parse_font_style() -> None:
     assert r["underline"] is True
     r = ext._parse_font_style("0")
     assert r["bold"] is False and r["italic"] is False
-
-
-def test_style_extractor_is_text_style() -> None:
-    ext = StyleExtractor()
-    assert ext.is_text_style("text;html=1") is True
-    assert ext.is_text_style("shape=text;fillColor=#fff") is True
-    assert ext.is_text_style("ellipse;fillColor=#fff") is False
-
-
-def test_style_extractor_extract_fill_color_attr() -> None:
-    ext = StyleExtractor()
-    cell = _cell({"fillColor": "#ff0000"})
-    assert ext.extract_fill_color(cell) is not None
-    cell = _cell({"fillColor": "default"})
-    assert ext.extract_fill_color(cell) == "default"
-    cell = _cell({"fillColor": "none"})
-    assert ext.extract_fill_color(cell) is None
-
-
-def test_style_extractor_extract_fill_color_style() -> None:
-    ext = StyleExtractor()
-    cell = _cell({"style": "fillColor=#00ff00;strokeColor=#0000ff"})
-    rgb = ext.extract_fill_color(cell)
-    assert rgb is not None
-    assert rgb[1] == 255
-
-
-def test_style_extractor_extract_fill_color_vertex_default() -> None:
-    ext = StyleExtractor()
-    cell = _cell({"vertex": "1"}, tag="mxCell")
-    assert ext.extract_fill_color(cell) == "default"
-
-
-def test_style_extractor_extract_gradient_color() -> None:
-    ext = StyleExtractor()
-    cell = _cell({"style": "gradientColor=#ff0000"})
-    assert ext.extract_gradient_color(cell) is not None
-    cell = _cell({"style": "gradientColor=default"})
-    assert ext.extract_gradient_color(cell) == "default"
-    cell = _cell({"style": "gradientColor=none"})
-    assert ext.extract_gradient_color(cell) is None
-
-
-def test_style_extractor_extract_gradient_direction() -> None:
-    ext = StyleExtractor()
-    cell = _cell({"style": "gradientDirection=north"})
-    assert ext.extract_gradient_direction(cell) == "north"
-    cell = _cell({})
-    assert ext.extract_gradient_direction(cell) is None
-
-
-def test_style_extractor_extract_swimlane_fill_color() -> None:
-    ext = StyleExtractor()
-    cell = _cell({"style": "swimlaneFillColor=#eeeeee"})
-    assert ext.extract_swimlane_fill_color(cell) is not None
-    cell = _cell({"style": "swimlaneFillColor=none"})
-    assert ext.extract_swimlane_fill_color(cell) is None
-
-
-def test_style_extractor_extract_stroke_color() -> None:
-    ext = StyleExtractor()
-    cell = _cell({"style": "strokeColor=#000000"})
-    assert ext.extract_stroke_color(cell) is not None
-    cell = _cell({})
-    assert ext.extract_stroke_color(cell) is None
-
-
-def test_style_extractor_extract_no_stroke() -> None:
-    ext = StyleExtractor()
-    cell = _cell({"style": "strokeColor=none"})
-    assert ext.extract_no_stroke(cell) is True
-    cell = _cell({"strokeColor": "none"})
-    assert ext.extract_no_stroke(cell) is True
-    cell = _cell({"style": "strokeColor=#000"})
-    assert ext.extract_no_stroke(cell) is False
-
-
-def test_style_extractor_extract_font_color_from_style() -> None:
-    ext = StyleExtractor()
-    cell = _cell({"style": "fontColor=#123456"})
-    assert ext.extract_font_color(cell) is not None
-
-
-def test_style_extractor_extract_label_background_color() -> None:
-    ext = StyleExtractor()
-    cell = _cell({"style": "labelBackgroundColor=#ffff00"})
-    assert ext.extract_label_background_color(cell) is not None
-    cell = _cell({"style": "labelBackgroundColor=#ff0000"})
-    assert ext.extract_label_background_color(cell) is not None
-
-
-def test_style_extractor_extract_shadow() -> None:
-    ext = StyleExtractor()
+    r = ext._parse_font_style("7")
+    assert r is ext._parse_font_style("7")
+    with pytest.raises(TypeError):
+        r["bold"] = False  # type: ignore[index]
+
+
+_CELL_STYLE_CASES = (
+    ("extract_fill_color", {"fillColor": "#ff0000"}, (255, 0, 0)),
+    ("extract_fill_color", {"fillColor": "default"}, "default"),
+    ("extract_fill_color", {"fillColor": "none"}, None),
+    ("extract_fill_color", {"style": "fillColor=#00ff00;strokeColor=#0000ff"}, (0, 255, 0)),
+    ("extract_fill_color", {"vertex": "1"}, "default"),
+    ("extract_gradient_color", {"style": "gradientColor=#ff0000"}, (255, 0, 0)),
+    ("extract_gradient_color", {"style": "gradientColor=default"}, "default"),
+    ("extract_gradient_color", {"style": "gradientColor=none"}, None),
+    ("extract_gradient_direction", {"style": "gradientDirection=north"}, "north"),
+    ("extract_gradient_direction", {}, None),
+    ("extract_swimlane_fill_color", {"style": "swimlaneFillColor=#eeeeee"}, (238, 238, 238)),
+    ("extract_swimlane_fill_color", {"style": "swimlaneFillColor=none"}, None),
+    ("extract_stroke_color", {"style": "strokeColor=#000000"}, (0, 0, 0)),
+    ("extract_stroke_color", {}, None),
+    ("extract_no_stroke", {"style": "strokeColor=none"}, True),
+    ("extract_no_stroke", {"strokeColor": "none"}, True),
+    ("extract_no_stroke", {"style": "strokeColor=#000"}, False),
+    ("extract_no_stroke", {"style": "fillColor=#fff; strokeColor = NONE"}, True),
+    ("extract_no_stroke", {"strokeColor": "#000", "style": "strokeColor=none"}, False),
+    ("extract_no_stroke", {"style": "fillColor=none"}, False),
+    ("extract_font_color", {"style": "fontColor=#123456"}, (0x12, 0x34, 0x56)),
+    ("extract_label_background_color", {"style": "labelBackgroundColor=#ffff00"}, (255, 255, 0)),
+    ("extract_label_background_color", {"style": "labelBackgroundColor=#ff0000"}, (255, 0, 0)),
+)
+
+
+@pytest.mark.parametrize("method,attrib,expected", _CELL_STYLE_CASES)
+def test_style_extractor_cell_styles(ext: StyleExtractor, method: str, attrib: dict, expected) -> None:
+    assert getattr(ext, method)(_cell(attrib)) == expected
+
+
+def test_style_extractor_extract_shadow(ext: StyleExtractor) -> None:
     cell = _cell({"style": "shadow=1"})
     assert ext.extract_shadow(cell, None) is True
     cell = _cell({"style": "shadow=0"})
@@ -190,83 +179,110 @@ def test_style_extractor_extract_shadow() -> None:
     assert ext.extract_shadow(_cell({}), root) is True
 
 
-def test_style_extractor_extract_shape_type_swimlane() -> None:
-    ext = StyleExtractor()
-    cell = _cell({"style": "shape=swimlane"})
-    assert ext.extract_shape_type(cell) == "swimlane"
-
-
-def test_style_extractor_extract_shape_type_process_predefined() -> None:
-    ext = StyleExtractor()
-    cell = _cell({"style": "shape=process;backgroundOutline=1"})
-    assert ext.extract_shape_type(cell) == "predefinedprocess"
-    cell = _cell({"style": "shape=process;size=10"})
-    assert ext.extract_shape_type(cell) == "predefinedprocess"
-
-
-def test_style_extractor_extract_shape_type_map() -> None:
-    ext = StyleExtractor()
-    cell = _cell({"style": "shape=ellipse"})
-    assert ext.extract_shape_type(cell) == "ellipse"
-    cell = _cell({"style": "shape=mxgraph.flowchart.document"})
-    assert ext.extract_shape_type(cell) == "document"
+_SHAPE_TYPE_CASES = (
+    ({"style": "shape=swimlane"}, "swimlane"),
+    ({"style": "shape=process;backgroundOutline=1"}, "predefinedprocess"),
+    ({"style": "shape=process;size=10"}, "predefinedprocess"),
+    ({"style": "shape=ellipse"}, "ellipse"),
+    ({"style": "shape=mxgraph.flowchart.document"}, "document"),
+    ({"style": "ellipse;fillColor=#fff"}, "ellipse"),
+    ({"style": "rhombus;fillColor=#fff"}, "rhombus"),
+    ({"style": "swimlane;startSize=20"}, "swimlane"),
+    ({"style": "process;fillColor=#fff"}, "process"),
+    ({"style": "mxgraph.flowchart.decision;fillColor=#fff"}, "decision"),
+    ({"style": "unknownShape;fillColor=#fff"}, "rectangle"),
+    ({}, "rectangle"),
+)
 
 
-def test_style_extractor_extract_shape_type_first_part() -> None:
-    ext = StyleExtractor()
-    cell = _cell({"style": "ellipse;fillColor=#fff"})
-    assert ext.extract_shape_type(cell) == "ellipse"
-    cell = _cell({"style": "rhombus;fillColor=#fff"})
-    assert ext.extract_shape_type(cell) == "rhombus"
-
-
-def test_style_extractor_extract_shape_type_default_rectangle() -> None:
-    ext = StyleExtractor()
-    cell = _cell({})
-    assert ext.extract_shape_type(cell) == "rectangle"
+@pytest.mark.parametrize("attrib,expected", _SHAPE_TYPE_CASES)
+def test_style_extractor_extract_shape_type(ext: StyleExtractor, attrib: dict, expected: str) -> None:
+    assert ext.extract_shape_type(_cell(attrib)) == expected
 
 
 # ---- DrawIOLoader load_file ----
-def test_loader_load_file_diagram_with_mxgraph(tmp_path: Path) -> None:
-    """load_file returns list of mxGraphModel when file has <diagram> with inner XML."""
-    drawio = tmp_path / "test.drawio"
-    drawio.write_text("""<?xml version="1.0"?>
+_DRAWIO_WITH_MXGRAPH = b"""<?xml version="1.0"?>
 <mxfile>
   <diagram name="Page-1">
     <mxGraphModel dx="800" dy="600">
       <root><mxCell id="0"/><mxCell id="1" parent="0"/></root>
     </mxGraphModel>
   </diagram>
-</mxfile>""", encoding="utf-8")
+</mxfile>"""
+
+_DRAWIO_EMPTY_DIAGRAM = b"""<?xml version="1.0"?>
+<mxfile>
+  <diagram name="Page-1"></diagram>
+  <mxGraphModel><root><mxCell id="0"/></root></mxGraphModel>
+</mxfile>"""
+
+
+_DRAWIO_ESCAPED_PAYLOAD = b"""<?xml version="1.0"?>
+<mxfile>
+  <diagram name="Page-1">&lt;mxGraphModel&gt;&lt;root&gt;&lt;mxCell id="0"/&gt;&lt;/root&gt;&lt;/mxGraphModel&gt;</diagram>
+</mxfile>"""
+
+_DRAWIO_UNPARSABLE_PAYLOAD = b"""<?xml version="1.0"?>
+<mxfile>
+  <diagram name="Page-1">&lt;mxGraphModel&gt;&lt;root&gt;</diagram>
+  <mxGraphModel id="global"><root><mxCell id="0"/></root></mxGraphModel>
+</mxfile>"""
+
+
+@pytest.fixture(scope="session")
+def drawio_with_mxgraph(tmp_path_factory) -> Path:
+    path = tmp_path_factory.mktemp("drawio") / "test.drawio"
+    path.write_bytes(_DRAWIO_WITH_MXGRAPH)
+    return path
+
+
+def test_loader_load_file_diagram_with_mxgraph(drawio_with_mxgraph: Path) -> None:
+    """load_file returns list of mxGraphModel when file has <diagram> with inner XML."""
     loader = DrawIOLoader()
-    diagrams = loader.load_file(drawio)
+    diagrams = loader.load_file(drawio_with_mxgraph)
     assert len(diagrams) == 1
     root = diagrams[0]
     assert root.tag.endswith("mxGraphModel") or root.tag == "mxGraphModel"
-    assert len(root.findall(".//mxCell")) >= 1
+    assert next(root.iterfind(".//mxCell"), None) is not None
 
 
-def test_loader_load_file_diagram_empty_inner_uses_fallback(tmp_path: Path) -> None:
+def test_loader_load_file_diagram_empty_inner_uses_fallback() -> None:
     """When diagram has no inner content, loader uses mxGraphModel from root if present."""
-    drawio = tmp_path / "test.drawio"
-    drawio.write_text("""<?xml version="1.0"?>
-<mxfile>
-  <diagram name="Page-1"></diagram>
-  <mxGraphModel><root><mxCell id="0"/></root></mxGraphModel>
-</mxfile>""", encoding="utf-8")
     loader = DrawIOLoader()
-    diagrams = loader.load_file(drawio)
+    diagrams = loader.load_file(io.BytesIO(_DRAWIO_EMPTY_DIAGRAM))
     assert len(diagrams) >= 1
 
 
+def test_loader_load_file_reuses_module_parser(monkeypatch) -> None:
+    """Escaped diagram payloads are parsed through the shared module-level XMLParser."""
+    from drawio2pptx.io import drawio_loader
+
+    parsers = []
+    real_fromstring = ET.fromstring
+
+    def _fromstring(text, parser=None):
+        parsers.append(parser)
+        return real_fromstring(text, parser)
+
+    monkeypatch.setattr(drawio_loader.ET, "fromstring", _fromstring)
+    diagrams = DrawIOLoader().load_file(io.BytesIO(_DRAWIO_ESCAPED_PAYLOAD))
+    assert parsers == [drawio_loader._PARSER]
+    assert [d.tag for d in diagrams] == ["mxGraphModel"]
+
+
+def test_loader_load_file_unparsable_payload_uses_fallback() -> None:
+    """A payload that is not XML resolves to the document-level mxGraphModel."""
+    diagrams = DrawIOLoader().load_file(io.BytesIO(_DRAWIO_UNPARSABLE_PAYLOAD))
+    assert [d.get("id") for d in diagrams] == ["global"]
+
+
 # ---- DrawIOLoader extract_page_size ----
 def test_loader_extract_page_size() -> None:
     loader = DrawIOLoader()
     root = ET.Element("mxGraphModel")
     root.set("pageWidth", "800")
     root.set("pageHeight", "600")
-    w, h = loader.extract_page_size(root)
-    assert w == 800.0 and h == 600.0
+    assert loader.extract_page_size(root) == (800.0, 600.0)
 
 
 def test_loader_extract_page_size_with_scale() -> None:
@@ -275,15 +291,13 @@ def test_loader_extract_page_size_with_scale() -> None:
     root.set("pageWidth", "400")
     root.set("pageHeight", "300")
     root.set("pageScale", "2")
-    w, h = loader.extract_page_size(root)
-    assert w == 800.0 and h == 600.0
+    assert loader.extract_page_size(root) == (800.0, 600.0)
 
 
 def test_loader_extract_page_size_missing_returns_none() -> None:
     loader = DrawIOLoader()
     root = ET.Element("mxGraphModel")
-    w, h = loader.extract_page_size(root)
-    assert w is None and h is None
+    assert loader.extract_page_size(root) == (None, None)
 
 
 def test_loader_extract_page_size_invalid_scale_defaults_to_one() -> None:
@@ -292,8 +306,7 @@ def test_loader_extract_page_size_invalid_scale_defaults_to_one() -> None:
     root.set("pageWidth", "100")
     root.set("pageHeight", "100")
     root.set("pageScale", "x")
-    w, h = loader.extract_page_size(root)
-    assert w == 100.0 and h == 100.0
+    assert loader.extract_page_size(root) == (100.0, 100.0)
 
 
 # ---- DrawIOLoader shape extraction helpers (refactored for unit testing) ----
@@ -355,6 +368,51 @@ def test_apply_shape_parent_offset_with_parent() -> None:
     assert x == 110.0 and y == 220.0
 
 
+def test_extract_elements_caches_parent_coordinates(monkeypatch) -> None:
+    """Ancestor offsets are resolved once per parent while extracting a diagram."""
+    loader = DrawIOLoader()
+    mgm = ET.fromstring("""<mxGraphModel><root>
+      <mxCell id="0"/><mxCell id="1" parent="0"/>
+      <mxCell id="g" vertex="1" parent="1"><mxGeometry x="100" y="50" width="300" height="200" as="geometry"/></mxCell>
+      <mxCell id="p" vertex="1" parent="g"><mxGeometry x="10" y="20" width="200" height="100" as="geometry"/></mxCell>
+      <mxCell id="a" vertex="1" parent="p"><mxGeometry x="1" y="2" width="10" height="10" as="geometry"/></mxCell>
+      <mxCell id="b" vertex="1" parent="p"><mxGeometry x="3" y="4" width="10" height="10" as="geometry"/></mxCell>
+    </root></mxGraphModel>""")
+    computed = []
+    real_compute = loader._compute_parent_coordinates
+
+    def _compute(parent_id, mgm_root):
+        computed.append(parent_id)
+        return real_compute(parent_id, mgm_root)
+
+    monkeypatch.setattr(loader, "_compute_parent_coordinates", _compute)
+    shapes = {e.id: e for e in loader.extract_elements(mgm)}
+    assert (shapes["a"].x, shapes["a"].y) == (111.0, 72.0)
+    assert (shapes["b"].x, shapes["b"].y) == (113.0, 74.0)
+    assert sorted(computed) == ["g", "p"]
+
+
+def test_extract_elements_resolves_parents_from_cell_index(monkeypatch) -> None:
+    """Parent lookups during extraction use the cell index instead of rescanning the model."""
+    loader = DrawIOLoader()
+    mgm = ET.fromstring("""<mxGraphModel><root>
+      <mxCell id="0"/><mxCell id="1" parent="0"/>
+      <mxCell id="lane" style="swimlane;startSize=30" vertex="1" parent="1"><mxGeometry x="100" y="50" width="300" height="200" as="geometry"/></mxCell>
+      <mxCell id="a" vertex="1" parent="lane"><mxGeometry x="10" y="0" width="10" height="10" as="geometry"/></mxCell>
+    </root></mxGraphModel>""")
+    scans = []
+    real_xpath = DrawIOLoader._XP_MXCELLS
+
+    def _xp_mxcells(root):
+        scans.append(root)
+        return real_xpath(root)
+
+    monkeypatch.setattr(loader, "_XP_MXCELLS", _xp_mxcells)
+    shapes = {e.id: e for e in loader.extract_elements(mgm)}
+    assert (shapes["a"].x, shapes["a"].y) == (110.0, 80.0)
+    assert scans == [mgm]
+
+
 def test_build_shape_transform_default() -> None:
     """_build_shape_transform returns no rotation and no flip by default."""
     loader = DrawIOLoader()
@@ -486,12 +544,36 @@ def test_parse_connector_geometry_with_array_points() -> None:
     </root>""")
     cell = root.find(".//mxCell")
     points_raw, source_pt, target_pt, points_for_ports = loader._parse_connector_geometry(cell, root)
-    assert len(points_raw) == 2
-    assert points_raw[0] == (50.0, 20.0) and points_raw[1] == (100.0, 80.0)
+    assert points_raw == [(50.0, 20.0), (100.0, 80.0)]
     assert source_pt is None and target_pt is None
     assert len(points_for_ports) == 2
 
 
+@pytest.mark.parametrize(
+    "geometry,expected_points",
+    [
+        # Loose mxPoints are waypoints unless they carry a role.
+        (
+            '<mxPoint x="1" y="2" as="sourcePoint"/><mxPoint x="5" y="6"/>'
+            '<mxPoint x="7" y="8" as="offset"/><mxPoint x="3" y="4" as="targetPoint"/>',
+            [(5.0, 6.0)],
+        ),
+        # A points Array takes precedence over loose mxPoints.
+        (
+            '<mxPoint x="1" y="2" as="sourcePoint"/><mxPoint x="bad" y="0"/>'
+            '<Array as="points"><mxPoint x="5" y="6"/></Array><mxPoint x="3" y="4" as="targetPoint"/>',
+            [(5.0, 6.0)],
+        ),
+    ],
+)
+def test_parse_connector_geometry_roles(geometry: str, expected_points: list) -> None:
+    loader = DrawIOLoader()
+    cell = ET.fromstring(f'<mxCell id="e1" parent="1"><mxGeometry>{geometry}</mxGeometry></mxCell>')
+    points_raw, source_pt, target_pt, points_for_ports = loader._parse_connector_geometry(cell, ET.Element("root"))
+    assert (points_raw, source_pt, target_pt) == (expected_points, (1.0, 2.0), (3.0, 4.0))
+    assert points_for_ports == expected_points
+
+
 def test_extract_connector_keeps_floating_source_target_points() -> None:
     """Standalone edge with sourcePoint/targetPoint must stay floating (no inferred shape attachment)."""
     loader = DrawIOLoader()
@@ -577,6 +659,22 @@ def test_boundary_point_ellipse() -> None:
     assert abs(x - 60.0) < 1e-5 and abs(y - 20.0) < 1e-5
 
 
+@pytest.mark.parametrize(
+    "shape_type,expected",
+    [
+        (None, "rect"),
+        ("rectangle", "rect"),
+        ("parallelogram", "parallelogram"),
+        ("data", "parallelogram"),
+        ("Rhombus", "rhombus"),
+        ("ellipse", "ellipse"),
+        ("mxgraph.basic.circle", "ellipse"),
+    ],
+)
+def test_boundary_kind(shape_type, expected) -> None:
+    assert _boundary_kind(shape_type) == expected
+
+
 def test_ensure_orthogonal_route_respects_ports() -> None:
     """_ensure_orthogonal_route_respects_ports adds bend when exit/entry directions require it."""
     loader = DrawIOLoader()
@@ -618,9 +716,8 @@ def test_resolve_connector_points_two_shapes() -> None:
 
 
 # ---- StyleExtractor helpers ----
-def test_style_extractor_get_attr_or_style_value() -> None:
+def test_style_extractor_get_attr_or_style_value(ext: StyleExtractor) -> None:
     """_get_attr_or_style_value returns attribute or value from style string."""
-    ext = StyleExtractor()
     cell = _cell({"fillColor": "#ff0000"})
     assert ext._get_attr_or_style_value(cell, "fillColor") == "#ff0000"
     cell2 = _cell({"style": "fillColor=#00ff00"})
@@ -628,14 +725,12 @@ def test_style_extractor_get_attr_or_style_value() -> None:
     assert ext._get_attr_or_style_value(cell2, "strokeColor") is None
 
 
-def test_style_extractor_parse_color_value() -> None:
+def test_style_extractor_parse_color_value(ext: StyleExtractor) -> None:
     """_parse_color_value returns default, None, or parsed RGBColor."""
-    ext = StyleExtractor()
     assert ext._parse_color_value("default") == "default"
     assert ext._parse_color_value("none") is None
     assert ext._parse_color_value(None) is None
-    rgb = ext._parse_color_value("#0000ff")
-    assert rgb is not None and rgb[2] == 255
+    assert ext._parse_color_value("#0000ff") == (0, 0, 255)
 
 
 # ---- DrawIOLoader cell index / polyline / label helpers ----
@@ -652,6 +747,18 @@ def test_build_cell_index_and_draw_order() -> None:
     assert "v1" in cell_order and "e1" in cell_order
 
 
+def test_cell_xpaths_search_wrapped_cells_and_quoted_ids() -> None:
+    """Compiled cell XPaths find <UserObject>-wrapped cells and bind parent ids as variables."""
+    root = ET.fromstring("""<mxGraphModel><root>
+      <mxCell id="0"/><mxCell id="1" parent="0"/>
+      <UserObject id="u1" label="x"><mxCell parent="1" vertex="1"/></UserObject>
+      <mxCell id="e'1" parent="1" edge="1"/>
+      <mxCell id="l1" parent="e'1" vertex="1"/>
+    </root></mxGraphModel>""")
+    assert len(DrawIOLoader._XP_MXCELLS(root)) == 5
+    assert [c.get("id") for c in DrawIOLoader._XP_CHILD_CELLS(root, parent_id="e'1")] == ["l1"]
+
+
 def test_polyline_segment_lengths() -> None:
     """_polyline_segment_lengths returns total length and per-segment lengths."""
     loader = DrawIOLoader()
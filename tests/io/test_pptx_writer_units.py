@@ -3,6 +3,7 @@ Unit tests for pptx_writer: create_presentation, add_slide with Shape/Connector/
 """
 from __future__ import annotations
 
+import pytest
 from pptx.dml.color import RGBColor
 
 from drawio2pptx.io.pptx_writer import PPTXWriter
@@ -39,6 +40,17 @@ def test_create_presentation_zero_page_size() -> None:
     assert prs is not None
 
 
+def test_create_presentation_reuses_template_bytes_independently() -> None:
+    """Presentations built from the cached template do not share state."""
+    writer = PPTXWriter()
+    prs1, layout1 = writer.create_presentation((800.0, 600.0))
+    prs2, _ = writer.create_presentation((400.0, 300.0))
+    writer.add_slide(prs1, layout1, [])
+    assert len(prs1.slides) == 1
+    assert len(prs2.slides) == 0
+    assert prs1.slide_width != prs2.slide_width
+
+
 def test_add_slide_shape_element() -> None:
     writer = PPTXWriter()
     prs, layout = writer.create_presentation((800.0, 600.0))
@@ -76,6 +88,21 @@ def test_add_slide_shape_zero_size_not_added() -> None:
     assert len(names) == 0
 
 
+def test_add_slide_zero_size_filter_keeps_connectors() -> None:
+    """Zero-size text is dropped up front; connectors (w/h unused) are still drawn."""
+    writer = PPTXWriter()
+    prs, layout = writer.create_presentation((800.0, 600.0))
+    elements = [
+        TextElement(id="t0", x=10.0, y=10.0, w=0.0, h=0.0,
+                    text=[TextParagraph(runs=[TextRun(text="Hidden")])], style=Style()),
+        ConnectorElement(id="c1", points=[(10.0, 10.0), (100.0, 10.0)], style=Style()),
+    ]
+    writer.add_slide(prs, layout, elements)
+    names = [s.name for s in prs.slides[0].shapes]
+    assert not any(name.startswith("drawio2pptx:text:") for name in names)
+    assert any("c1" in name for name in names)
+
+
 def test_add_slide_line_shape() -> None:
     """Line shape uses _add_line_shape path."""
     writer = PPTXWriter()
@@ -161,6 +188,22 @@ def test_add_slide_shape_with_fill_rgb() -> None:
     assert len(prs.slides[0].shapes) >= 1
 
 
+def test_add_slide_shape_fill_rgb_reads_back_through_python_pptx() -> None:
+    """Solid fill written as XML is what python-pptx reports for the shape."""
+    from pptx.enum.dml import MSO_FILL
+    writer = PPTXWriter()
+    prs, layout = writer.create_presentation((800.0, 600.0))
+    shapes = [
+        ShapeElement(id=f"s{i}", x=10.0 + 60 * i, y=50.0, w=50.0, h=50.0,
+                     shape_type="rectangle", style=Style(fill=RGBColor(0x1F, 0x80, 0xC0)))
+        for i in range(2)
+    ]
+    writer.add_slide(prs, layout, shapes)
+    for shp in list(prs.slides[0].shapes)[:2]:
+        assert shp.fill.type == MSO_FILL.SOLID
+        assert shp.fill.fore_color.rgb == RGBColor(0x1F, 0x80, 0xC0)
+
+
 def test_add_slide_shape_no_stroke() -> None:
     """Shape with no_stroke disables line."""
     writer = PPTXWriter()
@@ -222,3 +265,84 @@ def test_add_slide_multiple_elements() -> None:
     ]
     writer.add_slide(prs, layout, shapes)
     assert len(prs.slides[0].shapes) >= 2
+
+
+def test_add_slide_assigns_unique_sequential_shape_ids() -> None:
+    """Shapes, connectors and text boxes on one slide get distinct, increasing ids."""
+    writer = PPTXWriter()
+    prs, layout = writer.create_presentation((800.0, 600.0))
+    elements = [
+        ShapeElement(id="a", x=10.0, y=10.0, w=50.0, h=30.0, shape_type="rectangle", style=Style(fill="default")),
+        ConnectorElement(id="c", points=[(60.0, 25.0), (120.0, 25.0)], style=Style()),
+        TextElement(id="t", x=10.0, y=80.0, w=80.0, h=20.0,
+                    text=[TextParagraph(runs=[TextRun(text="Label")])], style=Style()),
+        ShapeElement(id="b", x=120.0, y=10.0, w=50.0, h=30.0, shape_type="ellipse", style=Style(fill="default")),
+    ]
+    writer.add_slide(prs, layout, elements)
+    ids = [shape.shape_id for shape in prs.slides[0].shapes]
+    assert len(ids) >= 4
+    assert ids == sorted(set(ids))
+
+
+def _png_data_uri(color: str) -> str:
+    import base64
+    import io
+
+    from PIL import Image
+
+    out = io.BytesIO()
+    Image.new("RGB", (10, 10), color).save(out, format="PNG")
+    return "data:image/png;base64," + base64.b64encode(out.getvalue()).decode("ascii")
+
+
+def test_collect_image_requests_dedupes_identical_images() -> None:
+    """Shapes sharing the same image and size produce a single prefetch request."""
+    from drawio2pptx.model.intermediate import ImageData
+
+    writer = PPTXWriter()
+    red = _png_data_uri("#FF0000")
+    shapes = [
+        ShapeElement(id="a", x=0.0, y=0.0, w=40.0, h=40.0, shape_type="image", image=ImageData(data_uri=red)),
+        ShapeElement(id="b", x=50.0, y=0.0, w=40.0, h=40.0, shape_type="image", image=ImageData(data_uri=red)),
+        ShapeElement(id="c", x=0.0, y=50.0, w=40.0, h=40.0, shape_type="image", image=ImageData(data_uri=_png_data_uri("#0000FF"))),
+        ShapeElement(id="d", x=0.0, y=0.0, w=0.0, h=40.0, shape_type="image", image=ImageData(data_uri=red)),
+    ]
+    requests = writer._collect_image_requests(shapes)
+    assert len(requests) == 2
+
+
+def test_add_slide_prefetches_images() -> None:
+    """Images are prepared up front and each image shape gets a picture."""
+    from drawio2pptx.model.intermediate import ImageData
+
+    writer = PPTXWriter()
+    prs, layout = writer.create_presentation((800.0, 600.0))
+    shapes = [
+        ShapeElement(id="a", x=0.0, y=0.0, w=40.0, h=40.0, shape_type="image", image=ImageData(data_uri=_png_data_uri("#FF0000"))),
+        ShapeElement(id="b", x=50.0, y=0.0, w=40.0, h=40.0, shape_type="image", image=ImageData(data_uri=_png_data_uri("#0000FF"))),
+    ]
+    prepared = writer._prepare_slide_images(shapes)
+    assert len(prepared) == 2
+    assert all(result[0] for result in prepared.values())
+
+    writer.add_slide(prs, layout, shapes)
+    names = [s.name for s in prs.slides[0].shapes]
+    assert "drawio2pptx:shape-image:a" in names
+    assert "drawio2pptx:shape-image:b" in names
+    assert writer._prepared_images == {}
+
+
+def test_add_slide_step_sets_chevron_adjustment() -> None:
+    """Step shape adjustment follows step_size / width (clamped), parallelogram gets the fixed skew."""
+    from drawio2pptx.config import PARALLELOGRAM_SKEW
+    writer = PPTXWriter()
+    prs, layout = writer.create_presentation((800.0, 600.0))
+    step_style = Style(fill="default", step_size_px=20.0)
+    shapes = [
+        ShapeElement(id="st", x=10.0, y=10.0, w=100.0, h=40.0, shape_type="step", style=step_style),
+        ShapeElement(id="pg", x=10.0, y=80.0, w=100.0, h=40.0, shape_type="parallelogram", style=Style(fill="default")),
+    ]
+    writer.add_slide(prs, layout, shapes)
+    step, para = list(prs.slides[0].shapes)[:2]
+    assert step.adjustments[0] == pytest.approx(0.3, abs=1e-4)
+    assert para.adjustments[0] == pytest.approx(float(PARALLELOGRAM_SKEW), abs=1e-4)
@@ -0,0 +1,389 @@
+"""Test module for AWS stencil icon resolution"""
+
+import base64
+
+import pytest
+
+from drawio2pptx.stencil import aws_icons
+from drawio2pptx.stencil.aws_icons import (
+    get_aws_icon_data_uri,
+    get_aws_icon_image_data,
+    is_aws_shape_type,
+    resolve_aws_group_metadata,
+)
+
+_AWS4_XML = b"""<shapes name="mxgraph.aws4">
+<shape aspect="variable" h="64" name="General" strokewidth="inherit" w="64">
+<connections/>
+<foreground><path><move x="0" y="0"/><line x="64" y="0"/><curve x1="64" y1="10" x2="60" y2="20" x3="50" y3="30"/>
+<arc rx="5" ry="5" x-axis-rotation="0" large-arc-flag="0" sweep-flag="1" x="40" y="40"/><close/></path><fill/></foreground>
+</shape>
+<shape aspect="variable" h="120" name="Illustration Users" strokewidth="inherit" w="80">
+<foreground><path><move x="10" y="10"/><line x="70" y="110"/><close/></path><fill/></foreground>
+</shape>
+</shapes>"""
+
+
+@pytest.fixture
+def aws4_xml(monkeypatch):
+    """Serve a small aws4.xml stencil instead of fetching it from GitHub."""
+    calls = []
+
+    def _load(data_uri=None, file_path=None):
+        calls.append(file_path)
+        return _AWS4_XML
+
+    monkeypatch.setattr("drawio2pptx.media.image_utils.load_image_bytes", _load)
+    aws_icons._reset_aws4_cache()
+    yield calls
+    aws_icons._reset_aws4_cache()
+
+
+def _decode_svg(data_uri: str) -> str:
+    header, payload = data_uri.split(",", 1)
+    assert header == "data:image/svg+xml;base64"
+    return base64.b64decode(payload).decode("utf-8")
+
+
+def test_is_aws_shape_type():
+    """Test is_aws_shape_type accepts aws, aws2, aws3, aws4 namespaces"""
+    assert is_aws_shape_type("mxgraph.aws4.lambda_function")
+    assert is_aws_shape_type("MXGRAPH.AWS3.ec2")
+    assert is_aws_shape_type("mxgraph.aws.s3")
+    assert is_aws_shape_type("mxgraph.aws2")
+    assert is_aws_shape_type("MXGRAPH.AWS4")
+    assert not is_aws_shape_type("mxgraph.aws4x")
+    assert is_aws_shape_type("mxgraph.aws")
+    assert not is_aws_shape_type("mxgraph.aws4" + "x" * 100)
+    assert not is_aws_shape_type("mxgraph.awsx.lambda")
+    assert not is_aws_shape_type("mxgraph.azure.vm")
+    assert not is_aws_shape_type("rectangle")
+    assert not is_aws_shape_type("")
+    assert not is_aws_shape_type(None)
+
+
+def test_get_aws_icon_image_data_direct_shape():
+    """Test direct shape keys resolve to icon URLs"""
+    img = get_aws_icon_image_data("mxgraph.aws4.lambda_function")
+    assert img is not None
+    assert img.file_path.endswith("/resource/AWSLambdaLambdaFunction.svg")
+    assert img.data_uri is None
+
+
+def test_get_aws_icon_image_data_case_insensitive():
+    """Test shape type lookup is case insensitive"""
+    img = get_aws_icon_image_data("mxgraph.aws4.Lambda_Function")
+    assert img is not None
+    assert img.file_path.endswith("/AWSLambdaLambdaFunction.svg")
+
+
+def test_get_aws_icon_image_data_resource_icon():
+    """Test resourceIcon shapes resolve through resIcon"""
+    img = get_aws_icon_image_data(
+        "mxgraph.aws4.resourceIcon",
+        "shape=mxgraph.aws4.resourceIcon;resIcon=mxgraph.aws4.marketplace;",
+    )
+    assert img is not None
+    assert img.file_path.endswith("/AWSMarketplace.svg")
+
+
+def test_get_aws_icon_image_data_res_icon_fallback():
+    """Test resIcon without a resourceIcon entry falls back to the direct shape"""
+    img = get_aws_icon_image_data(
+        "mxgraph.aws4.resourceIcon",
+        "resIcon=mxgraph.aws4.lambda_function",
+    )
+    assert img is not None
+    assert img.file_path.endswith("/AWSLambdaLambdaFunction.svg")
+
+
+def test_get_aws_icon_image_data_amazon_alias_fallback():
+    """Test amazon_<suffix> legacy aliases are tried as a fallback"""
+    img = get_aws_icon_image_data(
+        "mxgraph.aws4.resourceIcon",
+        "resIcon=mxgraph.aws4.guardduty2",
+    )
+    assert img is None
+
+    img = get_aws_icon_image_data("mxgraph.aws4.resourceIcon", "resIcon=mxgraph.aws4.sns")
+    assert img is not None
+    assert img.file_path.endswith("/AmazonSimpleNotificationService.svg")
+
+
+def test_get_aws_icon_image_data_unknown():
+    """Test unknown or non-AWS shapes resolve to None"""
+    assert get_aws_icon_image_data("mxgraph.aws4.no_such_icon") is None
+    assert get_aws_icon_image_data("rectangle") is None
+    assert get_aws_icon_image_data("mxgraph.aws4.group", "grIcon=mxgraph.aws4.group_region") is None
+
+
+def test_get_aws_icon_image_data_aws4xml(aws4_xml):
+    """Test aws4.xml stencil specs are rendered into an SVG data URI"""
+    img = get_aws_icon_image_data("mxgraph.aws4.general")
+    assert img is not None
+    assert img.file_path is None
+    svg = _decode_svg(img.data_uri)
+    assert 'fill="#FFFFFF"' in svg
+    assert 'fill="#232F3D"' in svg
+    assert 'd="M 0 0 L 64 0 C 64 10 60 20 50 30 A 5 5 0 0 1 40 40 Z"' in svg
+
+
+def test_get_aws_icon_image_data_aws4xml_resource_icon_colors(aws4_xml):
+    """Test resourceIcon aws4.xml specs follow fillColor/gradientColor"""
+    img = get_aws_icon_image_data(
+        "mxgraph.aws4.resourceIcon",
+        "resIcon=mxgraph.aws4.general;fillColor=#ED7100;gradientColor=#F78E04;gradientDirection=north;",
+    )
+    assert img is not None
+    svg = _decode_svg(img.data_uri)
+    assert '<linearGradient id="bgGrad" x1="0.000" y1="1.000" x2="0.000" y2="0.000">' in svg
+    assert 'stop-color="#ED7100"' in svg
+    assert 'stop-color="#F78E04"' in svg
+    assert 'fill="url(#bgGrad)"' in svg
+
+
+def test_get_aws_icon_image_data_illustration_fallback(aws4_xml):
+    """Test illustration shapes missing from the table are rendered from aws4.xml"""
+    img = get_aws_icon_image_data("mxgraph.aws4.illustration_users", "fillColor=#123456")
+    assert img is not None
+    svg = _decode_svg(img.data_uri)
+    assert 'fill="#123456"' in svg
+    # Stencil is taller than the 100x100 canvas, so the canvas grows to avoid clipping.
+    assert 'viewBox="0 0 100.000 120.000"' in svg
+
+
+def test_fetch_shape_spec_from_aws4_loads_stencil_once(aws4_xml):
+    """Test aws4.xml is loaded once and parsed specs are reused"""
+    spec = aws_icons._fetch_shape_spec_from_aws4("General")
+    assert spec == ("M 0 0 L 64 0 C 64 10 60 20 50 30 A 5 5 0 0 1 40 40 Z", 64.0, 64.0)
+    assert aws_icons._fetch_shape_spec_from_aws4("General") is spec
+    assert aws_icons._fetch_shape_spec_from_aws4("Illustration Users")[1:] == (80.0, 120.0)
+    assert aws_icons._fetch_shape_spec_from_aws4("Missing") is None
+    assert len(aws4_xml) == 1
+
+
+def test_get_aws_icon_image_data_shared_per_style(aws4_xml):
+    """Test identical (shape, style) lookups reuse one ImageData while it is referenced"""
+    style = "resIcon=mxgraph.aws4.general;fillColor=#ED7100;"
+    img = get_aws_icon_image_data("mxgraph.aws4.resourceIcon", style)
+    assert get_aws_icon_image_data("mxgraph.aws4.resourceIcon", style) is img
+    other = get_aws_icon_image_data("mxgraph.aws4.resourceIcon", "resIcon=mxgraph.aws4.general;fillColor=#000000;")
+    assert other is not img
+    assert 'fill="#000000"' in _decode_svg(other.data_uri)
+
+
+def test_identical_svg_shares_image_data(aws4_xml):
+    """Test style strings rendering the same SVG resolve to one ImageData"""
+    a = get_aws_icon_image_data("mxgraph.aws4.resourceIcon", "resIcon=mxgraph.aws4.general;fillColor=#ED7100;")
+    b = get_aws_icon_image_data("mxgraph.aws4.resourceIcon", "fillColor=#ED7100;resIcon=mxgraph.aws4.general;")
+    assert a is b
+
+
+def test_get_aws_icon_image_data_releases_unused_entries(aws4_xml):
+    """Test ImageData resolved through the public API is dropped once unreferenced"""
+    import gc
+
+    img = get_aws_icon_image_data("mxgraph.aws4.resourceIcon", "resIcon=mxgraph.aws4.general;fillColor=#123456;")
+    cache_key = (img.data_uri, img.cover_scale)
+    assert aws_icons._IMAGE_DATA_CACHE.get(cache_key) is img
+    del img
+    gc.collect()
+    assert cache_key not in aws_icons._IMAGE_DATA_CACHE
+
+
+def test_aws4_xml_unreachable_is_not_retried(monkeypatch):
+    """Test a failed aws4.xml load is cached instead of retried per shape"""
+    calls = []
+
+    def _load(data_uri=None, file_path=None):
+        calls.append(file_path)
+        return None
+
+    monkeypatch.setattr("drawio2pptx.media.image_utils.load_image_bytes", _load)
+    aws_icons._reset_aws4_cache()
+    try:
+        assert get_aws_icon_image_data("mxgraph.aws4.illustration_users") is None
+        assert get_aws_icon_image_data("mxgraph.aws4.illustration_devices") is None
+        assert aws_icons._fetch_shape_spec_from_aws4("General") is None
+        assert len(calls) == 1
+    finally:
+        aws_icons._reset_aws4_cache()
+
+
+def test_group_icon_spec_normalizes_fields():
+    """Test group icon entries are normalized at construction"""
+    entry = aws_icons._group_icon_spec("x.svg", padding_color_mode="ICON", match_fill="#F2F6E8")
+    assert entry.padding_color_mode == "icon"
+    assert entry.match_fill == "#f2f6e8"
+    assert aws_icons._group_icon_spec("x.svg").padding_color_mode == "stroke"
+    with pytest.raises(ValueError):
+        aws_icons._group_icon_spec("x.svg", padding_color_mode="fill")
+
+
+def test_classify_aws_shape():
+    """Test shape types are classified once into group/resourceIcon/direct kinds"""
+    classify = aws_icons._classify_aws_shape
+    assert classify("mxgraph.aws4.groupCenter") == ("mxgraph.aws4.groupcenter", "group", None)
+    assert classify("mxgraph.aws4.resourceIcon") == ("mxgraph.aws4.resourceicon", "resourceicon", None)
+    assert classify("mxgraph.aws4.illustration_users") == (
+        "mxgraph.aws4.illustration_users",
+        "direct",
+        "illustration users",
+    )
+    assert classify("mxgraph.aws4.Illustration_users")[2] is None
+
+
+def test_aws4_shape_index(aws4_xml):
+    """Test aws4.xml shapes are indexed by lowercased name with their size"""
+    index = aws_icons._aws4_shape_index()
+    assert set(index) == {b"general", b"illustration users"}
+    assert index[b"illustration users"][1:] == (80.0, 120.0)
+    assert aws_icons._fetch_shape_spec_from_aws4("GENERAL")[1:] == (64.0, 64.0)
+
+
+def test_aws4_path_commands_malformed_fallback():
+    """Test malformed path markup still yields commands via the regex fallback"""
+    body = '<move x="0" y="0"/><line x="5" y="5"/><close/>'
+    tokens = ["M", "0", "0", "L", "5", "5", "Z"]
+    assert aws_icons._aws4_path_tokens(body) == tokens
+    assert aws_icons._aws4_path_tokens(body + "<line x='1'") == tokens
+
+
+def test_get_aws_icon_data_uri(aws4_xml):
+    """Test legacy data URI accessor"""
+    assert get_aws_icon_data_uri("mxgraph.aws4.general").startswith("data:image/svg+xml;base64,")
+    assert get_aws_icon_data_uri("mxgraph.aws4.lambda_function") is None
+
+
+def test_resolve_aws_group_metadata_group_icon():
+    """Test aws4 group shapes resolve their overlay icon settings"""
+    meta = resolve_aws_group_metadata(
+        "mxgraph.aws4.group",
+        "shape=mxgraph.aws4.group;grIcon=mxgraph.aws4.group_auto_scaling_group;",
+    )
+    assert meta["apply_text_padding"] is True
+    assert meta["group_icon_key"] == "mxgraph.aws4.group_auto_scaling_group"
+    assert meta["group_icon_image_data"].file_path.endswith("/AutoScalinggroup.svg")
+    assert meta["group_icon_padding_ratio"] == pytest.approx(0.18)
+    assert meta["group_icon_padding_color_mode"] == "icon"
+
+
+def test_resolve_aws_group_metadata_short_form_key():
+    """Test short-form grIcon keys are expanded to full draw.io keys"""
+    meta = resolve_aws_group_metadata("mxgraph.aws4.groupCenter", "grIcon=group_region")
+    assert meta["group_icon_key"] == "group_region"
+    assert meta["group_icon_image_data"].file_path.endswith("/Region.svg")
+    assert meta["group_icon_padding_color_mode"] == "stroke"
+
+
+def test_resolve_aws_group_metadata_subnet_variants():
+    """Test group_security_group picks public/private subnet by label or fill"""
+    style = "grIcon=mxgraph.aws4.group_security_group;"
+    public_by_label = resolve_aws_group_metadata("mxgraph.aws4.group", style, "Public subnet")
+    public_by_fill = resolve_aws_group_metadata("mxgraph.aws4.group", style + "fillColor=#F2F6E8;")
+    private = resolve_aws_group_metadata("mxgraph.aws4.group", style, "Private subnet")
+    assert public_by_label["group_icon_image_data"].file_path.endswith("/Publicsubnet.svg")
+    assert public_by_fill["group_icon_image_data"].file_path.endswith("/Publicsubnet.svg")
+    assert private["group_icon_image_data"].file_path.endswith("/Privatesubnet.svg")
+
+
+def test_resolve_aws_group_metadata_non_group():
+    """Test non-group shapes only report text padding"""
+    meta = resolve_aws_group_metadata("rectangle", "verticalAlign=top;")
+    assert meta == {
+        "apply_text_padding": True,
+        "group_icon_key": None,
+        "group_icon_image_data": None,
+        "group_icon_padding_ratio": None,
+        "group_icon_padding_color_mode": None,
+    }
+    assert resolve_aws_group_metadata(None)["apply_text_padding"] is False
+
+
+def test_get_style_value():
+    """Test single style value extraction"""
+    style = "shape=mxgraph.aws4.resourceIcon; resIcon = mxgraph.aws4.lambda ;fillColor=;"
+    assert aws_icons._get_style_value(style, "resIcon") == "mxgraph.aws4.lambda"
+    assert aws_icons._get_style_value(style, "fillColor") is None
+    assert aws_icons._get_style_value(style, "missing") is None
+    assert aws_icons._get_style_value(None, "resIcon") is None
+
+
+def test_normalize_drawio_aws_value():
+    """Test draw.io value normalization strips, lowercases and interns"""
+    norm = aws_icons._normalize_drawio_aws_value
+    assert norm(None) is None
+    assert norm("") is None
+    assert norm("   ") is None
+    first = norm(" MXGRAPH.AWS4.Lambda ")
+    assert first == "mxgraph.aws4.lambda"
+    assert norm("mxgraph.aws4.LAMBDA") is first
+
+
+def test_image_data_from_ref_is_shared():
+    """Test ImageData is built once per ref and reused"""
+    first = get_aws_icon_image_data("mxgraph.aws4.lambda_function")
+    second = get_aws_icon_image_data("mxgraph.aws4.Lambda_Function")
+    assert first is second
+    data_uri_img = aws_icons._image_data_from_ref("data:image/svg+xml;base64,PHN2Zy8+")
+    assert data_uri_img.data_uri == "data:image/svg+xml;base64,PHN2Zy8+"
+    assert data_uri_img.file_path is None
+
+
+def test_parse_style():
+    """Test style parsing keeps the first occurrence of each key"""
+    style = aws_icons._parse_style("rounded=1; fillColor = #FFF ;fillColor=#000;grIcon=;html")
+    assert style == {"rounded": "1", "fillColor": "#FFF", "grIcon": ""}
+
+
+def test_drawio_lookup_keys_order():
+    """Test lookup keys are ordered primary -> resIcon -> amazon_* aliases"""
+    keys = aws_icons._drawio_lookup_keys("mxgraph.aws4.resourceIcon", "mxgraph.aws4.sns")
+    assert keys == (
+        "mxgraph.aws4.resourceicon|mxgraph.aws4.sns",
+        "mxgraph.aws4.sns",
+        "mxgraph.aws4.amazon_sns",
+    )
+    assert aws_icons._drawio_lookup_keys("mxgraph.aws4.DynamoDB", None) == (
+        "mxgraph.aws4.dynamodb",
+        "mxgraph.aws4.amazon_dynamodb",
+    )
+    assert aws_icons._drawio_lookup_keys("mxgraph.aws4.sns", "mxgraph.aws4.sns") == (
+        "mxgraph.aws4.sns",
+        "mxgraph.aws4.amazon_sns",
+    )
+    assert aws_icons._drawio_lookup_keys("mxgraph.aws4.lambda", None) == ("mxgraph.aws4.lambda",)
+    assert aws_icons._drawio_lookup_keys("rectangle", None) == ()
+
+
+def test_image_data_cache_releases_unused_entries():
+    """Test cached ImageData is dropped once no shape references it"""
+    import gc
+
+    ref = "https://example.invalid/icon.svg"
+    img = aws_icons._image_data_from_ref(ref)
+    assert aws_icons._image_data_from_ref(ref) is img
+    del img
+    gc.collect()
+    assert (ref, None) not in aws_icons._IMAGE_DATA_CACHE
+
+
+def test_compile_variant_list_priority():
+    """Test variant matching honours list order and the unconditional default"""
+    public = aws_icons._group_icon_spec("public.svg", match_label="public")
+    blue = aws_icons._group_icon_spec("blue.svg", match_fill="#0000ff")
+    default = aws_icons._group_icon_spec("default.svg")
+    unreachable = aws_icons._group_icon_spec("never.svg", match_label="private")
+    match = aws_icons._compile_variant_list([public, blue, default, unreachable])
+    assert match("public subnet", "#0000ff") is public
+    assert match("subnet", "#0000ff") is blue
+    assert match("private subnet", "") is default
+
+    fallback_only = aws_icons._compile_variant_list([public, blue])
+    assert fallback_only("other", "") is blue
+
+
+def test_url_spec_shared_between_aliases():
+    """Test aliased table entries share one spec object"""
+    specs = aws_icons._icon_spec_tables().specs
+    assert specs["mxgraph.aws4.sns"] is specs["mxgraph.aws4.amazon_sns"]
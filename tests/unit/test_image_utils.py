@@ -46,3 +46,119 @@ def test_svg_to_png():
     assert result is None
 
 
+def test_load_image_bytes_uses_download_cache(tmp_path, monkeypatch):
+    """Test URL downloads are cached on disk and served offline afterwards"""
+    import urllib.request
+    from drawio2pptx.config import default_config
+    from drawio2pptx.media.image_utils import load_image_bytes
+
+    class _Response:
+        def __init__(self, data):
+            self._data = data
+
+        def read(self):
+            return self._data
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    calls = []
+
+    def _urlopen(req, timeout=None):
+        calls.append(req.full_url)
+        return _Response(b"<svg/>")
+
+    monkeypatch.setattr(urllib.request, "urlopen", _urlopen)
+    monkeypatch.setattr(default_config, "image_cache_enabled", True)
+    monkeypatch.setattr(default_config, "image_cache_dir", str(tmp_path))
+    monkeypatch.setattr(default_config, "offline", False)
+
+    url = "https://example.invalid/icon.svg"
+    assert load_image_bytes(file_path=url) == b"<svg/>"
+    assert load_image_bytes(file_path=url) == b"<svg/>"
+    assert len(calls) == 1
+
+    monkeypatch.setattr(default_config, "offline", True)
+    assert load_image_bytes(file_path=url) == b"<svg/>"
+    assert load_image_bytes(file_path="https://example.invalid/other.svg") is None
+    assert len(calls) == 1
+
+
+def test_load_image_bytes_refreshes_stale_download(tmp_path, monkeypatch):
+    """Test cached downloads older than the max age are fetched again, stale copy kept on failure"""
+    import io
+    import os
+    import urllib.request
+    from drawio2pptx.config import default_config
+    from drawio2pptx.media.image_utils import _download_cache_path, load_image_bytes
+
+    monkeypatch.setattr(default_config, "image_cache_enabled", True)
+    monkeypatch.setattr(default_config, "image_cache_dir", str(tmp_path))
+    monkeypatch.setattr(default_config, "offline", False)
+    monkeypatch.setattr(default_config, "image_download_max_age_hours", 1.0)
+
+    url = "https://example.invalid/latest/icon.svg"
+    payloads = [b"<svg>v1</svg>", b"<svg>v2</svg>"]
+    monkeypatch.setattr(urllib.request, "urlopen", lambda req, timeout=None: io.BytesIO(payloads.pop(0)))
+    assert load_image_bytes(file_path=url) == b"<svg>v1</svg>"
+    assert load_image_bytes(file_path=url) == b"<svg>v1</svg>"
+
+    path = _download_cache_path(url)
+    two_hours_ago = path.stat().st_mtime - 2 * 3600
+    os.utime(path, (two_hours_ago, two_hours_ago))
+    assert load_image_bytes(file_path=url) == b"<svg>v2</svg>"
+
+    os.utime(path, (two_hours_ago, two_hours_ago))
+
+    def _unreachable(req, timeout=None):
+        raise OSError("network down")
+
+    monkeypatch.setattr(urllib.request, "urlopen", _unreachable)
+    assert load_image_bytes(file_path=url) == b"<svg>v2</svg>"
+
+
+def test_load_image_bytes_offline_miss_warns(tmp_path, monkeypatch):
+    """Test an offline cache miss is reported once per conversion on the conversion logger"""
+    import urllib.request
+    from drawio2pptx.config import default_config
+    from drawio2pptx.logger import ConversionLogger, get_logger
+    from drawio2pptx.media.image_utils import load_image_bytes, reset_image_cache_stats
+
+    def _no_network(req, timeout=None):
+        raise AssertionError("network used in offline mode")
+
+    monkeypatch.setattr(urllib.request, "urlopen", _no_network)
+    monkeypatch.setattr(default_config, "image_cache_enabled", True)
+    monkeypatch.setattr(default_config, "image_cache_dir", str(tmp_path))
+    monkeypatch.setattr(default_config, "offline", True)
+    reset_image_cache_stats()
+
+    url = "https://example.invalid/offline-miss.svg"
+    global_before = len(get_logger().get_warnings())
+    logger = ConversionLogger()
+    assert load_image_bytes(file_path=url, logger=logger) is None
+    assert load_image_bytes(file_path=url, logger=logger) is None
+    warnings = logger.get_warnings()
+    assert [w.warning_type for w in warnings] == ["offline_cache_miss"]
+    assert warnings[0].details["url"] == url
+    assert len(get_logger().get_warnings()) == global_before
+
+    # The next conversion reports the miss again on its own logger
+    reset_image_cache_stats()
+    next_logger = ConversionLogger()
+    assert load_image_bytes(file_path=url, logger=next_logger) is None
+    assert [w.warning_type for w in next_logger.get_warnings()] == ["offline_cache_miss"]
+
+def test_image_cache_stats_thread_safe():
+    """Test cache stats stay exact when images are prepared on worker threads"""
+    from concurrent.futures import ThreadPoolExecutor
+    from drawio2pptx.media import image_utils
+
+    image_utils.reset_image_cache_stats()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: image_utils._count_cache_event("hits"), range(2000)))
+    assert image_utils.get_image_cache_stats()["hits"] == 2000
+    image_utils.reset_image_cache_stats()
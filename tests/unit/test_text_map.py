@@ -3,6 +3,7 @@
 import pytest
 from pptx.dml.color import RGBColor
 from drawio2pptx.mapping.text_map import (
+    clear_cache,
     html_to_paragraphs,
     plain_text_to_paragraphs,
     _parse_font_size,
@@ -11,6 +12,14 @@ from drawio2pptx.mapping.text_map import (
 from drawio2pptx.model.intermediate import TextParagraph, TextRun
 
 
+@pytest.fixture(autouse=True)
+def _fresh_html_cache():
+    """Keep memoized html_to_paragraphs results from leaking between tests."""
+    clear_cache()
+    yield
+    clear_cache()
+
+
 def test_html_to_paragraphs_empty():
     """Test html_to_paragraphs with empty string"""
     result = html_to_paragraphs("")
@@ -211,7 +220,7 @@ def test_html_to_paragraphs_exception_fallback_to_plain_text() -> None:
     """On parse exception, fallback to plain text."""
     from unittest.mock import patch
     html = "Fallback content"
-    with patch("drawio2pptx.mapping.text_map.lxml_html.fromstring", side_effect=ValueError("parse error")):
+    with patch("drawio2pptx.mapping.text_map.lxml_html.fragment_fromstring", side_effect=ValueError("parse error")):
         result = html_to_paragraphs(html, default_font_size=12.0)
     assert len(result) == 1
     assert len(result[0].runs) == 1
@@ -413,7 +422,7 @@ def test_html_to_paragraphs_inline_element_with_tail() -> None:
 def test_html_to_paragraphs_exception_empty_html_returns_empty_list() -> None:
     """Exception path with empty html_text returns [] (214)."""
     from unittest.mock import patch
-    with patch("drawio2pptx.mapping.text_map.lxml_html.fromstring", side_effect=ValueError()):
+    with patch("drawio2pptx.mapping.text_map.lxml_html.fragment_fromstring", side_effect=ValueError()):
         result = html_to_paragraphs("")
     assert result == []
 
@@ -435,3 +444,65 @@ def test_html_to_paragraphs_font_tag_size_map_1_and_7() -> None:
     html7 = '<font size="7">S7</font>'
     result7 = html_to_paragraphs(html7)
     assert result7[0].runs[0].font_size == 36
+
+
+def test_html_to_paragraphs_cached_results_are_independent_copies() -> None:
+    """Repeated calls reuse the parse but return fresh, mutable paragraphs."""
+    from unittest.mock import patch
+    from drawio2pptx.mapping import text_map
+    html = "<b>Cached</b>"
+    color = RGBColor(0x12, 0x34, 0x56)
+    first = html_to_paragraphs(html, default_font_color=color, default_font_size=11.0)
+    first[0].runs[0].font_family = "Mutated"
+    with patch.object(text_map.lxml_html, "fragment_fromstring", side_effect=AssertionError("re-parsed")):
+        second = html_to_paragraphs(html, default_font_color=color, default_font_size=11.0)
+    assert second[0].runs[0].text == "Cached"
+    assert second[0].runs[0].font_family != "Mutated"
+    assert second[0].runs[0].font_color == color
+    assert second[0] is not first[0]
+
+
+def test_html_to_paragraphs_font_family_is_interned() -> None:
+    """Font families from separate runs share one interned string."""
+    import sys
+    family = "".join(["Cour", "ier New"])
+    result = html_to_paragraphs(f'<span style="font-family: {family}">A</span><font face="{family}">B</font>')
+    runs = result[0].runs
+    assert runs[0].font_family is runs[1].font_family
+    assert runs[0].font_family is sys.intern("Courier New")
+
+
+def test_html_to_paragraphs_plain_text_skips_lxml() -> None:
+    """Tag-free labels are built without parsing and match the parsed result."""
+    from unittest.mock import patch
+    from drawio2pptx.mapping import text_map
+    color = RGBColor(0, 0, 255)
+    expected = text_map._parse_html_paragraphs("Label 1", color, "Arial", 14.0)
+    with patch.object(text_map.lxml_html, "fragment_fromstring", side_effect=AssertionError("parsed")):
+        result = html_to_paragraphs("Label 1", default_font_color=color,
+                                    default_font_family="Arial", default_font_size=14.0)
+    assert result == expected
+
+
+def test_html_to_paragraphs_control_characters_use_lxml_fallback() -> None:
+    """Text lxml rejects (control characters) still falls back to one raw run."""
+    result = html_to_paragraphs("Bad\x01text", default_font_family="Arial")
+    assert len(result) == 1
+    assert result[0].runs[0].text == "Bad\x01text"
+    assert result[0].runs[0].font_family == "Arial"
+
+
+def test_html_to_paragraphs_font_tag_size_out_of_range_defaults_to_12() -> None:
+    """<font size> outside 1-7 (including 0 and negatives) falls back to 12."""
+    for size in ("0", "8", "-1"):
+        result = html_to_paragraphs(f'<font size="{size}">S</font>')
+        assert result[0].runs[0].font_size == 12
+
+
+def test_parse_css_declarations_first_match_wins() -> None:
+    """One scan maps tracked properties; first declaration wins, *-color counts as color."""
+    from drawio2pptx.mapping.text_map import _parse_css_declarations
+    css = _parse_css_declarations("background-color: #fff; color: red; font-size:12px; font-size: 9pt")
+    assert css["color"] == "#fff"
+    assert css["font-size"] == "12px"
+    assert "font-family" not in css